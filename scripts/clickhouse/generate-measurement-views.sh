@@ -0,0 +1,184 @@
+#!/bin/bash
+
+# Generates the migrations of the measurement catalog (0002) and of the rollups (0003) from all measurement tables of the
+# initial setup (tables created AS template_*). Every measurement table requires a materialized view, otherwise its
+# measurements are neither listed in the catalog nor available in the rollups.
+#
+# Usage: generate-measurement-views.sh catalog|rollups [--check]
+#   --check  compare with the existing migration instead of printing it, fails if the migration is out of sync
+
+set -euo pipefail
+
+MIGRATIONS_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)/migrations"
+INITIAL_SETUP="$MIGRATIONS_DIR/0001_initial_setup.sql"
+CATALOG_MIGRATION="$MIGRATIONS_DIR/0002_measurement_catalog.sql"
+ROLLUPS_MIGRATION="$MIGRATIONS_DIR/0003_measurement_rollups.sql"
+
+# measurement tables with their template in order of creation (some tables are declared multiple times)
+mapfile -t TABLES < <(grep -oE "CREATE TABLE IF NOT EXISTS [a-z0-9_]+ AS template_[a-z_]+" "$INITIAL_SETUP" |
+    awk '!seen[$6]++ { print $6 " " $8 }')
+
+if [[ ${#TABLES[@]} -eq 0 ]]; then
+    echo "No measurement tables found in $INITIAL_SETUP" >&2
+    exit 1
+fi
+
+# series columns of a measurement table (in addition to node and level)
+series_columns() {
+    case "$1" in
+    template_topology_*) echo "thread, core, numa, socket, " ;;
+    template_device_*) echo "device, " ;;
+    *) echo "" ;;
+    esac
+}
+
+catalog_select() {
+    local table=$1
+    echo "SELECT job_id, '$table' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count"
+    echo "FROM $table GROUP BY job_id, node, level;"
+}
+
+rollup_select() {
+    local table=$1 template=$2 bucket=$3
+    local columns
+    columns=$(series_columns "$template")
+    echo "SELECT job_id, '$table' AS table_name, node, level, ${columns}$bucket(ts) AS bucket, sum(value) AS value_sum, count() AS value_count, countIf(value != 0) AS nonzero_count, min(value) AS value_min, max(value) AS value_max"
+    echo "FROM $table GROUP BY job_id, node, level, ${columns}bucket;"
+}
+
+generate_catalog() {
+    cat <<'EOF'
+-- +goose up
+
+--  Catalog of available measurements per job, table, node and level.
+--  Replaces scanning all metric tables with SELECT DISTINCT to determine available metrics and aggregation levels.
+--  Filled on insert by one materialized view per metric table. Rows of the same key are merged in the background,
+--  queries must therefore aggregate with min(min_ts), max(max_ts) and sum(row_count).
+
+CREATE TABLE IF NOT EXISTS measurement_catalog (
+    job_id UInt32,
+    table_name LowCardinality(String),
+    node LowCardinality(String),
+    level LowCardinality(String),
+    min_ts SimpleAggregateFunction(min, DateTime64(3, 'UTC')),
+    max_ts SimpleAggregateFunction(max, DateTime64(3, 'UTC')),
+    row_count SimpleAggregateFunction(sum, UInt64)
+) ENGINE = AggregatingMergeTree()
+ORDER BY (job_id, table_name, node, level);
+
+EOF
+    local table template
+    for entry in "${TABLES[@]}"; do
+        read -r table template <<<"$entry"
+        echo "CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_$table TO measurement_catalog AS"
+        catalog_select "$table"
+        echo
+    done
+
+    echo "--  Backfill catalog with existing measurements."
+    echo
+    for entry in "${TABLES[@]}"; do
+        read -r table template <<<"$entry"
+        echo "INSERT INTO measurement_catalog"
+        catalog_select "$table"
+        echo
+    done
+
+    echo "-- +goose down"
+    echo
+    for entry in "${TABLES[@]}"; do
+        read -r table template <<<"$entry"
+        echo "DROP VIEW IF EXISTS xbat.mv_catalog_$table;"
+    done
+    echo "DROP TABLE IF EXISTS xbat.measurement_catalog;"
+}
+
+generate_rollups() {
+    cat <<'EOF'
+-- +goose up
+
+--  Rollups of all measurements at 1-minute and 10-minute resolution.
+--  Used instead of the raw measurement tables when traces are downsampled to at least the resolution of a rollup.
+--  One row per job, table, series (node, level, topology, device) and bucket stores sum, count, count of non-zero values,
+--  minimum and maximum of the values. Filled on insert by one materialized view per metric table and rollup, rows of the same
+--  key are merged in the background, queries must therefore aggregate with sum, min and max.
+
+EOF
+    local resolution bucket table template
+    for resolution in 1m 10m; do
+        cat <<EOF
+CREATE TABLE IF NOT EXISTS measurement_rollup_$resolution (
+    job_id UInt32,
+    table_name LowCardinality(String),
+    node LowCardinality(String),
+    level LowCardinality(String),
+    thread UInt16,
+    core UInt16,
+    numa UInt8,
+    socket UInt8,
+    device LowCardinality(String),
+    bucket DateTime('UTC') CODEC(ZSTD(3)),
+    value_sum SimpleAggregateFunction(sum, Float64) CODEC(ZSTD(3)),
+    value_count SimpleAggregateFunction(sum, UInt64) CODEC(ZSTD(3)),
+    nonzero_count SimpleAggregateFunction(sum, UInt64) CODEC(ZSTD(3)),
+    value_min SimpleAggregateFunction(min, Float64) CODEC(ZSTD(3)),
+    value_max SimpleAggregateFunction(max, Float64) CODEC(ZSTD(3))
+) ENGINE = AggregatingMergeTree()
+ORDER BY (job_id, table_name, node, level, bucket, thread, core, numa, socket, device)
+PARTITION BY toYYYYMM(bucket);
+
+EOF
+    done
+
+    for resolution in 1m 10m; do
+        bucket=$([[ $resolution == 1m ]] && echo toStartOfMinute || echo toStartOfTenMinutes)
+        for entry in "${TABLES[@]}"; do
+            read -r table template <<<"$entry"
+            echo "CREATE MATERIALIZED VIEW IF NOT EXISTS mv_rollup_${resolution}_$table TO measurement_rollup_$resolution AS"
+            rollup_select "$table" "$template" "$bucket"
+            echo
+        done
+    done
+
+    echo "-- backfill rollups from existing measurements"
+    echo
+    for resolution in 1m 10m; do
+        bucket=$([[ $resolution == 1m ]] && echo toStartOfMinute || echo toStartOfTenMinutes)
+        for entry in "${TABLES[@]}"; do
+            read -r table template <<<"$entry"
+            echo "INSERT INTO measurement_rollup_$resolution"
+            rollup_select "$table" "$template" "$bucket"
+            echo
+        done
+    done
+
+    echo "-- +goose down"
+    echo
+    for resolution in 1m 10m; do
+        for entry in "${TABLES[@]}"; do
+            read -r table template <<<"$entry"
+            echo "DROP VIEW IF EXISTS xbat.mv_rollup_${resolution}_$table;"
+        done
+    done
+    echo "DROP TABLE IF EXISTS xbat.measurement_rollup_1m;"
+    echo "DROP TABLE IF EXISTS xbat.measurement_rollup_10m;"
+}
+
+case "${1:-}" in
+catalog) generator=generate_catalog migration=$CATALOG_MIGRATION ;;
+rollups) generator=generate_rollups migration=$ROLLUPS_MIGRATION ;;
+*)
+    echo "Usage: $0 catalog|rollups [--check]" >&2
+    exit 1
+    ;;
+esac
+
+if [[ "${2:-}" == "--check" ]]; then
+    if ! diff -u "$migration" <($generator) >&2; then
+        echo "$migration is out of sync with the measurement tables of $INITIAL_SETUP" >&2
+        exit 1
+    fi
+    echo "$migration covers all ${#TABLES[@]} measurement tables"
+else
+    $generator
+fi
@@ -0,0 +1,1319 @@
+-- +goose up
+
+--  Catalog of available measurements per job, table, node and level.
+--  Replaces scanning all metric tables with SELECT DISTINCT to determine available metrics and aggregation levels.
+--  Filled on insert by one materialized view per metric table. Rows of the same key are merged in the background,
+--  queries must therefore aggregate with min(min_ts), max(max_ts) and sum(row_count).
+
+CREATE TABLE IF NOT EXISTS measurement_catalog (
+    job_id UInt32,
+    table_name LowCardinality(String),
+    node LowCardinality(String),
+    level LowCardinality(String),
+    min_ts SimpleAggregateFunction(min, DateTime64(3, 'UTC')),
+    max_ts SimpleAggregateFunction(max, DateTime64(3, 'UTC')),
+    row_count SimpleAggregateFunction(sum, UInt64)
+) ENGINE = AggregatingMergeTree()
+ORDER BY (job_id, table_name, node, level);
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_branch_rate TO measurement_catalog AS
+SELECT job_id, 'likwid_branch_rate' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_branch_rate GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_branch_mis_rate TO measurement_catalog AS
+SELECT job_id, 'likwid_branch_mis_rate' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_branch_mis_rate GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_branch_mis_ratio TO measurement_catalog AS
+SELECT job_id, 'likwid_branch_mis_ratio' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_branch_mis_ratio GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_clk TO measurement_catalog AS
+SELECT job_id, 'likwid_clk' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_clk GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_clk_uncore TO measurement_catalog AS
+SELECT job_id, 'likwid_clk_uncore' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_clk_uncore GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_cpi TO measurement_catalog AS
+SELECT job_id, 'likwid_cpi' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_cpi GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_cpu_temp TO measurement_catalog AS
+SELECT job_id, 'likwid_cpu_temp' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_cpu_temp GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_cycles_wo_exec TO measurement_catalog AS
+SELECT job_id, 'likwid_cycles_wo_exec' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_cycles_wo_exec GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_cycles_wo_exec_l1d TO measurement_catalog AS
+SELECT job_id, 'likwid_cycles_wo_exec_l1d' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_cycles_wo_exec_l1d GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_cycles_wo_exec_l2 TO measurement_catalog AS
+SELECT job_id, 'likwid_cycles_wo_exec_l2' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_cycles_wo_exec_l2 GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_cycles_wo_exec_mem_l TO measurement_catalog AS
+SELECT job_id, 'likwid_cycles_wo_exec_mem_l' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_cycles_wo_exec_mem_l GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_flops_sp TO measurement_catalog AS
+SELECT job_id, 'likwid_flops_sp' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_flops_sp GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_flops_dp TO measurement_catalog AS
+SELECT job_id, 'likwid_flops_dp' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_flops_dp GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_flops_avx_sp TO measurement_catalog AS
+SELECT job_id, 'likwid_flops_avx_sp' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_flops_avx_sp GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_flops_avx_dp TO measurement_catalog AS
+SELECT job_id, 'likwid_flops_avx_dp' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_flops_avx_dp GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_flops_avx512_sp TO measurement_catalog AS
+SELECT job_id, 'likwid_flops_avx512_sp' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_flops_avx512_sp GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_flops_avx512_dp TO measurement_catalog AS
+SELECT job_id, 'likwid_flops_avx512_dp' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_flops_avx512_dp GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_instr_branch TO measurement_catalog AS
+SELECT job_id, 'likwid_instr_branch' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_instr_branch GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_cycle_stalls TO measurement_catalog AS
+SELECT job_id, 'likwid_cycle_stalls' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_cycle_stalls GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_cycle_stalls_rate TO measurement_catalog AS
+SELECT job_id, 'likwid_cycle_stalls_rate' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_cycle_stalls_rate GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_cycle_stalls_l1d_mis TO measurement_catalog AS
+SELECT job_id, 'likwid_cycle_stalls_l1d_mis' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_cycle_stalls_l1d_mis GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_cycle_stalls_l2_mis TO measurement_catalog AS
+SELECT job_id, 'likwid_cycle_stalls_l2_mis' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_cycle_stalls_l2_mis GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_cycle_stalls_mem_l TO measurement_catalog AS
+SELECT job_id, 'likwid_cycle_stalls_mem_l' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_cycle_stalls_mem_l GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_cycle_stalls_l1d_mis_rate TO measurement_catalog AS
+SELECT job_id, 'likwid_cycle_stalls_l1d_mis_rate' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_cycle_stalls_l1d_mis_rate GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_cycle_stalls_l2_mis_rate TO measurement_catalog AS
+SELECT job_id, 'likwid_cycle_stalls_l2_mis_rate' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_cycle_stalls_l2_mis_rate GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_cycle_stalls_mem_l_rate TO measurement_catalog AS
+SELECT job_id, 'likwid_cycle_stalls_mem_l_rate' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_cycle_stalls_mem_l_rate GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_scalar_sp TO measurement_catalog AS
+SELECT job_id, 'likwid_scalar_sp' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_scalar_sp GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_scalar_dp TO measurement_catalog AS
+SELECT job_id, 'likwid_scalar_dp' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_scalar_dp GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_packed_sp TO measurement_catalog AS
+SELECT job_id, 'likwid_packed_sp' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_packed_sp GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_packed_dp TO measurement_catalog AS
+SELECT job_id, 'likwid_packed_dp' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_packed_dp GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_cpu_usage TO measurement_catalog AS
+SELECT job_id, 'cpu_usage' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM cpu_usage GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_cpu_user TO measurement_catalog AS
+SELECT job_id, 'cpu_user' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM cpu_user GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_cpu_system TO measurement_catalog AS
+SELECT job_id, 'cpu_system' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM cpu_system GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_cpu_iowait TO measurement_catalog AS
+SELECT job_id, 'cpu_iowait' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM cpu_iowait GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_cpu_nice TO measurement_catalog AS
+SELECT job_id, 'cpu_nice' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM cpu_nice GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_cpu_virtual TO measurement_catalog AS
+SELECT job_id, 'cpu_virtual' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM cpu_virtual GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_vectorization_ratio_sp TO measurement_catalog AS
+SELECT job_id, 'likwid_vectorization_ratio_sp' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_vectorization_ratio_sp GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_vectorization_ratio_dp TO measurement_catalog AS
+SELECT job_id, 'likwid_vectorization_ratio_dp' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_vectorization_ratio_dp GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_l2_bw TO measurement_catalog AS
+SELECT job_id, 'likwid_l2_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l2_bw GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_l3_bw TO measurement_catalog AS
+SELECT job_id, 'likwid_l3_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l3_bw GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_l2d_l_bw TO measurement_catalog AS
+SELECT job_id, 'likwid_l2d_l_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l2d_l_bw GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_l2d_e_bw TO measurement_catalog AS
+SELECT job_id, 'likwid_l2d_e_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l2d_e_bw GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_l3_l_bw TO measurement_catalog AS
+SELECT job_id, 'likwid_l3_l_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l3_l_bw GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_l3_e_bw TO measurement_catalog AS
+SELECT job_id, 'likwid_l3_e_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l3_e_bw GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_l3d_e_bw TO measurement_catalog AS
+SELECT job_id, 'likwid_l3d_e_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l3d_e_bw GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_l2_vol TO measurement_catalog AS
+SELECT job_id, 'likwid_l2_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l2_vol GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_l3_vol TO measurement_catalog AS
+SELECT job_id, 'likwid_l3_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l3_vol GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_l2d_l_vol TO measurement_catalog AS
+SELECT job_id, 'likwid_l2d_l_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l2d_l_vol GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_l3_l_vol TO measurement_catalog AS
+SELECT job_id, 'likwid_l3_l_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l3_l_vol GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_l2d_e_vol TO measurement_catalog AS
+SELECT job_id, 'likwid_l2d_e_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l2d_e_vol GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_l3_e_vol TO measurement_catalog AS
+SELECT job_id, 'likwid_l3_e_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l3_e_vol GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_l3d_e_vol TO measurement_catalog AS
+SELECT job_id, 'likwid_l3d_e_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l3d_e_vol GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_l2_mis_rate TO measurement_catalog AS
+SELECT job_id, 'likwid_l2_mis_rate' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l2_mis_rate GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_l3_mis_rate TO measurement_catalog AS
+SELECT job_id, 'likwid_l3_mis_rate' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l3_mis_rate GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_l2_mis_ratio TO measurement_catalog AS
+SELECT job_id, 'likwid_l2_mis_ratio' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l2_mis_ratio GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_l3_mis_ratio TO measurement_catalog AS
+SELECT job_id, 'likwid_l3_mis_ratio' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l3_mis_ratio GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_l2_req_rate TO measurement_catalog AS
+SELECT job_id, 'likwid_l2_req_rate' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l2_req_rate GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_l3_req_rate TO measurement_catalog AS
+SELECT job_id, 'likwid_l3_req_rate' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l3_req_rate GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_l1i_mis_rate TO measurement_catalog AS
+SELECT job_id, 'likwid_l1i_mis_rate' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l1i_mis_rate GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_l1i_req_ratio TO measurement_catalog AS
+SELECT job_id, 'likwid_l1i_req_ratio' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l1i_req_ratio GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_l1i_stall_rate TO measurement_catalog AS
+SELECT job_id, 'likwid_l1i_stall_rate' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l1i_stall_rate GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_l1i_miss_ratio TO measurement_catalog AS
+SELECT job_id, 'likwid_l1i_miss_ratio' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l1i_miss_ratio GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_l3d_e_vol_bw TO measurement_catalog AS
+SELECT job_id, 'likwid_l3d_e_vol_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l3d_e_vol_bw GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_l3_mem_e_bw TO measurement_catalog AS
+SELECT job_id, 'likwid_l3_mem_e_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l3_mem_e_bw GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_l3_mem_e_vol TO measurement_catalog AS
+SELECT job_id, 'likwid_l3_mem_e_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l3_mem_e_vol GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_mem_bw TO measurement_catalog AS
+SELECT job_id, 'likwid_mem_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_mem_bw GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_mem_r_bw TO measurement_catalog AS
+SELECT job_id, 'likwid_mem_r_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_mem_r_bw GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_mem_l_bw TO measurement_catalog AS
+SELECT job_id, 'likwid_mem_l_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_mem_l_bw GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_mem_w_bw TO measurement_catalog AS
+SELECT job_id, 'likwid_mem_w_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_mem_w_bw GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_mem_e_bw TO measurement_catalog AS
+SELECT job_id, 'likwid_mem_e_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_mem_e_bw GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_mem_vol TO measurement_catalog AS
+SELECT job_id, 'likwid_mem_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_mem_vol GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_mem_r_vol TO measurement_catalog AS
+SELECT job_id, 'likwid_mem_r_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_mem_r_vol GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_mem_l_vol TO measurement_catalog AS
+SELECT job_id, 'likwid_mem_l_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_mem_l_vol GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_mem_w_vol TO measurement_catalog AS
+SELECT job_id, 'likwid_mem_w_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_mem_w_vol GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_mem_e_vol TO measurement_catalog AS
+SELECT job_id, 'likwid_mem_e_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_mem_e_vol GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_mem_usage TO measurement_catalog AS
+SELECT job_id, 'mem_usage' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM mem_usage GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_mem_swap_usage TO measurement_catalog AS
+SELECT job_id, 'mem_swap_usage' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM mem_swap_usage GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_mem_used TO measurement_catalog AS
+SELECT job_id, 'mem_used' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM mem_used GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_mem_swap_used TO measurement_catalog AS
+SELECT job_id, 'mem_swap_used' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM mem_swap_used GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_mem_buffers TO measurement_catalog AS
+SELECT job_id, 'mem_buffers' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM mem_buffers GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_mem_cached TO measurement_catalog AS
+SELECT job_id, 'mem_cached' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM mem_cached GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_l_s_ratio TO measurement_catalog AS
+SELECT job_id, 'likwid_l_s_ratio' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l_s_ratio GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_hbm_r_bw TO measurement_catalog AS
+SELECT job_id, 'likwid_hbm_r_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_hbm_r_bw GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_hbm_w_bw TO measurement_catalog AS
+SELECT job_id, 'likwid_hbm_w_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_hbm_w_bw GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_hbm_bw TO measurement_catalog AS
+SELECT job_id, 'likwid_hbm_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_hbm_bw GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_hbm_vol TO measurement_catalog AS
+SELECT job_id, 'likwid_hbm_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_hbm_vol GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_hbm_r_vol TO measurement_catalog AS
+SELECT job_id, 'likwid_hbm_r_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_hbm_r_vol GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_hbm_w_vol TO measurement_catalog AS
+SELECT job_id, 'likwid_hbm_w_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_hbm_w_vol GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_upi_bw TO measurement_catalog AS
+SELECT job_id, 'likwid_upi_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_upi_bw GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_upi_r_bw TO measurement_catalog AS
+SELECT job_id, 'likwid_upi_r_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_upi_r_bw GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_upi_t_bw TO measurement_catalog AS
+SELECT job_id, 'likwid_upi_t_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_upi_t_bw GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_upi_vol TO measurement_catalog AS
+SELECT job_id, 'likwid_upi_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_upi_vol GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_upi_r_vol TO measurement_catalog AS
+SELECT job_id, 'likwid_upi_r_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_upi_r_vol GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_upi_t_vol TO measurement_catalog AS
+SELECT job_id, 'likwid_upi_t_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_upi_t_vol GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_gpu_clk_sm TO measurement_catalog AS
+SELECT job_id, 'gpu_clk_sm' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_clk_sm GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_gpu_clk_mem TO measurement_catalog AS
+SELECT job_id, 'gpu_clk_mem' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_clk_mem GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_gpu_clk_graphics TO measurement_catalog AS
+SELECT job_id, 'gpu_clk_graphics' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_clk_graphics GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_gpu_clk_video TO measurement_catalog AS
+SELECT job_id, 'gpu_clk_video' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_clk_video GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_gpu_mem_fb_usage TO measurement_catalog AS
+SELECT job_id, 'gpu_mem_fb_usage' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_mem_fb_usage GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_gpu_mem_bar1_usage TO measurement_catalog AS
+SELECT job_id, 'gpu_mem_bar1_usage' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_mem_bar1_usage GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_gpu_mem_util TO measurement_catalog AS
+SELECT job_id, 'gpu_mem_util' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_mem_util GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_gpu_mem_fb_used TO measurement_catalog AS
+SELECT job_id, 'gpu_mem_fb_used' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_mem_fb_used GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_gpu_mem_bar1_used TO measurement_catalog AS
+SELECT job_id, 'gpu_mem_bar1_used' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_mem_bar1_used GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_gpu_mem_fb_free TO measurement_catalog AS
+SELECT job_id, 'gpu_mem_fb_free' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_mem_fb_free GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_gpu_mem_bar1_free TO measurement_catalog AS
+SELECT job_id, 'gpu_mem_bar1_free' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_mem_bar1_free GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_gpu_pstate TO measurement_catalog AS
+SELECT job_id, 'gpu_pstate' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_pstate GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_gpu_util TO measurement_catalog AS
+SELECT job_id, 'gpu_util' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_util GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_gpu_enc_util TO measurement_catalog AS
+SELECT job_id, 'gpu_enc_util' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_enc_util GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_gpu_dec_util TO measurement_catalog AS
+SELECT job_id, 'gpu_dec_util' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_dec_util GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_gpu_mm_util TO measurement_catalog AS
+SELECT job_id, 'gpu_mm_util' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_mm_util GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_cpu_power TO measurement_catalog AS
+SELECT job_id, 'likwid_cpu_power' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_cpu_power GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_cpu_energy TO measurement_catalog AS
+SELECT job_id, 'likwid_cpu_energy' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_cpu_energy GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_core_power TO measurement_catalog AS
+SELECT job_id, 'likwid_core_power' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_core_power GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_dram_power TO measurement_catalog AS
+SELECT job_id, 'likwid_dram_power' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_dram_power GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_likwid_platform_power TO measurement_catalog AS
+SELECT job_id, 'likwid_platform_power' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_platform_power GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_fpga_power TO measurement_catalog AS
+SELECT job_id, 'fpga_power' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM fpga_power GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_gpu_power TO measurement_catalog AS
+SELECT job_id, 'gpu_power' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_power GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_ipmi_power_system TO measurement_catalog AS
+SELECT job_id, 'ipmi_power_system' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM ipmi_power_system GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_disk_r_bw TO measurement_catalog AS
+SELECT job_id, 'disk_r_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_r_bw GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_disk_w_bw TO measurement_catalog AS
+SELECT job_id, 'disk_w_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_w_bw GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_disk_rqm TO measurement_catalog AS
+SELECT job_id, 'disk_rqm' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_rqm GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_disk_rrqm TO measurement_catalog AS
+SELECT job_id, 'disk_rrqm' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_rrqm GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_disk_wrqm TO measurement_catalog AS
+SELECT job_id, 'disk_wrqm' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_wrqm GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_disk_drqm TO measurement_catalog AS
+SELECT job_id, 'disk_drqm' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_drqm GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_disk_r_req_s TO measurement_catalog AS
+SELECT job_id, 'disk_r_req_s' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_r_req_s GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_disk_w_req_s TO measurement_catalog AS
+SELECT job_id, 'disk_w_req_s' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_w_req_s GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_disk_d_req_s TO measurement_catalog AS
+SELECT job_id, 'disk_d_req_s' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_d_req_s GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_disk_f_req_s TO measurement_catalog AS
+SELECT job_id, 'disk_f_req_s' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_f_req_s GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_disk_areq_sz TO measurement_catalog AS
+SELECT job_id, 'disk_areq_sz' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_areq_sz GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_disk_rareq_sz TO measurement_catalog AS
+SELECT job_id, 'disk_rareq_sz' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_rareq_sz GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_disk_wareq_sz TO measurement_catalog AS
+SELECT job_id, 'disk_wareq_sz' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_wareq_sz GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_disk_dareq_sz TO measurement_catalog AS
+SELECT job_id, 'disk_dareq_sz' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_dareq_sz GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_disk_util TO measurement_catalog AS
+SELECT job_id, 'disk_util' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_util GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_disk_await TO measurement_catalog AS
+SELECT job_id, 'disk_await' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_await GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_disk_r_await TO measurement_catalog AS
+SELECT job_id, 'disk_r_await' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_r_await GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_disk_w_await TO measurement_catalog AS
+SELECT job_id, 'disk_w_await' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_w_await GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_eth_rcv_bw TO measurement_catalog AS
+SELECT job_id, 'eth_rcv_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM eth_rcv_bw GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_eth_xmit_bw TO measurement_catalog AS
+SELECT job_id, 'eth_xmit_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM eth_xmit_bw GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_eth_rcv_pkg TO measurement_catalog AS
+SELECT job_id, 'eth_rcv_pkg' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM eth_rcv_pkg GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_eth_xmit_pkg TO measurement_catalog AS
+SELECT job_id, 'eth_xmit_pkg' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM eth_xmit_pkg GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_ib_rcv_bw TO measurement_catalog AS
+SELECT job_id, 'ib_rcv_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM ib_rcv_bw GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_ib_xmit_bw TO measurement_catalog AS
+SELECT job_id, 'ib_xmit_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM ib_xmit_bw GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_ib_rcv_pkg TO measurement_catalog AS
+SELECT job_id, 'ib_rcv_pkg' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM ib_rcv_pkg GROUP BY job_id, node, level;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_catalog_ib_xmit_pkg TO measurement_catalog AS
+SELECT job_id, 'ib_xmit_pkg' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM ib_xmit_pkg GROUP BY job_id, node, level;
+
+--  Backfill catalog with existing measurements.
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_branch_rate' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_branch_rate GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_branch_mis_rate' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_branch_mis_rate GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_branch_mis_ratio' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_branch_mis_ratio GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_clk' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_clk GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_clk_uncore' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_clk_uncore GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_cpi' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_cpi GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_cpu_temp' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_cpu_temp GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_cycles_wo_exec' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_cycles_wo_exec GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_cycles_wo_exec_l1d' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_cycles_wo_exec_l1d GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_cycles_wo_exec_l2' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_cycles_wo_exec_l2 GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_cycles_wo_exec_mem_l' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_cycles_wo_exec_mem_l GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_flops_sp' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_flops_sp GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_flops_dp' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_flops_dp GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_flops_avx_sp' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_flops_avx_sp GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_flops_avx_dp' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_flops_avx_dp GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_flops_avx512_sp' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_flops_avx512_sp GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_flops_avx512_dp' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_flops_avx512_dp GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_instr_branch' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_instr_branch GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_cycle_stalls' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_cycle_stalls GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_cycle_stalls_rate' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_cycle_stalls_rate GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_cycle_stalls_l1d_mis' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_cycle_stalls_l1d_mis GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_cycle_stalls_l2_mis' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_cycle_stalls_l2_mis GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_cycle_stalls_mem_l' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_cycle_stalls_mem_l GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_cycle_stalls_l1d_mis_rate' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_cycle_stalls_l1d_mis_rate GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_cycle_stalls_l2_mis_rate' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_cycle_stalls_l2_mis_rate GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_cycle_stalls_mem_l_rate' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_cycle_stalls_mem_l_rate GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_scalar_sp' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_scalar_sp GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_scalar_dp' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_scalar_dp GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_packed_sp' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_packed_sp GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_packed_dp' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_packed_dp GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'cpu_usage' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM cpu_usage GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'cpu_user' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM cpu_user GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'cpu_system' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM cpu_system GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'cpu_iowait' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM cpu_iowait GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'cpu_nice' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM cpu_nice GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'cpu_virtual' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM cpu_virtual GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_vectorization_ratio_sp' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_vectorization_ratio_sp GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_vectorization_ratio_dp' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_vectorization_ratio_dp GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_l2_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l2_bw GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_l3_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l3_bw GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_l2d_l_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l2d_l_bw GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_l2d_e_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l2d_e_bw GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_l3_l_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l3_l_bw GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_l3_e_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l3_e_bw GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_l3d_e_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l3d_e_bw GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_l2_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l2_vol GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_l3_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l3_vol GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_l2d_l_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l2d_l_vol GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_l3_l_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l3_l_vol GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_l2d_e_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l2d_e_vol GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_l3_e_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l3_e_vol GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_l3d_e_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l3d_e_vol GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_l2_mis_rate' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l2_mis_rate GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_l3_mis_rate' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l3_mis_rate GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_l2_mis_ratio' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l2_mis_ratio GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_l3_mis_ratio' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l3_mis_ratio GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_l2_req_rate' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l2_req_rate GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_l3_req_rate' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l3_req_rate GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_l1i_mis_rate' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l1i_mis_rate GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_l1i_req_ratio' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l1i_req_ratio GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_l1i_stall_rate' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l1i_stall_rate GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_l1i_miss_ratio' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l1i_miss_ratio GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_l3d_e_vol_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l3d_e_vol_bw GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_l3_mem_e_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l3_mem_e_bw GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_l3_mem_e_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l3_mem_e_vol GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_mem_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_mem_bw GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_mem_r_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_mem_r_bw GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_mem_l_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_mem_l_bw GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_mem_w_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_mem_w_bw GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_mem_e_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_mem_e_bw GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_mem_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_mem_vol GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_mem_r_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_mem_r_vol GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_mem_l_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_mem_l_vol GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_mem_w_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_mem_w_vol GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_mem_e_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_mem_e_vol GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'mem_usage' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM mem_usage GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'mem_swap_usage' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM mem_swap_usage GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'mem_used' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM mem_used GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'mem_swap_used' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM mem_swap_used GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'mem_buffers' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM mem_buffers GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'mem_cached' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM mem_cached GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_l_s_ratio' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_l_s_ratio GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_hbm_r_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_hbm_r_bw GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_hbm_w_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_hbm_w_bw GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_hbm_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_hbm_bw GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_hbm_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_hbm_vol GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_hbm_r_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_hbm_r_vol GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_hbm_w_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_hbm_w_vol GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_upi_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_upi_bw GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_upi_r_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_upi_r_bw GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_upi_t_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_upi_t_bw GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_upi_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_upi_vol GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_upi_r_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_upi_r_vol GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_upi_t_vol' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_upi_t_vol GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'gpu_clk_sm' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_clk_sm GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'gpu_clk_mem' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_clk_mem GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'gpu_clk_graphics' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_clk_graphics GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'gpu_clk_video' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_clk_video GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'gpu_mem_fb_usage' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_mem_fb_usage GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'gpu_mem_bar1_usage' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_mem_bar1_usage GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'gpu_mem_util' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_mem_util GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'gpu_mem_fb_used' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_mem_fb_used GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'gpu_mem_bar1_used' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_mem_bar1_used GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'gpu_mem_fb_free' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_mem_fb_free GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'gpu_mem_bar1_free' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_mem_bar1_free GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'gpu_pstate' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_pstate GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'gpu_util' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_util GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'gpu_enc_util' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_enc_util GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'gpu_dec_util' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_dec_util GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'gpu_mm_util' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_mm_util GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_cpu_power' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_cpu_power GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_cpu_energy' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_cpu_energy GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_core_power' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_core_power GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_dram_power' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_dram_power GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'likwid_platform_power' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM likwid_platform_power GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'fpga_power' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM fpga_power GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'gpu_power' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM gpu_power GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'ipmi_power_system' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM ipmi_power_system GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'disk_r_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_r_bw GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'disk_w_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_w_bw GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'disk_rqm' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_rqm GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'disk_rrqm' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_rrqm GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'disk_wrqm' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_wrqm GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'disk_drqm' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_drqm GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'disk_r_req_s' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_r_req_s GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'disk_w_req_s' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_w_req_s GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'disk_d_req_s' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_d_req_s GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'disk_f_req_s' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_f_req_s GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'disk_areq_sz' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_areq_sz GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'disk_rareq_sz' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_rareq_sz GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'disk_wareq_sz' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_wareq_sz GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'disk_dareq_sz' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_dareq_sz GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'disk_util' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_util GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'disk_await' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_await GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'disk_r_await' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_r_await GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'disk_w_await' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM disk_w_await GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'eth_rcv_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM eth_rcv_bw GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'eth_xmit_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM eth_xmit_bw GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'eth_rcv_pkg' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM eth_rcv_pkg GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'eth_xmit_pkg' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM eth_xmit_pkg GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'ib_rcv_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM ib_rcv_bw GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'ib_xmit_bw' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM ib_xmit_bw GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'ib_rcv_pkg' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM ib_rcv_pkg GROUP BY job_id, node, level;
+
+INSERT INTO measurement_catalog
+SELECT job_id, 'ib_xmit_pkg' AS table_name, node, level, min(ts) AS min_ts, max(ts) AS max_ts, count() AS row_count
+FROM ib_xmit_pkg GROUP BY job_id, node, level;
+
+-- +goose down
+
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_branch_rate;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_branch_mis_rate;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_branch_mis_ratio;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_clk;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_clk_uncore;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_cpi;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_cpu_temp;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_cycles_wo_exec;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_cycles_wo_exec_l1d;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_cycles_wo_exec_l2;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_cycles_wo_exec_mem_l;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_flops_sp;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_flops_dp;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_flops_avx_sp;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_flops_avx_dp;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_flops_avx512_sp;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_flops_avx512_dp;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_instr_branch;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_cycle_stalls;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_cycle_stalls_rate;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_cycle_stalls_l1d_mis;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_cycle_stalls_l2_mis;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_cycle_stalls_mem_l;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_cycle_stalls_l1d_mis_rate;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_cycle_stalls_l2_mis_rate;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_cycle_stalls_mem_l_rate;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_scalar_sp;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_scalar_dp;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_packed_sp;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_packed_dp;
+DROP VIEW IF EXISTS xbat.mv_catalog_cpu_usage;
+DROP VIEW IF EXISTS xbat.mv_catalog_cpu_user;
+DROP VIEW IF EXISTS xbat.mv_catalog_cpu_system;
+DROP VIEW IF EXISTS xbat.mv_catalog_cpu_iowait;
+DROP VIEW IF EXISTS xbat.mv_catalog_cpu_nice;
+DROP VIEW IF EXISTS xbat.mv_catalog_cpu_virtual;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_vectorization_ratio_sp;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_vectorization_ratio_dp;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_l2_bw;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_l3_bw;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_l2d_l_bw;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_l2d_e_bw;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_l3_l_bw;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_l3_e_bw;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_l3d_e_bw;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_l2_vol;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_l3_vol;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_l2d_l_vol;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_l3_l_vol;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_l2d_e_vol;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_l3_e_vol;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_l3d_e_vol;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_l2_mis_rate;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_l3_mis_rate;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_l2_mis_ratio;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_l3_mis_ratio;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_l2_req_rate;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_l3_req_rate;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_l1i_mis_rate;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_l1i_req_ratio;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_l1i_stall_rate;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_l1i_miss_ratio;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_l3d_e_vol_bw;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_l3_mem_e_bw;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_l3_mem_e_vol;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_mem_bw;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_mem_r_bw;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_mem_l_bw;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_mem_w_bw;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_mem_e_bw;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_mem_vol;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_mem_r_vol;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_mem_l_vol;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_mem_w_vol;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_mem_e_vol;
+DROP VIEW IF EXISTS xbat.mv_catalog_mem_usage;
+DROP VIEW IF EXISTS xbat.mv_catalog_mem_swap_usage;
+DROP VIEW IF EXISTS xbat.mv_catalog_mem_used;
+DROP VIEW IF EXISTS xbat.mv_catalog_mem_swap_used;
+DROP VIEW IF EXISTS xbat.mv_catalog_mem_buffers;
+DROP VIEW IF EXISTS xbat.mv_catalog_mem_cached;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_l_s_ratio;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_hbm_r_bw;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_hbm_w_bw;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_hbm_bw;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_hbm_vol;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_hbm_r_vol;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_hbm_w_vol;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_upi_bw;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_upi_r_bw;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_upi_t_bw;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_upi_vol;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_upi_r_vol;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_upi_t_vol;
+DROP VIEW IF EXISTS xbat.mv_catalog_gpu_clk_sm;
+DROP VIEW IF EXISTS xbat.mv_catalog_gpu_clk_mem;
+DROP VIEW IF EXISTS xbat.mv_catalog_gpu_clk_graphics;
+DROP VIEW IF EXISTS xbat.mv_catalog_gpu_clk_video;
+DROP VIEW IF EXISTS xbat.mv_catalog_gpu_mem_fb_usage;
+DROP VIEW IF EXISTS xbat.mv_catalog_gpu_mem_bar1_usage;
+DROP VIEW IF EXISTS xbat.mv_catalog_gpu_mem_util;
+DROP VIEW IF EXISTS xbat.mv_catalog_gpu_mem_fb_used;
+DROP VIEW IF EXISTS xbat.mv_catalog_gpu_mem_bar1_used;
+DROP VIEW IF EXISTS xbat.mv_catalog_gpu_mem_fb_free;
+DROP VIEW IF EXISTS xbat.mv_catalog_gpu_mem_bar1_free;
+DROP VIEW IF EXISTS xbat.mv_catalog_gpu_pstate;
+DROP VIEW IF EXISTS xbat.mv_catalog_gpu_util;
+DROP VIEW IF EXISTS xbat.mv_catalog_gpu_enc_util;
+DROP VIEW IF EXISTS xbat.mv_catalog_gpu_dec_util;
+DROP VIEW IF EXISTS xbat.mv_catalog_gpu_mm_util;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_cpu_power;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_cpu_energy;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_core_power;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_dram_power;
+DROP VIEW IF EXISTS xbat.mv_catalog_likwid_platform_power;
+DROP VIEW IF EXISTS xbat.mv_catalog_fpga_power;
+DROP VIEW IF EXISTS xbat.mv_catalog_gpu_power;
+DROP VIEW IF EXISTS xbat.mv_catalog_ipmi_power_system;
+DROP VIEW IF EXISTS xbat.mv_catalog_disk_r_bw;
+DROP VIEW IF EXISTS xbat.mv_catalog_disk_w_bw;
+DROP VIEW IF EXISTS xbat.mv_catalog_disk_rqm;
+DROP VIEW IF EXISTS xbat.mv_catalog_disk_rrqm;
+DROP VIEW IF EXISTS xbat.mv_catalog_disk_wrqm;
+DROP VIEW IF EXISTS xbat.mv_catalog_disk_drqm;
+DROP VIEW IF EXISTS xbat.mv_catalog_disk_r_req_s;
+DROP VIEW IF EXISTS xbat.mv_catalog_disk_w_req_s;
+DROP VIEW IF EXISTS xbat.mv_catalog_disk_d_req_s;
+DROP VIEW IF EXISTS xbat.mv_catalog_disk_f_req_s;
+DROP VIEW IF EXISTS xbat.mv_catalog_disk_areq_sz;
+DROP VIEW IF EXISTS xbat.mv_catalog_disk_rareq_sz;
+DROP VIEW IF EXISTS xbat.mv_catalog_disk_wareq_sz;
+DROP VIEW IF EXISTS xbat.mv_catalog_disk_dareq_sz;
+DROP VIEW IF EXISTS xbat.mv_catalog_disk_util;
+DROP VIEW IF EXISTS xbat.mv_catalog_disk_await;
+DROP VIEW IF EXISTS xbat.mv_catalog_disk_r_await;
+DROP VIEW IF EXISTS xbat.mv_catalog_disk_w_await;
+DROP VIEW IF EXISTS xbat.mv_catalog_eth_rcv_bw;
+DROP VIEW IF EXISTS xbat.mv_catalog_eth_xmit_bw;
+DROP VIEW IF EXISTS xbat.mv_catalog_eth_rcv_pkg;
+DROP VIEW IF EXISTS xbat.mv_catalog_eth_xmit_pkg;
+DROP VIEW IF EXISTS xbat.mv_catalog_ib_rcv_bw;
+DROP VIEW IF EXISTS xbat.mv_catalog_ib_xmit_bw;
+DROP VIEW IF EXISTS xbat.mv_catalog_ib_rcv_pkg;
+DROP VIEW IF EXISTS xbat.mv_catalog_ib_xmit_pkg;
+DROP TABLE IF EXISTS xbat.measurement_catalog;
@@ -127,6 +127,10 @@ def create_app():
 
         app.add_api(OPENAPI_PATH)
 
+        # precompute default views of finished benchmarks
+        from backend.restapi import warmup
+        warmup.start(flask_app)
+
         return app
 
 
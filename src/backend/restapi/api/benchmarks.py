@@ -18,11 +18,13 @@ from backend.restapi.access_control import check_user_permissions
 from backend.restapi.user_helper import get_user_from_token, create_user_benchmark_filter
 from backend.utils.backup import save_benchmarks, process_collection, replace_jobId_json, clickhouse_import_csvs, pigz_compress, pigz_decompress, count_csv_files
 from backend.utils.questdb_clickhouse_migration import detect_format, convert_to_clickhouse
+from backend.restapi.valkey import Valkey
 from shared.clickhouse import ClickHouse
 import asyncio
 
 db = MongoDB()
 clickhouse = ClickHouse()
+valkey = Valkey()
 rpcClient = XbatCtldRpcClient()
 
 EXPORT_PATH = Path("/tmp/xbat/export")
@@ -310,6 +312,8 @@ def delete(runNr):
 
     db.deleteMany("outputs", {"jobId": {"$in": jobIds}})
 
+    valkey.invalidate_jobs(jobIds)
+
     if len(jobIds):
         # Run ClickHouse deletion in background thread
         thread = threading.Thread(target=_delete_clickhouse_jobs_background,
@@ -520,6 +524,8 @@ async def import_benchmark():
     import_start_time = time.time()
     # Track all reserved jobIds for cleanup
     all_reserved_jobIds = []
+    # Track all imported jobIds to invalidate cached results of replaced jobs
+    imported_jobIds = []
 
     try:
         # Process each runNr directory
@@ -598,6 +604,7 @@ async def import_benchmark():
                         continue
                     old_jobId = int(job_folder.stem)
                     new_jobId = jobId_map.get(old_jobId, old_jobId)
+                    imported_jobIds.append(new_jobId)
 
                     app.logger.debug(
                         f"Processing job folder: {job_folder.name} (old_jobId: {old_jobId}, new_jobId: {new_jobId})"
@@ -627,6 +634,7 @@ async def import_benchmark():
             db.releaseReservedJobIds(all_reserved_jobIds)
         raise e
     finally:
+        valkey.invalidate_jobs(imported_jobIds)
         try:
             print("Cleaning up extracted files...")
             shutil.rmtree(extract_folder)
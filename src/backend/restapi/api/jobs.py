@@ -8,10 +8,12 @@ from shared.date import get_current_timestamp
 from backend.restapi.access_control import check_user_permissions
 from backend.restapi.user_helper import get_user_from_token, create_user_benchmark_filter
 from backend.restapi.api.nodes import get_all as get_node_by_hash
+from backend.restapi.valkey import Valkey
 
 BENCHMARKING_WINDOW = 900  # 15 minutes
 
 db = MongoDB()
+valkey = Valkey()
 
 register_lock = FileLock("/tmp/register-jobs.lock")
 
@@ -146,6 +148,9 @@ def patch(jobId):
             "configuration.jobscript.variantName": data["variantName"]
         }})
 
+    # cached views may contain the previous variant name
+    valkey.invalidate_jobs([jobId])
+
     return sanitize_mongo(result), 200
 
 
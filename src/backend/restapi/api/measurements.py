@@ -1,22 +1,27 @@
-import itertools
 import csv
 import re
+import base64
+import math
 import logging
+import queue
 import asyncio
 import numpy as np
 from io import StringIO
-from datetime import datetime
-from flask import request, Response, jsonify
+from urllib.parse import urlencode
+from datetime import timezone
+from flask import request, Response, jsonify, json, stream_with_context, current_app
 from pathlib import Path
 from shared import httpErrors
 from shared import clickhouse as cdb
 from shared.mongodb import MongoDB
-from shared.configuration import get_logger
-from shared.date import iso8601_to_datetime
+from shared.configuration import get_logger, get_config
+from shared.date import iso8601_to_datetime, unix_ms_to_datetime, get_current_datetime
 from shared.files import read_file_to_dict
-from shared.helpers import dict_get_key
-from shared.size import human_size, human_size_mem, human_size_mem_fixed, human_size_fixed
+from shared.helpers import dict_get_key, format_error
+from shared.size import human_size, human_size_mem, human_size_mem_fixed_array, human_size_fixed_array
 from backend.restapi.valkey import Valkey
+from backend.restapi.live import LiveTail
+from backend.restapi.user_helper import get_user_from_token, create_user_benchmark_filter
 
 clickhouse = cdb.ClickHouse()
 mongodb = MongoDB()
@@ -26,7 +31,6 @@ logger = logging.getLogger(get_logger())
 
 METRICS_PATH = Path().absolute() / "restapi" / "metrics.json"
 METRICS = read_file_to_dict(METRICS_PATH)
-MAX_QUERY_COUNT = 8
 
 LEVEL_MAPPING = {
     "thread": 0,
@@ -38,8 +42,40 @@ LEVEL_MAPPING = {
     "job": 6
 }
 
+TOPOLOGY_LEVELS = ["thread", "core", "numa", "socket"]
+
 CONVERTABLE_UNITS = ["byte", "uops", "flops"]
 
+EXPORT_CONCURRENCY = 4  # metrics calculated concurrently during export of all metrics
+
+METRICS_CACHE_PREFIX = "metrics:v2:"  # cached results of `calculate_metrics` (v2: traces contain their timestamps)
+ENERGY_CACHE_PREFIX = "energy:"  # cached energy consumption per job (see `_calculate_energy`)
+
+# power metrics of the energy group integrated by `calculate_energy`
+ENERGY_METRICS = [
+    "CPU Power", "Core Power", "DRAM Power", "FPGA Power", "GPU Power",
+    "System Power"
+]
+
+HEATMAP_MAX_BUCKETS = 500  # default number of time buckets of a heatmap
+HISTOGRAM_BINS = 50  # default number of bins of a histogram
+
+LIVE_HEARTBEAT_INTERVAL = 15  # seconds, keeps idle live streams open behind proxies and detects disconnected clients
+
+# compact encoding of traces with typed arrays (see `_encode_compact`), requested via Accept header
+COMPACT_MIMETYPE = "application/vnd.xbat.compact+json"
+
+# ClickHouse output format, settings and mimetype of binary exports
+EXPORT_FORMATS = {
+    "parquet":
+    ("Parquet", {
+        "output_format_parquet_compression_method": "zstd"
+    }, "application/vnd.apache.parquet"),
+    "arrow": ("Arrow", {
+        "output_format_arrow_compression_method": "zstd"
+    }, "application/vnd.apache.arrow.file")
+}
+
 
 def get_metric_tables():
     tables = []
@@ -67,55 +103,53 @@ def get_hightest_level(levels):
         LEVEL_MAPPING.values()).index(maxLevel)]
 
 
-def calculate_interval(records):
-    if len(records) < 2: return 5.0
-    start = records[0]["ts"]
-    # Parse timestamps if they're strings (from ClickHouse)
-    if isinstance(start, str):
-        start = datetime.fromisoformat(start)
-    for entry in records:
-        ts = entry["ts"]
-        if isinstance(ts, str):
-            ts = datetime.fromisoformat(ts)
-        if ts > start:
-            return (ts - start).total_seconds()
+def calculate_interval(ts):
+    """
+    Calculates the measurement interval (seconds) from the first two distinct timestamps.
 
-    return 5.0
+    :param ts: sorted timestamps (unix milliseconds)
+    :return: interval in seconds
+    """
+    if len(ts) < 2: return 5.0
+    later = ts[ts > ts[0]]
+    if not len(later):
+        return 5.0
+    return float(later[0] - ts[0]) / 1000
 
 
-def filter_interval(records, capture_start, capture_end):
+def filter_interval(columns, capture_start, capture_end):
     """
     Filters out all records that are not within the specified timestamps.
 
-    :param records: measurement records
+    :param columns: measurement records as dict of columns (see `ClickHouse._execute`)
     :param capture_start: starting timestamp
     :param capture_end: end timestamp
-    :return: filtered list
+    :return: filtered columns
     """
 
-    if not len(records):
-        return []
-
-    filtered = []
-    capture_start = capture_start.replace(
-        tzinfo=None) if capture_start is not None else None
-    capture_end = capture_end.replace(
-        tzinfo=None) if capture_end is not None else None
+    if not len(columns) or not len(columns["ts_ms"]):
+        return {}
 
-    for entry in records:
-        ts = entry["ts"]
-        if isinstance(ts, str):
-            ts = datetime.fromisoformat(ts)
+    ts = columns["ts_ms"]
+    mask = np.ones(len(ts), dtype=bool)
+    if capture_start is not None:
+        mask &= ts >= _datetime_to_unix_ms(capture_start)
+    if capture_end is not None:
+        mask &= ts <= _datetime_to_unix_ms(capture_end)
 
-        if capture_start is not None and ts < capture_start:
-            continue
-        if capture_end is not None and ts > capture_end:
-            continue
-        filtered.append(entry)
+    if mask.all():
+        return columns
 
-    if not len(filtered):
+    if not mask.any():
         logger.debug("No records left after filtering for capture timeframe")
-    return filtered
+        return {}
+
+    return {k: v[mask] for k, v in columns.items()}
+
+
+def _datetime_to_unix_ms(dt):
+    """Converts datetime to unix milliseconds, consistent with the (timezone-stripped) capture filters of the queries"""
+    return int(round(dt.replace(tzinfo=timezone.utc).timestamp() * 1000))
 
 
 def aggregate(records, level, type):
@@ -177,10 +211,122 @@ def calculate_statistics(values):
     }
 
 
-def _getDeciles(values):
-    values.sort()
-    return list(
-        [round(np.percentile(values, dec), 2) for dec in range(0, 101, 10)])
+# levels whose values combine the samples of multiple nodes (job) or are aligned across nodes (node)
+ALIGNED_LEVELS = ["job", "node"]
+
+DECILE_COLUMNS = [f"d{dec}" for dec in range(0, 11)]
+DECILE_LEVELS = ["thread", "core", "node"]
+
+# envelope of the series not returned in outlier mode (see `_create_outliers_query`)
+ENVELOPE_COLUMNS = {"min": "env_min", "median": "env_median", "max": "env_max"}
+
+
+def _create_deciles_query(query, align, origin=0) -> str:
+    """
+    Wraps a query created by `_create_query` to calculate deciles across all series per timestamp.
+
+    quantilesExactInclusive interpolates linearly, identical to numpy.percentile.
+
+    :param query: query returning values per series and timestamp
+    :param align: optional alignment of timestamps (ms), required as nodes sample at slightly different timestamps
+    :param origin: origin of the alignment (ms)
+    """
+    ts = f"intDiv(ts_ms - {origin}, {align}) * {align} + {origin}" if align else "ts_ms"
+    quantiles = ", ".join(str(dec / 10) for dec in range(0, 11))
+    columns = ", ".join(f"round(q[{idx + 1}], 2) as {name}"
+                        for idx, name in enumerate(DECILE_COLUMNS))
+
+    return f"SELECT ts_bucket as ts_ms, {columns} FROM (SELECT {ts} as ts_bucket, quantilesExactInclusive({quantiles})(val) as q FROM ({query}) GROUP BY ts_bucket) ORDER BY ts_ms"
+
+
+def _create_outliers_query(query, level, outliers) -> str:
+    """
+    Wraps a query created by `_create_query` to return only the series deviating most from the median of all series and
+    the envelope (min, median and max) of all remaining series per timestamp.
+
+    The deviation of a series is its mean absolute difference from the median across all series per timestamp. Medians,
+    deviations and ranks are calculated with window functions, the query is therefore executed only once.
+
+    :param query: query returning values per series and timestamp
+    :param outliers: number of series to return
+    :return: query returning the values of the outliers (columns of query with `outlier` = 1, the value in each
+        envelope column) and the envelope of the remaining series (`outlier` = 0), see `_split_outliers`
+    """
+    ranked = (
+        f"SELECT series, val, ts_ms, dense_rank() OVER (ORDER BY deviation DESC, series) as series_rank "
+        f"FROM (SELECT series, val, ts_ms, avg(abs(val - ts_median)) OVER (PARTITION BY series) as deviation "
+        f"FROM (SELECT {level} as series, val, ts_ms, quantileExactInclusive(0.5)(val) OVER (PARTITION BY ts_ms) "
+        f"as ts_median FROM ({query})))")
+
+    # outliers form one group per series and timestamp, all remaining series one group per timestamp
+    outlier = f"series_rank <= {int(outliers)}"
+    return (
+        f"SELECT if({outlier}, series, defaultValueOfArgumentType(series)) as {level}, ts_ms, {outlier} as outlier, "
+        f"min(val) as {ENVELOPE_COLUMNS['min']}, quantileExactInclusive(0.5)(val) as {ENVELOPE_COLUMNS['median']}, "
+        f"max(val) as {ENVELOPE_COLUMNS['max']} FROM ({ranked}) GROUP BY outlier, {level}, ts_ms ORDER BY ts_ms")
+
+
+def _split_outliers(records, level):
+    """
+    Splits the result of a query created by `_create_outliers_query` into the values of the outliers (columns of
+    `_create_query`) and the envelope of the remaining series.
+    """
+    mask = records["outlier"].astype(bool)
+    outliers = {
+        level: records[level][mask],
+        "val": records[ENVELOPE_COLUMNS["min"]][mask],
+        "ts_ms": records["ts_ms"][mask]
+    }
+    envelope = {
+        "ts_ms": records["ts_ms"][~mask],
+        **{
+            column: records[column][~mask]
+            for column in ENVELOPE_COLUMNS.values()
+        }
+    }
+    return outliers, envelope
+
+
+def _create_range_query(queries) -> str:
+    """Creates query returning the minimum and maximum of the (finite) values of multiple queries created by `_create_query`"""
+    union = " UNION ALL ".join(f"SELECT val FROM ({query})"
+                               for query in queries)
+    return f"SELECT min(val) as val_min, max(val) as val_max FROM ({union}) WHERE isFinite(val)"
+
+
+def _create_histogram_query(query, bins, lower=None, width=None) -> str:
+    """
+    Wraps a query created by `_create_query` to count its values in bins.
+
+    With lower and width, values are counted in bins of identical width starting at lower (e.g. shared by multiple jobs,
+    see `_create_range_query`), the last bin includes its upper bound. Otherwise, the bins are determined adaptively by
+    ClickHouse (`histogram`), the count of adaptive bins is approximate.
+
+    :param bins: number of bins (maximum for adaptive bins)
+    """
+    if width is None:
+        return (
+            "SELECT tupleElement(bin, 1) as lower, tupleElement(bin, 2) as upper, tupleElement(bin, 3) as bin_count "
+            f"FROM (SELECT arrayJoin(histogram({int(bins)})(val)) as bin FROM ({query}) WHERE isFinite(val)) ORDER BY lower"
+        )
+
+    return (
+        f"SELECT least(toUInt32(floor((val - {float(lower)!r}) / {float(width)!r})), {int(bins) - 1}) as bin, "
+        f"count() as bin_count FROM ({query}) WHERE isFinite(val) GROUP BY bin ORDER BY bin"
+    )
+
+
+def _create_filters(jobId, level, filter_level, node=None, start=None,
+                    end=None):
+    """Creates the filters of a metric table for a job, level and node within the capture window"""
+    filters = [f"job_id='{jobId}'", f"level='{filter_level}'"]
+    if level != "job" and node:
+        filters.append(f"node='{node}'")
+    if start:
+        filters.append(f"ts >= '{start.replace(tzinfo=None).isoformat()}'")
+    if end:
+        filters.append(f"ts <= '{end.replace(tzinfo=None).isoformat()}'")
+    return filters
 
 
 def _create_query(jobId: int,
@@ -190,7 +336,23 @@ def _create_query(jobId: int,
                   node: str | None = None,
                   type: str = "avg",
                   capture_start=None,
-                  capture_end=None) -> str:
+                  capture_end=None,
+                  bucket=None,
+                  start=None,
+                  interval=None) -> str:
+    """
+    Creates query to retrieve aggregated values for the specified level.
+
+    If a bucket width (ms) is provided, values are additionally averaged over time buckets aligned to capture start.
+    Averaging (instead of e.g. min/max decimation) keeps the integral of the values correct for the effective interval.
+
+    The nodes of a job sample at slightly different timestamps. On job and node level, values are therefore grouped by
+    time buckets of the measurement interval (or the bucket width) aligned to capture start instead of the exact
+    timestamp (see `_create_aligned_query`).
+
+    :param start: retrieve only values from start on (defaults to capture start), buckets remain aligned to capture start
+    :param interval: measurement interval of the job (ms)
+    """
 
     value_calculation = "SUM(value)"
 
@@ -199,66 +361,300 @@ def _create_query(jobId: int,
         # this is required as LIKWID sometimes reports NaN values on unused (inactive) cores which we substitute with 0
         value_calculation = "COALESCE(AVG(CASE WHEN value != 0 THEN value END), 0)"
 
-    filters = [f"job_id='{jobId}'", f"level='{filter_level}'"]
-    if level != "job" and node:
-        filters.append(f"node='{node}'")
-    if capture_start:
-        filters.append(f"ts >= '{capture_start.replace(tzinfo=None).isoformat()}'")
-    if capture_end:
-        filters.append(f"ts <= '{capture_end.replace(tzinfo=None).isoformat()}'")
+    filters = _create_filters(jobId, level, filter_level, node,
+                              start or capture_start, capture_end)
 
-    columns = [f"{value_calculation} as val", "ts"]
+    if level in ALIGNED_LEVELS and (bucket or interval):
+        return _create_aligned_query(metric_table,
+                                     [] if level == "job" else [level],
+                                     filters, type, capture_start,
+                                     bucket or interval)
+
+    # ts is transferred as unix milliseconds to avoid parsing of timestamps
+    ts_alias = "ts_raw" if bucket else "ts_ms"
+    columns = [
+        f"{value_calculation} as val",
+        f"toUnixTimestamp64Milli(ts) as {ts_alias}"
+    ]
     groups = ["ts"]
 
     if level != "job":
         columns.insert(0, level)
         groups.insert(0, level)
 
-    query = f"SELECT {', '.join(columns)} FROM {metric_table} WHERE {' and '.join(filters)} GROUP BY {', '.join(groups)} ORDER BY ts"
+    query = f"SELECT {', '.join(columns)} FROM {metric_table} WHERE {' and '.join(filters)} GROUP BY {', '.join(groups)}"
 
-    return query
+    if not bucket:
+        return f"{query} ORDER BY ts"
 
+    origin = _datetime_to_unix_ms(capture_start) if capture_start else 0
+    columns = [
+        "avg(val) as val",
+        f"intDiv(ts_raw - {origin}, {bucket}) * {bucket} + {origin} as ts_ms"
+    ]
+    groups = ["ts_ms"]
+    if level != "job":
+        columns.insert(0, level)
+        groups.insert(0, level)
 
-def _transform_query_result(result, level):
-    values = {}
-    for entry in result:
-        key = entry[level] if level != "job" else "job"
-        if not key in values:
-            values[key] = []
-        # Convert val to float if it's a string (from ClickHouse)
-        val = entry["val"]
-        if isinstance(val, str):
-            val = float(val)
-        values[key].append(val)
-    return values
+    return f"SELECT {', '.join(columns)} FROM ({query}) GROUP BY {', '.join(groups)} ORDER BY ts_ms"
 
 
-def _sanitize_uid(s):
-    return re.sub(r'[\s\[\]/\(\)]', '_', s).lower()
+def _series_value_calculation(type):
+    """
+    Returns the aggregation of per series sums (series_sum), number of samples (series_count) and number of non-zero
+    values (series_nonzero) on the requested level, equivalent to the value calculation of `_create_query`.
+
+    Sums add up the average of each series, averages are calculated from all non-zero values.
+    """
+    if type == "avg":
+        return "if(SUM(series_nonzero) > 0, SUM(series_sum) / SUM(series_nonzero), 0)"
+    return "SUM(series_sum / series_count)"
 
 
-async def calculate_metrics(jobId, group, metric, level, node, deciles):
+def _create_aligned_query(metric_table: str,
+                          groups,
+                          filters,
+                          type: str,
+                          capture_start,
+                          bucket: int,
+                          origin=None) -> str:
     """
-    Retrieves and calculates metrics based on the provided parameters.
+    Creates query equivalent to `_create_query` with values of all nodes grouped by time buckets aligned to capture
+    start (job and node level).
 
-    :param jobId: ID of job
-    :param group: group of metric
-    :param metric: metric name
-    :param level: aggregation level
-    :param node: node name
-    :param deciles: apply deciles
+    Values are first combined per node and bucket, a node sampling twice within a bucket is therefore not counted twice.
 
-    :return: list of all measurements for specified metric
+    :param groups: columns identifying a series of the result, e.g. [] for job level or ["node"] for node level
+    :param filters: see `_create_filters`
+    :param bucket: bucket width (ms), at least the measurement interval
+    :param origin: start of the buckets (unix milliseconds or SQL expression, e.g. per job), defaults to capture start
     """
-    if not jobId or not (group in METRICS) or not (metric in METRICS[group]):
-        raise httpErrors.BadRequest()
+    if origin is None:
+        origin = _datetime_to_unix_ms(capture_start) if capture_start else 0
+    ts = f"intDiv(toUnixTimestamp64Milli(ts) - {origin}, {bucket}) * {bucket} + {origin}"
+
+    series = ", ".join(dict.fromkeys(["node", *groups]))
+    query = (
+        f"SELECT {series}, {ts} as ts_ms, sum(value) as series_sum, uniqExact(ts) as series_count, "
+        f"countIf(value != 0) as series_nonzero FROM {metric_table} WHERE {' and '.join(filters)} "
+        f"GROUP BY {series}, ts_ms")
+
+    columns = [*groups, f"{_series_value_calculation(type)} as val", "ts_ms"]
+    return f"SELECT {', '.join(columns)} FROM ({query}) GROUP BY {', '.join([*groups, 'ts_ms'])} ORDER BY ts_ms"
+
+
+def _create_heatmap_query(jobId: int,
+                          metric_table: str,
+                          level: str,
+                          filter_level: str,
+                          node: str | None = None,
+                          type: str = "avg",
+                          capture_start=None,
+                          capture_end=None,
+                          bucket: int = 1000,
+                          resolution=None) -> str:
+    """
+    Creates query to retrieve the cells of a heatmap, the values per series (node and level) and time bucket aligned to
+    capture start.
 
-    # retrieve capture interval for job
-    job = mongodb.getOne("jobs", {"jobId": jobId})
+    :param bucket: bucket width (ms), at least the measurement interval
+    :param resolution: resolution of the rollup to use (see `_plan_resolution`), raw measurements if None
+    """
+    groups = list(dict.fromkeys(["node", level]))
+    if resolution:
+        return _create_rollup_query(jobId, resolution, metric_table, level,
+                                    filter_level, node, type, capture_start,
+                                    capture_end, bucket, groups=groups)
+
+    filters = _create_filters(jobId, level, filter_level, node,
+                              capture_start, capture_end)
+    return _create_aligned_query(metric_table, groups, filters, type,
+                                 capture_start, bucket)
+
+
+def _create_comparison_query(windows,
+                             metric_table: str,
+                             filter_level: str,
+                             type: str = "avg",
+                             bucket: int = 1000) -> str:
+    """
+    Creates query to retrieve job level values of multiple jobs on a time axis relative to their start.
+
+    Values of each node are averaged over time buckets (ms) starting at the start of each job and combined across nodes
+    like the job level (see `_create_aligned_query`), `ts_ms` is the start of the bucket (unix milliseconds).
+
+    :param windows: start and end (unix milliseconds, end is None if not present) per job ID
+    """
+    job_filters = []
+    origins = []
+    for jobId, (start, end) in windows.items():
+        filters = [
+            f"job_id='{jobId}'",
+            f"ts >= '{unix_ms_to_datetime(start).isoformat()}'"
+        ]
+        if end is not None:
+            filters.append(f"ts <= '{unix_ms_to_datetime(end).isoformat()}'")
+        job_filters.append(f"({' and '.join(filters)})")
+        origins.append(f"job_id = {jobId}, {start}")
+
+    jobIds = ", ".join(str(x) for x in windows)
+    filters = [
+        f"job_id IN ({jobIds})", f"level='{filter_level}'",
+        f"({' or '.join(job_filters)})"
+    ]
+    return _create_aligned_query(metric_table, ["job_id"],
+                                 filters,
+                                 type,
+                                 None,
+                                 bucket,
+                                 origin=f"multiIf({', '.join(origins)}, 0)")
+
+
+def _get_job_interval(job):
+    """Returns the configured measurement interval of a job (seconds)"""
+    configuration = job["configuration"] if "configuration" in job else None
+    if configuration and "interval" in configuration:
+        # int conversion for compatibility with older job configurations
+        return int(configuration["interval"])
+
+    # CLI jobs have no configuration and use the default interval
+    config = get_config()
+    if "general" in config and "cli_interval" in config["general"]:
+        return int(config["general"]["cli_interval"])
+    return 10
+
+
+def _get_bucket(job, capture_start, capture_end, max_points):
+    """
+    Determines the bucket width (ms) required to return at most `max_points` values per trace.
+
+    The bucket width is a multiple of the measurement interval. Jobs without capture start are not downsampled.
+
+    :return: bucket width or None if no downsampling is required
+    """
+    if not max_points or capture_start is None:
+        return None
+
+    end = capture_end if capture_end is not None else get_current_datetime()
+    window = _datetime_to_unix_ms(end) - _datetime_to_unix_ms(capture_start)
+    interval = _get_job_interval(job) * 1000
+
+    factor = math.ceil(window / max_points / interval)
+    return factor * interval if factor > 1 else None
 
-    if job is None:
-        raise httpErrors.NotFound()
 
+def _plan_resolution(bucket):
+    """
+    Selects the coarsest rollup whose resolution does not exceed the bucket width.
+
+    The bucket width is rounded up to a multiple of the selected resolution, which still meets the point budget.
+
+    :param bucket: bucket width (ms) determined by `_get_bucket`
+    :return: resolution of the rollup (None if raw measurements are required) and bucket width
+    """
+    if not bucket:
+        return None, bucket
+
+    for resolution in sorted(cdb.ROLLUP_TABLES, reverse=True):
+        if resolution <= bucket:
+            return resolution, math.ceil(bucket / resolution) * resolution
+
+    return None, bucket
+
+
+def _create_rollup_query(jobId: int,
+                         resolution: int,
+                         metric_table: str,
+                         level: str,
+                         filter_level: str,
+                         node: str | None = None,
+                         type: str = "avg",
+                         capture_start=None,
+                         capture_end=None,
+                         bucket=None,
+                         start=None,
+                         groups=None) -> str:
+    """
+    Creates query equivalent to `_create_query` with time buckets, based on the rollup of the specified resolution.
+
+    Rollups are first combined per series (node, topology, device) and bucket, then aggregated on the requested level.
+    Averages are calculated from the sum and count of non-zero values, sums add up the averages of all series.
+    Rollup buckets starting before capture start are assigned to the first bucket.
+
+    :param groups: columns identifying a series of the result, defaults to the level
+    """
+    filters = [
+        f"job_id='{jobId}'", f"table_name='{metric_table}'",
+        f"level='{filter_level}'"
+    ]
+    if level != "job" and node:
+        filters.append(f"node='{node}'")
+    start = start or capture_start
+    if start:
+        start = _datetime_to_unix_ms(start)
+        filters.append(
+            f"bucket >= toDateTime({(start - start % resolution) // 1000}, 'UTC')"
+        )
+    if capture_end:
+        filters.append(
+            f"bucket <= toDateTime({_datetime_to_unix_ms(capture_end) // 1000}, 'UTC')"
+        )
+
+    origin = _datetime_to_unix_ms(capture_start) if capture_start else 0
+    series = ["node", *TOPOLOGY_LEVELS, "device"]
+    ts = f"intDiv(greatest(toUnixTimestamp(bucket) * 1000, {origin}) - {origin}, {bucket}) * {bucket} + {origin}"
+
+    query = (
+        f"SELECT {', '.join(series)}, {ts} as ts_ms, sum(value_sum) as series_sum, sum(value_count) as series_count, "
+        f"sum(nonzero_count) as series_nonzero FROM {cdb.ROLLUP_TABLES[resolution]} WHERE {' and '.join(filters)} "
+        f"GROUP BY {', '.join(series)}, ts_ms")
+
+    if groups is None:
+        groups = [] if level == "job" else [level]
+
+    columns = [*groups, f"{_series_value_calculation(type)} as val", "ts_ms"]
+    return f"SELECT {', '.join(columns)} FROM ({query}) GROUP BY {', '.join([*groups, 'ts_ms'])} ORDER BY ts_ms"
+
+
+def _column_types(level, deciles=False):
+    """Returns numpy dtypes for the columns of queries created by `_create_query` or `_create_deciles_query`"""
+    if deciles:
+        return {"ts_ms": np.int64, **{x: np.float64 for x in DECILE_COLUMNS}}
+
+    dtypes = {
+        "ts_ms": np.int64,
+        "val": np.float64,
+        "outlier": np.int64,
+        **{x: np.float64 for x in ENVELOPE_COLUMNS.values()}
+    }
+    if level in TOPOLOGY_LEVELS:
+        dtypes[level] = np.int64
+    return dtypes
+
+
+def _transform_query_result(columns, level):
+    """
+    Groups values by the aggregation level (categorical codes of the group column), preserving order of timestamps.
+
+    :param columns: measurement records as dict of columns
+    :param level: aggregation level
+    :return: list of keys, list of corresponding value arrays and list of corresponding timestamp arrays
+    """
+    values = columns["val"]
+    timestamps = columns["ts_ms"]
+    if level == "job":
+        return ["job"], [values], [timestamps]
+
+    keys, codes = np.unique(columns[level], return_inverse=True)
+    order = np.argsort(codes, kind="stable")
+    boundaries = np.flatnonzero(np.diff(codes[order])) + 1
+    return keys.tolist(), np.split(values[order], boundaries), np.split(
+        timestamps[order], boundaries)
+
+
+def _get_capture_window(job):
+    """Returns capture start and end of a job as datetime (None if not present)"""
     capture_start = job["captureStart"] if "captureStart" in job else None
     capture_end = job["captureEnd"] if "captureEnd" in job else None
 
@@ -268,61 +664,269 @@ async def calculate_metrics(jobId, group, metric, level, node, deciles):
     capture_end = iso8601_to_datetime(capture_end) if isinstance(
         capture_end, str) else capture_end
 
-    metricMeta = METRICS[group][metric]
+    return capture_start, capture_end
+
+
+def _create_catalog_query(jobIds, tables=None, node=None) -> str:
+    """
+    Creates query for the measurement catalog returning one entry per job, table, node and level.
+
+    :param jobIds: list of job IDs
+    :param tables: restrict to metric tables
+    :param node: restrict to node
+    """
+    filters = [f"job_id IN ({', '.join(str(x) for x in jobIds)})"]
+    if tables is not None:
+        table_names = ", ".join(f"'{t}'" for t in tables)
+        filters.append(f"table_name IN ({table_names})")
+    if node:
+        filters.append(f"node='{node}'")
+
+    return (
+        "SELECT job_id, table_name, node, level, "
+        "toUnixTimestamp64Milli(min(min_ts)) as min_ts, toUnixTimestamp64Milli(max(max_ts)) as max_ts, "
+        f"sum(row_count) as row_count FROM {cdb.CATALOG_TABLE} WHERE {' and '.join(filters)} "
+        "GROUP BY job_id, table_name, node, level")
+
+
+def _in_capture_window(entry, capture_start, capture_end):
+    """Checks whether the measurements of a catalog entry overlap with the capture window"""
+    if capture_start is not None and int(
+            entry["max_ts"]) < _datetime_to_unix_ms(capture_start):
+        return False
+    if capture_end is not None and int(
+            entry["min_ts"]) > _datetime_to_unix_ms(capture_end):
+        return False
+    return True
+
+
+def _sanitize_uid(s):
+    return re.sub(r'[\s\[\]/\(\)]', '_', s).lower()
+
+
+def _get_display_unit(unit, values):
+    """
+    Establishes a sensible unit for conversion (e.g. GFLOPS/s instead of FLOPS/s) from the maximum of all non-zero values.
+
+    :param unit: unit of the metric
+    :param values: all values of the metric
+    :return: display unit and unit used for `_convert_values` (None if values are not converted)
+    """
+    if not any(map(unit.lower().__contains__, CONVERTABLE_UNITS)):
+        return unit, None
+
+    non_zero_values = values[(values != 0) & ~np.isnan(values)]
+    if not len(non_zero_values):
+        return unit, None
+
+    per_second = unit.endswith("/s")
+    is_byte = "byte" in unit
+    max_value = np.max(non_zero_values)
+
+    [_, u] = human_size_mem(max_value) if is_byte else human_size(max_value)
+
+    if is_byte:
+        return f"{u}/s" if per_second else u, u
+    return f"{u.upper()}{unit.upper().replace('/S', '')}{'/s' if per_second else ''}", u
+
+
+def _convert_values(values, unit, conversion_unit):
+    """Converts values of the (raw) unit to the conversion unit determined by `_get_display_unit`"""
+    if "byte" in unit:
+        return human_size_mem_fixed_array(values, conversion_unit)
+    return human_size_fixed_array(values, conversion_unit)
 
-    traces = []
+
+def _get_available_levels(catalog, jobId, metric_tables, level, node,
+                          capture_start, capture_end):
+    """
+    Returns the available aggregation levels per metric table of a job from catalog entries.
+
+    :param catalog: catalog entries (see `_create_catalog_query`), may contain entries of other jobs, tables and nodes
+    """
+    all_levels = {}
+    for entry in catalog:
+        if int(entry["job_id"]) != int(jobId) or not (entry["table_name"]
+                                                      in metric_tables):
+            continue
+        if level != "job" and node and entry["node"] != node:
+            continue
+        if _in_capture_window(entry, capture_start, capture_end):
+            all_levels.setdefault(entry["table_name"], {})[entry["level"]] = True
+    return all_levels
+
+
+def _get_filter_level(preaggregated_levels, level):
+    """Returns the level to read from a metric table, the requested level or the next lower preaggregated level"""
+    if level in preaggregated_levels:
+        return level
+    return next_lower_aggregate(preaggregated_levels, level)
+
+
+def _get_since_start(since, capture_start, bucket):
+    """
+    Returns the start of the query window for values after `since` (unix milliseconds).
+
+    Bucketed values (downsampled or aligned to the measurement interval) are recalculated from the start of the bucket
+    containing `since`, as buckets are aligned to capture start and the last bucket known by the client may have been
+    incomplete. Returns None if all values are required.
+    """
+    if since is None:
+        return None
+
+    origin = _datetime_to_unix_ms(capture_start) if capture_start else 0
+    start = origin + (since - origin) // bucket * bucket if bucket else since
+    return unix_ms_to_datetime(max(start, origin))
+
+
+def _plan_metrics(job,
+                  group,
+                  metric,
+                  level,
+                  node,
+                  deciles,
+                  max_points,
+                  catalog,
+                  since=None,
+                  until=None,
+                  outliers=None):
+    """
+    Plans the queries required to calculate a metric of a job, one query per available metric table.
+
+    In outlier mode, the query of each metric table additionally returns the envelope of the remaining series.
+
+    :param job: job document
+    :param catalog: catalog entries of the job (see `_create_catalog_query`)
+    :param since: retrieve only values after this timestamp (unix milliseconds)
+    :param until: retrieve only values up to this timestamp (unix milliseconds)
+    :param outliers: return only this number of most deviating series and the envelope of the remaining series
+    :return: plan for `_build_metrics` or None if no measurements are available
+    """
+    jobId = job["jobId"]
+    capture_start, capture_end = _get_capture_window(job)
+
+    metricMeta = METRICS[group][metric]
 
     # TODO check that requested level is not smaller than minimum level!
 
     metric_tables = metricMeta["metrics"].keys()
 
-    queries = []
-    # check which aggregation levels are available
-    for metric_table in metric_tables:
-
-        parts = [
-            f"SELECT DISTINCT level FROM {metric_table} WHERE job_id='{jobId}'"
-        ]
-        if level != "job" and node:
-            parts.append(f"AND node='{node}'")
-        if capture_start:
-            parts.append(f"AND ts >= '{capture_start.replace(tzinfo=None).isoformat()}'")
-        if capture_end:
-            parts.append(f"AND ts <= '{capture_end.replace(tzinfo=None).isoformat()}'")
-        queries.append(" ".join(parts))
+    bucket = _get_bucket(job, capture_start, capture_end, max_points)
+    # downsampled traces are loaded from pre-aggregated rollups if possible
+    resolution, bucket = _plan_resolution(bucket)
+
+    # job and node level values are aligned to the measurement interval, as are the deciles of node level values
+    interval = _get_job_interval(job) * 1000
+    align = bucket or (interval if level in ALIGNED_LEVELS else None)
+
+    start = _get_since_start(since, capture_start, align)
+    # bucketed values are returned from the start of the bucket containing since (replacing the last value of the
+    # client), other values after since
+    since_start = None
+    if since is not None:
+        since_start = _datetime_to_unix_ms(start) if align else since + 1
+
+    if until is not None:
+        if align:
+            # exclude the bucket containing until, it is returned by the next request with since=until
+            origin = _datetime_to_unix_ms(capture_start) if capture_start else 0
+            until = origin + (until - origin) // align * align - 1
+        capture_end = unix_ms_to_datetime(
+            until if capture_end is None else
+            min(until, _datetime_to_unix_ms(capture_end)))
 
-    all_levels = await clickhouse.execute_queries(queries)
+    # check which aggregation levels are available
+    all_levels = _get_available_levels(catalog, jobId, metric_tables, level,
+                                       node, start or capture_start,
+                                       capture_end)
 
     queries = []
     available_metric_tables = []
 
+    # deciles are calculated in ClickHouse, deciles take precedence over outliers as both summarize all series
+    is_deciles = deciles and level in DECILE_LEVELS
+    is_outliers = bool(outliers) and level != "job" and not is_deciles
+
     # build query based on aggregation levels
     # use separate list for available metric tables to prevent result mismatch on missing tables/entries
-    for idx, metric_table in enumerate(metric_tables):
-        # TODO check for x validity
-        preaggregated_levels = [x["level"] for x in all_levels[idx]]
+    for metric_table in metric_tables:
+        preaggregated_levels = list(all_levels.get(metric_table, {}).keys())
         if not len(preaggregated_levels):
             continue
 
-        filter_level = level
-        if not (level in preaggregated_levels):
-            # get next lower preaggregated level
-            filter_level = next_lower_aggregate(preaggregated_levels, level)
+        filter_level = _get_filter_level(preaggregated_levels, level)
 
         aggregation_type = metricMeta[
             "aggregation"] if "aggregation" in metricMeta else "avg"
 
-        queries.append(
-            _create_query(jobId, metric_table, level, filter_level, node,
-                          aggregation_type, capture_start, capture_end))
+        if resolution:
+            query = _create_rollup_query(jobId, resolution, metric_table,
+                                         level, filter_level, node,
+                                         aggregation_type, capture_start,
+                                         capture_end, bucket, start)
+        else:
+            query = _create_query(jobId, metric_table, level, filter_level,
+                                  node, aggregation_type, capture_start,
+                                  capture_end, bucket, start, interval)
+        if is_deciles:
+            query = _create_deciles_query(
+                query, align,
+                _datetime_to_unix_ms(capture_start) if capture_start else 0)
+        elif is_outliers:
+            query = _create_outliers_query(query, level, outliers)
+        queries.append(query)
 
         available_metric_tables.append(metric_table)
 
     if not len(queries):
         logger.debug("Unable to find entries for %s", metric)
-        return {"traces": [], "statistics": {}}
+        return None
 
-    all_records = await clickhouse.execute_queries(queries)
+    return {
+        "job": job,
+        "group": group,
+        "metric": metric,
+        "level": level,
+        "node": node,
+        "capture_start": capture_start,
+        "capture_end": capture_end,
+        "bucket": bucket,
+        "since": since,
+        "since_start": since_start,
+        "deciles": is_deciles,
+        "outliers": is_outliers,
+        "tables": available_metric_tables,
+        "queries": queries,
+        "dtypes": _column_types(level, is_deciles)
+    }
+
+
+def _build_metrics(plan, all_records):
+    """
+    Calculates traces and statistics from the query results of a plan created by `_plan_metrics`.
+
+    :param plan: plan of the metric
+    :param all_records: query results (columns) in order of the planned queries
+    :return: traces and statistics
+    """
+    job = plan["job"]
+    jobId = job["jobId"]
+    group = plan["group"]
+    metric = plan["metric"]
+    level = plan["level"]
+    node = plan["node"]
+    capture_start = plan["capture_start"]
+    capture_end = plan["capture_end"]
+    bucket = plan["bucket"]
+    since = plan["since"]
+    since_start = plan["since_start"]
+    is_deciles = plan["deciles"]
+    is_outliers = plan["outliers"]
+    available_metric_tables = plan["tables"]
+
+    metricMeta = METRICS[group][metric]
+
+    traces = []
 
     unit = metricMeta["unit"] if "unit" in metricMeta else ""
 
@@ -332,28 +936,28 @@ async def calculate_metrics(jobId, group, metric, level, node, deciles):
     # calculate metrics
     for idx, metric_table in enumerate(available_metric_tables):
 
-        records = all_records[idx]
+        records = filter_interval(all_records[idx], capture_start,
+                                  capture_end)
 
-        records = filter_interval(records, capture_start, capture_end)
+        if since is not None and len(records):
+            # values before since_start are already known by the client
+            records = {
+                k: v[records["ts_ms"] >= since_start]
+                for k, v in records.items()
+            }
 
-        if not len(records):
-            continue
+        if is_outliers and len(records):
+            records, envelope = _split_outliers(records, level)
 
-        aggregation_type = metricMeta[
-            "aggregation"] if "aggregation" in metricMeta else "avg"
+        if not len(records) or not len(records["ts_ms"]):
+            continue
 
-        interval = calculate_interval(records)
-        aggregates = _transform_query_result(records, level)
+        ts = records["ts_ms"]
+        # downsampled traces carry the bucket width as effective interval
+        interval = bucket / 1000 if bucket else calculate_interval(ts)
 
-        # Parse timestamps if they're strings (from ClickHouse)
-        timestamps = []
-        for x in records:
-            ts = x["ts"]
-            if isinstance(ts, str):
-                ts = datetime.fromisoformat(ts)
-            timestamps.append(ts)
-        start = min(timestamps)
-        stop = max(timestamps)
+        start = unix_ms_to_datetime(ts.min())
+        stop = unix_ms_to_datetime(ts.max())
 
         stacked = False
         if "stacked" in metricMeta and metricMeta["stacked"]:
@@ -371,8 +975,6 @@ async def calculate_metrics(jobId, group, metric, level, node, deciles):
         description = metricEntry["description"] if isinstance(
             metricEntry, dict) else metricEntry,
 
-        is_deciles = deciles and (level == 'thread' or level == 'core')
-
         trace_base = {
             "jobId": jobId,
             "group": group,
@@ -389,17 +991,13 @@ async def calculate_metrics(jobId, group, metric, level, node, deciles):
             "table": metric_table,
             "variant": variant_name,
             "iteration": job["iteration"],
-            "deciles": False
+            "deciles": False,
+            "envelope": False
         }
 
         if is_deciles:
-            combined_values = list(zip(*aggregates.values()))
-            decile_values = []
-            for ts in combined_values:
-                decile_values.append(_getDeciles(list(ts)))
-
             for dec in range(1, 11):
-                values = [v[dec] for v in decile_values]
+                values = records[DECILE_COLUMNS[dec]]
 
                 name = f"Decile {dec} {raw_name}"
 
@@ -412,6 +1010,8 @@ async def calculate_metrics(jobId, group, metric, level, node, deciles):
                     name,
                     "values":
                     values,
+                    "timestamps":
+                    records["ts_ms"],
                     "id":
                     dec,
                     "deciles":
@@ -422,8 +1022,9 @@ async def calculate_metrics(jobId, group, metric, level, node, deciles):
                 })
 
         else:
-            for key in aggregates.keys():
-                values = aggregates[key]
+            keys, aggregates, timestamps = _transform_query_result(
+                records, level)
+            for key, values, series_ts in zip(keys, aggregates, timestamps):
 
                 if not len(values):
                     continue
@@ -431,7 +1032,7 @@ async def calculate_metrics(jobId, group, metric, level, node, deciles):
                 name = raw_name
                 identifier = key
 
-                if len(aggregates.keys()) > 1:
+                if len(keys) > 1:
                     identifier = f"{level[0]}{key}"
 
                 if identifier != key:
@@ -450,6 +1051,8 @@ async def calculate_metrics(jobId, group, metric, level, node, deciles):
                     legend_group,
                     "values":
                     values,
+                    "timestamps":
+                    series_ts,
                     "stacked":
                     stacked,
                     "id":
@@ -459,96 +1062,1077 @@ async def calculate_metrics(jobId, group, metric, level, node, deciles):
                         f"{trace_base['table']}-{jobId}-{level}-{name}")
                 })
 
-    # adjust unit and calculate statistics
-    per_second = unit.endswith("/s")
-    conversion_unit = None
+        if is_outliers:
+            if not len(envelope["ts_ms"]):
+                continue
+
+            # envelope may start later than the outliers (e.g. all series of the first timestamps are outliers)
+            envelope_base = {
+                **trace_base, "start":
+                unix_ms_to_datetime(envelope["ts_ms"].min()),
+                "stop":
+                unix_ms_to_datetime(envelope["ts_ms"].max())
+            }
+            for identifier, column in ENVELOPE_COLUMNS.items():
+                name = f"{raw_name} {identifier} of others"
+                traces.append({
+                    **envelope_base, "name":
+                    name,
+                    "rawName":
+                    raw_name,
+                    "legend_group":
+                    f"{raw_name} others",
+                    "values":
+                    envelope[column],
+                    "timestamps":
+                    envelope["ts_ms"],
+                    "id":
+                    identifier,
+                    "envelope":
+                    True,
+                    "uid":
+                    _sanitize_uid(
+                        f"{trace_base['table']}-{jobId}-{level}-{name}")
+                })
+
+    # adjust unit and calculate statistics
+    conversion_unit = None
+    if len(traces):
+        unit, conversion_unit = _get_display_unit(
+            unit, np.concatenate([res["values"] for res in traces]))
+
+    values_by_metric = {}
+    # apply conversion and calculate statistics for each trace
+    for entry in traces:
+        if conversion_unit:
+            entry["rawValues"] = entry["values"]
+            entry["values"] = _convert_values(entry["values"], entry["unit"],
+                                              conversion_unit)
+        elif since is not None:
+            # the display unit of appended values may differ from the initial trace, raw values allow conversion
+            entry["rawValues"] = entry["values"]
+        entry["statistics"] = calculate_statistics(entry["values"])
+        entry["unit"] = unit
+
+        if entry["envelope"]:
+            continue
+        values_by_metric.setdefault(entry["rawName"],
+                                    []).append(entry["values"])
+
+    # calculate statistics across all traces of same type - only used when level < node
+    statistics = {}
+    for key, values in values_by_metric.items():
+        length = min(len(v) for v in values)
+        combined = np.vstack([v[:length] for v in values])
+        statistics[key] = {
+            "values": {
+                "min": combined.min(axis=0).tolist(),
+                "max": combined.max(axis=0).tolist(),
+                "avg": combined.mean(axis=0).tolist()
+            },
+            "general": calculate_statistics(np.concatenate(values))
+        }
+
+    # traces are processed as numpy arrays, the response contains plain lists
+    for entry in traces:
+        entry["values"] = entry["values"].tolist()
+        if "rawValues" in entry:
+            entry["rawValues"] = entry["rawValues"].tolist()
+
+    return {"traces": traces, "statistics": statistics}
+
+
+def _create_union_query(queries) -> str:
+    """
+    Combines queries of the same shape into a single statement.
+
+    Rows are tagged with the index of their query (`query_idx`) and ordered by it, see `_split_union_result`.
+    """
+    union = " UNION ALL ".join(f"SELECT {idx} as query_idx, * FROM ({query})"
+                               for idx, query in enumerate(queries))
+    return f"SELECT * FROM ({union}) ORDER BY query_idx, ts_ms"
+
+
+def _split_union_result(columns, count):
+    """Splits the result of a query created by `_create_union_query` into the results of the combined queries"""
+    if not len(columns):
+        return [{} for _ in range(count)]
+
+    boundaries = np.searchsorted(columns["query_idx"], np.arange(count + 1))
+    return [{
+        name: column[start:stop]
+        for name, column in columns.items() if name != "query_idx"
+    } for start, stop in zip(boundaries[:-1], boundaries[1:])]
+
+
+async def calculate_metrics(jobId,
+                            group,
+                            metric,
+                            level,
+                            node,
+                            deciles,
+                            max_points=None,
+                            since=None,
+                            until=None,
+                            outliers=None):
+    """
+    Retrieves and calculates metrics based on the provided parameters.
+
+    :param jobId: ID of job
+    :param group: group of metric
+    :param metric: metric name
+    :param level: aggregation level
+    :param node: node name
+    :param deciles: apply deciles
+    :param max_points: maximum number of values per trace (downsampled in ClickHouse)
+    :param since: return only values after this timestamp (unix milliseconds), e.g. to append to traces of running jobs,
+        bucketed values (job and node level) from the start of the bucket containing since, not combinable with max_points
+    :param until: return only values up to this timestamp (unix milliseconds), bucketed values up to the bucket
+        containing until
+    :param outliers: return only this number of series deviating most from the median and the envelope (min, median,
+        max) of the remaining series, e.g. to find load imbalance on thread level
+
+    :return: list of all measurements for specified metric
+    """
+    if not jobId or not (group in METRICS) or not (metric in METRICS[group]):
+        raise httpErrors.BadRequest()
+    if since is not None and max_points:
+        # the bucket width of a running job grows with its duration, appended buckets would not match the trace
+        raise httpErrors.BadRequest("maxPoints cannot be combined with since")
+
+    # retrieve capture interval for job
+    job = mongodb.getOne("jobs", {"jobId": jobId})
+
+    if job is None:
+        raise httpErrors.NotFound()
+
+    async def _calculate():
+        catalog = await clickhouse.execute_query(
+            _create_catalog_query([jobId],
+                                  METRICS[group][metric]["metrics"].keys(),
+                                  node if level != "job" else None))
+
+        plan = _plan_metrics(job, group, metric, level, node, deciles,
+                             max_points, catalog, since, until, outliers)
+
+        if plan is None:
+            return {"traces": [], "statistics": {}}
+
+        all_records = await clickhouse.execute_queries(plan["queries"],
+                                                       dtypes=plan["dtypes"])
+
+        return _build_metrics(plan, all_records)
+
+    # shared by all endpoints (measurements, energy, roofline, exports, statistics), concurrent identical calculations
+    # (e.g. a finished job opened by multiple users) are executed once, unfinished jobs and partial results are not cached
+    return await valkey.get_or_compute(
+        _get_metrics_cache_key(jobId, group, metric, level, node, deciles,
+                               max_points, since, until, outliers),
+        _calculate,
+        jobIds=[jobId],
+        cacheable=_job_cacheable(job) and since is None and until is None)
+
+
+def _get_metrics_cache_key(jobId,
+                           group,
+                           metric,
+                           level,
+                           node,
+                           deciles,
+                           max_points,
+                           since=None,
+                           until=None,
+                           outliers=None):
+    """Returns the cache key of the result of `calculate_metrics`"""
+    return _get_cache_key(
+        f"{METRICS_CACHE_PREFIX}{jobId}", {
+            "group": group,
+            "metric": metric,
+            "level": level,
+            "node": node,
+            "deciles": deciles,
+            "maxPoints": max_points,
+            "since": since,
+            "until": until,
+            "outliers": outliers
+        })
+
+
+def _encode_array(values, dtype):
+    """Encodes values as base64 of a little-endian typed array"""
+    return base64.b64encode(np.asarray(values,
+                                       dtype=dtype).tobytes()).decode()
+
+
+def _encode_compact(result):
+    """
+    Encodes a result of `calculate_metrics` with base64 typed arrays instead of JSON lists.
+
+    Values and raw values are encoded as float32 (~7 significant digits, sufficient for display). Traces with identical
+    timestamps share one vector of timestamps (unix milliseconds, float64) referenced by index.
+    """
+    timestamps = []
+    timestamp_index = {}
+    traces = []
+    for trace in result["traces"]:
+        # vectors are deduplicated by content, series may have gaps or different timestamps despite equal length
+        key = np.asarray(trace["timestamps"], dtype=np.int64).tobytes()
+        if key not in timestamp_index:
+            timestamp_index[key] = len(timestamps)
+            timestamps.append(_encode_array(trace["timestamps"], "<f8"))
+
+        encoded = {
+            **trace, "values": _encode_array(trace["values"], "<f4"),
+            "timestamps": timestamp_index[key]
+        }
+        if "rawValues" in trace:
+            encoded["rawValues"] = _encode_array(trace["rawValues"], "<f4")
+        traces.append(encoded)
+
+    statistics = {
+        key: {
+            **entry, "values": {
+                name: _encode_array(values, "<f4")
+                for name, values in entry["values"].items()
+            }
+        }
+        for key, entry in result["statistics"].items()
+    }
+
+    return {
+        "encoding": {
+            "values": "float32",
+            "rawValues": "float32",
+            "timestamps": "float64",
+            "byteOrder": "little"
+        },
+        "timestamps": timestamps,
+        "traces": traces,
+        "statistics": statistics
+    }
+
+
+def _without_timestamps(result):
+    """Removes the timestamps of all traces (see `_encode_compact`), JSON traces are described by start and interval"""
+    return {
+        **result, "traces": [{
+            key: value
+            for key, value in trace.items() if key != "timestamps"
+        } for trace in result["traces"]]
+    }
+
+
+def _accepts_compact():
+    """Content negotiation of the compact encoding, JSON is preferred if both are accepted equally"""
+    return request.accept_mimetypes.best_match(
+        ["application/json", COMPACT_MIMETYPE]) == COMPACT_MIMETYPE
+
+
+def _compact_response(content):
+    response = jsonify(content)
+    response.mimetype = COMPACT_MIMETYPE
+    return response
+
+
+async def get_measurements(jobId,
+                           group="",
+                           metric="",
+                           level="",
+                           node="",
+                           deciles=False,
+                           maxPoints=None,
+                           since=None,
+                           outliers=None):
+    """
+    Returns calculated metrics based on filters.
+
+    :param jobId: ID of job
+    :param group: group of metric
+    :param metric: metric name
+    :param level: aggregation level
+    :param node: node
+    :param maxPoints: maximum number of values per trace
+    :param since: return only values after this timestamp (unix milliseconds), traces keep their uid, the bucket containing
+        since is returned again on job and node level (see `calculate_metrics`)
+    :param outliers: return only this number of most deviating series and the envelope of the remaining series
+    """
+    result = await calculate_metrics(jobId, group, metric, level, node,
+                                     deciles, maxPoints, since, None,
+                                     outliers)
+
+    if result is None: raise httpErrors.NotFound()
+
+    if _accepts_compact():
+        return _compact_response(_encode_compact(result))
+
+    return _without_timestamps(result), 200
+
+
+def _get_batch_cache_key(spec):
+    """Returns the cache key of a batch specification, identical to the cache key of `calculate_metrics`"""
+    return _get_metrics_cache_key(spec["jobId"], spec["group"],
+                                  spec["metric"], spec["level"],
+                                  spec.get("node", ""),
+                                  spec.get("deciles", False),
+                                  spec.get("maxPoints"), spec.get("since"))
+
+
+async def get_measurements_batch():
+    """
+    Returns calculated metrics for multiple measurement specifications (jobId, group, metric, level, node) at once.
+
+    :return: results in order of the specifications (see `get_measurements`)
+    """
+    data = request.get_json()
+    specs = data["measurements"] if data and "measurements" in data else None
+
+    if not specs:
+        raise httpErrors.BadRequest("No measurements specified")
+
+    for spec in specs:
+        if not spec.get("jobId") or not (spec.get("group") in METRICS) or not (
+                spec.get("metric") in METRICS[spec["group"]]) or not (
+                    spec.get("level") in LEVEL_MAPPING):
+            raise httpErrors.BadRequest(f"Invalid measurement {spec}")
+        if spec.get("since") is not None and spec.get("maxPoints"):
+            raise httpErrors.BadRequest(
+                f"maxPoints cannot be combined with since {spec}")
+
+    results = await _calculate_metrics_batch(specs)
+    if any(result is None for result in results):
+        raise httpErrors.NotFound()
+
+    return _batch_response(results)
+
+
+async def _calculate_metrics_batch(specs):
+    """
+    Calculates metrics for multiple specifications (see `calculate_metrics`), reusing cached results.
+
+    Jobs are retrieved with a single lookup, available levels with a single catalog query and all tables of a metric are
+    combined into one statement (UNION ALL). Statements of all specifications are executed concurrently.
+
+    :param specs: list of dicts with jobId, group, metric, level and optional node, deciles and maxPoints
+    :return: results in order of the specifications, None for unknown jobs
+    """
+    results = [None] * len(specs)
+    cache_keys = [_get_batch_cache_key(spec) for spec in specs]
+    for idx, key in enumerate(cache_keys):
+        results[idx] = await valkey.get(key)
+
+    pending = [idx for idx, result in enumerate(results) if result is None]
+    if not len(pending):
+        return results
+
+    jobIds = list(set(specs[idx]["jobId"] for idx in pending))
+    jobs = {
+        job["jobId"]: job
+        for job in mongodb.getMany("jobs", {"jobId": {
+            "$in": jobIds
+        }})
+    }
+    pending = [idx for idx in pending if specs[idx]["jobId"] in jobs]
+    if not len(pending):
+        return results
+
+    metric_tables = set()
+    for idx in pending:
+        metric_tables.update(
+            METRICS[specs[idx]["group"]][specs[idx]["metric"]]["metrics"].keys())
+
+    catalog = await clickhouse.execute_query(
+        _create_catalog_query(list(jobs.keys()), sorted(metric_tables)))
+
+    plans = {}
+    for idx in pending:
+        spec = specs[idx]
+        plan = _plan_metrics(jobs[spec["jobId"]], spec["group"],
+                             spec["metric"], spec["level"],
+                             spec.get("node", ""), spec.get("deciles", False),
+                             spec.get("maxPoints"), catalog,
+                             spec.get("since"))
+        if plan is None:
+            results[idx] = {"traces": [], "statistics": {}}
+        else:
+            plans[idx] = plan
+
+    # all plans share the column types (identical columns have identical types)
+    dtypes = {"query_idx": np.int64}
+    for plan in plans.values():
+        dtypes.update(plan["dtypes"])
+
+    all_records = await clickhouse.execute_queries(
+        [_create_union_query(plan["queries"]) for plan in plans.values()],
+        dtypes=dtypes)
+
+    for (idx, plan), records in zip(plans.items(), all_records):
+        results[idx] = _build_metrics(
+            plan, _split_union_result(records, len(plan["queries"])))
+
+    # prevent caching of unfinished jobs and of partial results
+    for idx in pending:
+        if _job_cacheable(jobs[specs[idx]["jobId"]]) and specs[idx].get(
+                "since") is None:
+            await valkey.set(cache_keys[idx],
+                             results[idx],
+                             jobIds=[specs[idx]["jobId"]])
+
+    return results
+
+
+def _batch_response(results):
+    if _accepts_compact():
+        return _compact_response(
+            {"results": [_encode_compact(result) for result in results]})
+    return {
+        "results": [_without_timestamps(result) for result in results]
+    }, 200
+
+
+def _parse_live_metrics(metrics):
+    """Parses metrics of a live stream ("group:metric"), metric names may not contain ':'"""
+    parsed = []
+    for entry in metrics or []:
+        group, _, metric = entry.partition(":")
+        if not (group in METRICS) or not (metric in METRICS[group]):
+            raise httpErrors.BadRequest(f"Invalid metric {entry}")
+        if (group, metric) not in parsed:
+            parsed.append((group, metric))
+    if not parsed:
+        raise httpErrors.BadRequest("No metrics specified")
+    return parsed
+
+
+def _format_event(event, data, event_id=None):
+    """Formats a server-sent event, data is encoded as JSON"""
+    message = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{message}event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def stream_measurements(jobId,
+                              metrics,
+                              level,
+                              node="",
+                              deciles=False,
+                              since=None):
+    """
+    Streams new values of multiple metrics of a running job as server-sent events.
+
+    The first "measurements" event contains all values after since, each following event the values of one
+    measurement interval (see `get_measurements` with since). All viewers of a job, metrics, level and node share a
+    single tail per process (see `backend.restapi.live.LiveTail`). Events carry the timestamp up to which values were
+    sent as id, reconnecting clients continue from there (Last-Event-ID). Once the job reached a final state, the
+    remaining values and an "end" event are sent.
+
+    :param metrics: list of "group:metric"
+    :param since: stream only values after this timestamp (unix milliseconds), all values by default
+    """
+    metrics = _parse_live_metrics(metrics)
+    if not (level in LEVEL_MAPPING):
+        raise httpErrors.BadRequest(f"Invalid level {level}")
+
+    job = mongodb.getOne("jobs", {"jobId": jobId})
+    if job is None:
+        raise httpErrors.NotFound()
+
+    last_event_id = request.headers.get("Last-Event-ID")
+    if last_event_id and last_event_id.isdigit():
+        since = int(last_event_id)
+
+    async def _calculate(since, until):
+        results = await asyncio.gather(*[
+            calculate_metrics(jobId, group, metric, level, node, deciles,
+                              None, since, until)
+            for group, metric in metrics
+        ])
+        return [_without_timestamps(result) for result in results]
+
+    async def _tail(since, until):
+        current = mongodb.getOne("jobs", {"jobId": jobId})
+        # include all remaining values once the job finished
+        finished = current is None or _job_cacheable(current)
+        return await _calculate(since, None if finished else until), finished
+
+    tail = None
+    subscriber = None
+    boundary = None
+    if not _job_cacheable(job):
+        tail, subscriber, boundary = LiveTail.subscribe(
+            _get_cache_key(f"live:{jobId}", {
+                "metrics": [f"{group}:{metric}" for group, metric in metrics],
+                "level": level,
+                "node": node,
+                "deciles": deciles
+            }), _tail, _get_job_interval(job),
+            current_app._get_current_object())
+
+    def _generate():
+        # initial values are calculated in a dedicated event loop (see `_stream_csv`)
+        loop = asyncio.new_event_loop()
+        try:
+            results = loop.run_until_complete(_calculate(since, boundary))
+            yield _format_event("measurements", {"results": results},
+                                boundary)
+
+            while subscriber is not None:
+                try:
+                    until, results, finished = subscriber.get(
+                        timeout=LIVE_HEARTBEAT_INTERVAL)
+                except queue.Empty:
+                    yield ": heartbeat\n\n"
+                    continue
+
+                yield _format_event("measurements", {"results": results},
+                                    until)
+                if finished:
+                    break
+
+            yield _format_event("end", {})
+        finally:
+            # client disconnected
+            if tail is not None:
+                tail.unsubscribe(subscriber)
+            loop.close()
+
+    return Response(stream_with_context(_generate()),
+                    mimetype="text/event-stream",
+                    headers={
+                        "Cache-Control": "no-cache",
+                        "X-Accel-Buffering": "no"
+                    })
+
+
+def _nan_to_none(values):
+    """Converts array to list with missing values (NaN) as None"""
+    return [None if math.isnan(v) else v for v in values.tolist()]
+
+
+def _calculate_comparison_statistics(matrix):
+    """
+    Calculates mean, min, max and standard deviation across all jobs per bucket, ignoring missing values (NaN).
+
+    :param matrix: values of shape (jobs, buckets)
+    """
+    valid = ~np.isnan(matrix)
+    count = valid.sum(axis=0)
+    present = count > 0
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(valid, matrix, 0).sum(axis=0) / count
+        std = np.sqrt(
+            np.where(valid, (matrix - mean)**2, 0).sum(axis=0) / count)
+    minimum = np.where(valid, matrix, np.inf).min(axis=0)
+    maximum = np.where(valid, matrix, -np.inf).max(axis=0)
+
+    return {
+        "mean": _nan_to_none(np.round(np.where(present, mean, np.nan), 2)),
+        "min": _nan_to_none(np.where(present, minimum, np.nan)),
+        "max": _nan_to_none(np.where(present, maximum, np.nan)),
+        "std": _nan_to_none(np.round(np.where(present, std, np.nan), 2)),
+        "count": count.tolist()
+    }
+
+
+async def get_comparison(jobIds,
+                         group="",
+                         metric="",
+                         maxPoints=None,
+                         aggregate=False):
+    """
+    Compares a metric of multiple jobs (e.g. iterations or variants of a benchmark) on job level.
+
+    Measurements of all jobs are retrieved with one query per metric table and aligned on a common time axis relative to
+    the capture start of each job. Values of each node are grouped by buckets of the largest measurement interval of all
+    jobs and combined across nodes like the job level (see `_create_aligned_query`).
+
+    :param jobIds: list of job IDs
+    :param group: group of metric
+    :param metric: metric name
+    :param maxPoints: maximum number of values per trace
+    :param aggregate: additionally return mean, min, max and standard deviation across all jobs per bucket
+    """
+    if not jobIds or not (group in METRICS) or not (metric in METRICS[group]):
+        raise httpErrors.BadRequest()
+
+    valkey_key = get_cache_key(jobIds=jobIds,
+                               group=group,
+                               metric=metric,
+                               maxPoints=maxPoints,
+                               aggregate=aggregate)
+    cache = await valkey.get(valkey_key)
+
+    if cache is not None:
+        return cache, 200
+
+    jobIds = list(dict.fromkeys(jobIds))
+    jobs = {
+        job["jobId"]: job
+        for job in mongodb.getMany("jobs", {"jobId": {
+            "$in": jobIds
+        }})
+    }
+    if len(jobs) != len(jobIds):
+        raise httpErrors.NotFound()
+
+    metricMeta = METRICS[group][metric]
+    metric_tables = list(metricMeta["metrics"].keys())
+
+    catalog = await clickhouse.execute_query(
+        _create_catalog_query(jobIds, metric_tables))
+
+    # time window per job, jobs without capture start start at their first measurement
+    windows = {}
+    levels = {}
+    for jobId in jobIds:
+        capture_start, capture_end = _get_capture_window(jobs[jobId])
+        entries = [
+            entry for entry in catalog if int(entry["job_id"]) == jobId
+            and _in_capture_window(entry, capture_start, capture_end)
+        ]
+        if not len(entries):
+            continue
+
+        windows[jobId] = (_datetime_to_unix_ms(capture_start)
+                          if capture_start is not None else min(
+                              int(entry["min_ts"]) for entry in entries),
+                          _datetime_to_unix_ms(capture_end)
+                          if capture_end is not None else None)
+        for entry in entries:
+            levels.setdefault(entry["table_name"],
+                              {}).setdefault(jobId, set()).add(entry["level"])
+
+    # common bucket width based on the largest interval and the longest job
+    interval = max(_get_job_interval(job) for job in jobs.values()) * 1000
+    bucket = interval
+    if maxPoints and len(windows):
+        now = _datetime_to_unix_ms(get_current_datetime())
+        duration = max((end if end is not None else now) - start
+                       for start, end in windows.values())
+        bucket = max(1, math.ceil(duration / maxPoints / interval)) * interval
+
+    aggregation_type = metricMeta[
+        "aggregation"] if "aggregation" in metricMeta else "avg"
+
+    queries = []
+    available_metric_tables = []
+    for metric_table in metric_tables:
+        table_levels = levels.get(metric_table, {})
+        if not len(table_levels):
+            continue
+
+        # use the highest level available for all jobs with measurements of this table
+        common_levels = set.intersection(*table_levels.values())
+        filter_level = "job" if "job" in common_levels else next_lower_aggregate(
+            sorted(common_levels, key=lambda l: -LEVEL_MAPPING[l]), "job")
+        if filter_level is None:
+            continue
+
+        queries.append(
+            _create_comparison_query(
+                {jobId: windows[jobId]
+                 for jobId in table_levels}, metric_table, filter_level,
+                aggregation_type, bucket))
+        available_metric_tables.append(metric_table)
+
+    all_records = await clickhouse.execute_queries(queries,
+                                                   dtypes={
+                                                       "job_id": np.int64,
+                                                       "val": np.float64,
+                                                       "ts_ms": np.int64
+                                                   })
+
+    # align values of all jobs on a common grid of buckets, missing buckets are NaN
+    row_jobIds = np.array(sorted(windows), dtype=np.int64)
+    series = []
+    for metric_table, records in zip(available_metric_tables, all_records):
+        if not len(records) or not len(records["ts_ms"]):
+            continue
+
+        # offset of the buckets relative to the start of each job
+        starts = np.array([windows[jobId][0] for jobId in row_jobIds.tolist()],
+                          dtype=np.int64)
+        rows = np.searchsorted(row_jobIds, records["job_id"])
+        positions = (records["ts_ms"] - starts[rows]) // bucket
+        matrix = np.full((len(row_jobIds), positions.max() + 1), np.nan)
+        matrix[rows, positions] = records["val"]
+        series.append((metric_table, matrix))
+
+    unit = metricMeta["unit"] if "unit" in metricMeta else ""
+    display_unit, conversion_unit = unit, None
+    if len(series):
+        display_unit, conversion_unit = _get_display_unit(
+            unit, np.concatenate([matrix.ravel() for _, matrix in series]))
+
+    traces = []
+    aggregates = []
+    for metric_table, matrix in series:
+        if conversion_unit:
+            matrix = _convert_values(matrix, unit, conversion_unit)
+
+        metricEntry = metricMeta["metrics"][metric_table]
+        raw_name = metricEntry["name"] if isinstance(
+            metricEntry, dict) and "name" in metricEntry else metricEntry
+
+        for jobId, values in zip(row_jobIds.tolist(), matrix):
+            valid = values[~np.isnan(values)]
+            if not len(valid):
+                continue
+
+            job = jobs[jobId]
+            name = f"{raw_name} {jobId}"
+            traces.append({
+                "jobId": jobId,
+                "group": group,
+                "metric": metric,
+                "level": "job",
+                "name": name,
+                "rawName": raw_name,
+                "table": metric_table,
+                "variant": job["configuration"]["jobscript"]["variantName"]
+                if not ("cli" in job) or not job["cli"] else None,
+                "iteration": job["iteration"] if "iteration" in job else None,
+                "start": 0,
+                "interval": bucket / 1000,
+                "unit": display_unit,
+                "rawUnit": unit,
+                "values": _nan_to_none(values),
+                "statistics": calculate_statistics(valid),
+                "uid": _sanitize_uid(f"{metric_table}-{jobId}-compare-{name}")
+            })
+
+        if aggregate:
+            aggregates.append({
+                "table": metric_table,
+                "name": raw_name,
+                "unit": display_unit,
+                "interval": bucket / 1000,
+                "values": _calculate_comparison_statistics(matrix)
+            })
+
+    result = {"traces": traces}
+    if aggregate:
+        result["aggregates"] = aggregates
+
+    # prevent caching of unfinished jobs
+    if all(_job_cacheable(job) for job in jobs.values()):
+        await valkey.set(valkey_key, result, jobIds=jobIds)
+
+    return result, 200
+
+
+def _create_heatmap(records, level, bucket):
+    """
+    Arranges the cells of a heatmap query (see `_create_heatmap_query`) as matrix of series x time buckets.
+
+    Series are ordered by node and level, time buckets are contiguous from the first bucket on. Missing cells are NaN.
+
+    :return: labels of the rows (node and level per row), timestamps of the columns (unix milliseconds) and cells
+    """
+    nodes, node_idx = np.unique(records["node"].astype(str), return_inverse=True)
+    if level == "node":
+        row_idx = node_idx
+        rows = {"node": nodes.tolist()}
+    else:
+        ids, id_idx = np.unique(records[level], return_inverse=True)
+        keys, row_idx = np.unique(node_idx * len(ids) + id_idx,
+                                  return_inverse=True)
+        rows = {
+            "node": nodes[keys // len(ids)].tolist(),
+            level: ids[keys % len(ids)].tolist()
+        }
+
+    ts = records["ts_ms"]
+    col_idx = (ts - ts.min()) // bucket
+    timestamps = ts.min() + np.arange(col_idx.max() + 1) * bucket
 
-    if any(map(unit.lower().__contains__, CONVERTABLE_UNITS)):
-        # calculate median of all non-zero values to establish a sensible unit for conversion
-        allValues = []
-        for res in traces:
-            allValues.extend(res["values"])
+    cells = np.full((row_idx.max() + 1, len(timestamps)), np.nan)
+    cells[row_idx, col_idx] = records["val"]
+    return rows, timestamps, cells
 
-        if len(allValues):
-            is_byte = "byte" in unit
-            non_zero_values = [v for v in allValues if v != 0]
 
-            if len(non_zero_values):
-                max_value = np.max(non_zero_values)
+async def get_heatmap(jobId, group, metric, level, node="", maxPoints=None):
+    """
+    Returns a metric as heatmap, a matrix of series (e.g. all threads of all nodes) x time buckets.
 
-                [_, u] = human_size_mem(max_value) if is_byte else human_size(
-                    max_value)
+    Values are aggregated per series and time bucket in ClickHouse. Cells are returned row-major as base64 encoded
+    typed array (little-endian float32, NaN if missing), rows and columns are labeled explicitly.
 
-                if is_byte:
-                    unit = f"{u}/s" if per_second else u
-                else:
-                    unit = f"{u.upper()}{unit.upper().replace('/S', '')}{'/s' if per_second else ''}"
-                conversion_unit = u
+    :param level: aggregation level of the series, all levels except job
+    :param node: restrict to node, series of all nodes by default
+    :param maxPoints: maximum number of time buckets (default HEATMAP_MAX_BUCKETS)
+    """
+    if not (group in METRICS) or not (metric in METRICS[group]) or not (
+            level in LEVEL_MAPPING) or level == "job":
+        raise httpErrors.BadRequest()
 
-    values_by_metric = {}
-    # apply conversion and calculate statistics for each trace
-    for entry in traces:
-        if conversion_unit:
-            entry["rawValues"] = entry["values"]
-            entry["values"] = [
-                human_size_mem_fixed(v, conversion_unit) if "byte"
-                in entry["unit"] else human_size_fixed(v, conversion_unit)
-                for v in entry["values"]
-            ]
-        entry["statistics"] = calculate_statistics(entry["values"])
-        entry["unit"] = unit
+    job = mongodb.getOne("jobs", {"jobId": jobId})
+    if job is None:
+        raise httpErrors.NotFound()
 
-        values_by_metric.setdefault(entry["rawName"],
-                                    []).append(entry["values"])
+    metricMeta = METRICS[group][metric]
+    metric_tables = list(metricMeta["metrics"].keys())
+    aggregation_type = metricMeta[
+        "aggregation"] if "aggregation" in metricMeta else "avg"
+
+    async def _calculate():
+        capture_start, capture_end = _get_capture_window(job)
+        catalog = await clickhouse.execute_query(
+            _create_catalog_query([jobId], metric_tables, node))
+        all_levels = _get_available_levels(catalog, jobId, metric_tables,
+                                           level, node, capture_start,
+                                           capture_end)
+
+        # buckets are at least the measurement interval, long jobs are loaded from rollups
+        resolution, bucket = _plan_resolution(
+            _get_bucket(job, capture_start, capture_end, maxPoints or
+                        HEATMAP_MAX_BUCKETS))
+        bucket = bucket or _get_job_interval(job) * 1000
+
+        tables = []
+        queries = []
+        for table in metric_tables:
+            if not all_levels.get(table):
+                continue
+            filter_level = _get_filter_level(list(all_levels[table].keys()),
+                                             level)
+            tables.append(table)
+            queries.append(
+                _create_heatmap_query(jobId, table, level, filter_level, node,
+                                      aggregation_type, capture_start,
+                                      capture_end, bucket, resolution))
+
+        all_records = await clickhouse.execute_queries(
+            queries, dtypes=_column_types(level))
+
+        heatmaps = []
+        for table, records in zip(tables, all_records):
+            if not len(records) or not len(records["ts_ms"]):
+                continue
 
-    # calculate statistics across all traces of same type - only used when level < node
-    statistics = {}
-    for key, values in values_by_metric.items():
-        combined = list(zip(*values))
-        statistics[key] = {
-            "values": {
-                "min": [np.min(i) for i in combined],
-                "max": [np.max(i) for i in combined],
-                "avg": [np.mean(i) for i in combined]
+            rows, timestamps, cells = _create_heatmap(records, level, bucket)
+            metricEntry = metricMeta["metrics"][table]
+            heatmaps.append({
+                "table":
+                table,
+                "name":
+                metricEntry["name"] if isinstance(metricEntry, dict)
+                and "name" in metricEntry else metricEntry,
+                "rows":
+                rows,
+                "timestamps":
+                timestamps,
+                "cells":
+                cells
+            })
+
+        unit = metricMeta["unit"] if "unit" in metricMeta else ""
+        conversion_unit = None
+        if len(heatmaps):
+            unit, conversion_unit = _get_display_unit(
+                unit, np.concatenate([h["cells"].ravel() for h in heatmaps]))
+
+        for heatmap in heatmaps:
+            cells = heatmap["cells"]
+            if conversion_unit:
+                cells = _convert_values(cells, metricMeta.get("unit", ""),
+                                        conversion_unit)
+            finite = cells[~np.isnan(cells)]
+            heatmap.update({
+                "shape": list(cells.shape),
+                "min": float(finite.min()) if len(finite) else None,
+                "max": float(finite.max()) if len(finite) else None,
+                "timestamps": _encode_array(heatmap["timestamps"], "<f8"),
+                "cells": _encode_array(cells, "<f4")
+            })
+
+        return {
+            "jobId": jobId,
+            "group": group,
+            "metric": metric,
+            "level": level,
+            "node": node,
+            "interval": bucket / 1000,
+            "unit": unit,
+            "encoding": {
+                "cells": "float32",
+                "timestamps": "float64",
+                "byteOrder": "little",
+                "order": "row-major"
             },
-            "general":
-            calculate_statistics(list(itertools.chain.from_iterable(values)))
+            "heatmaps": heatmaps
         }
 
-    return {"traces": traces, "statistics": statistics}
+    return await valkey.get_or_compute(get_cache_key(group=group,
+                                                     metric=metric,
+                                                     level=level,
+                                                     node=node,
+                                                     maxPoints=maxPoints),
+                                       _calculate,
+                                       jobIds=[jobId],
+                                       cacheable=_job_cacheable(job)), 200
+
+
+async def get_histogram(jobIds,
+                        group,
+                        metric,
+                        level,
+                        node="",
+                        bins=None,
+                        adaptive=False):
+    """
+    Returns the distribution of the values of a metric within the capture window of one or more jobs as histogram.
 
+    Values are the values of all series of the level per timestamp (see `get_measurements`) and are counted in
+    ClickHouse. Bins are shared by all jobs (identical width between the minimum and maximum of all jobs) to compare
+    distributions, adaptive bins are determined per job.
 
-async def get_measurements(jobId,
-                           group="",
-                           metric="",
-                           level="",
-                           node="",
-                           deciles=False):
+    :param jobIds: list of job IDs
+    :param bins: number of bins (default HISTOGRAM_BINS)
+    :param adaptive: bins adapt to the distribution of each job (ClickHouse `histogram`)
     """
-    Returns calculated metrics based on filters.
+    if not jobIds or not (group in METRICS) or not (
+            metric in METRICS[group]) or not (level in LEVEL_MAPPING):
+        raise httpErrors.BadRequest()
 
-    :param jobId: ID of job
-    :param group: group of metric
-    :param metric: metric name
-    :param level: aggregation level
-    :param node: node
-    """
-    valkey_key = get_request_uri()
-    cache = valkey.get(valkey_key)
+    jobIds = list(dict.fromkeys(jobIds))
+    jobs = {
+        job["jobId"]: job
+        for job in mongodb.getMany("jobs", {"jobId": {
+            "$in": jobIds
+        }})
+    }
+    if len(jobs) != len(jobIds):
+        raise httpErrors.NotFound()
 
-    if cache is not None:
-        return cache, 200
+    bins = bins or HISTOGRAM_BINS
+    metricMeta = METRICS[group][metric]
 
-    result = await calculate_metrics(jobId, group, metric, level, node,
-                                     deciles)
+    async def _calculate():
+        catalog = await clickhouse.execute_query(
+            _create_catalog_query(jobIds, metricMeta["metrics"].keys(),
+                                  node if level != "job" else None))
+
+        # queries of all series of the level per job and table, identical to the traces of `calculate_metrics`
+        entries = []
+        for jobId in jobIds:
+            plan = _plan_metrics(jobs[jobId], group, metric, level, node,
+                                 False, None, catalog)
+            if plan is not None:
+                entries.extend((jobId, table, query) for table, query in zip(
+                    plan["tables"], plan["queries"]))
+
+        tables = list(dict.fromkeys(table for _, table, _ in entries))
+
+        # lower bound and width of the bins shared by all jobs per table
+        ranges = {}
+        if not adaptive and len(tables):
+            all_ranges = await clickhouse.execute_queries(
+                [
+                    _create_range_query(
+                        [q for _, t, q in entries if t == table])
+                    for table in tables
+                ],
+                dtypes={
+                    "val_min": np.float64,
+                    "val_max": np.float64
+                })
+            for table, records in zip(tables, all_ranges):
+                if len(records) and len(records["val_min"]):
+                    lower = records["val_min"][0]
+                    ranges[table] = (lower,
+                                     (records["val_max"][0] - lower) / bins
+                                     or 1.0)
+
+        if not adaptive:
+            entries = [entry for entry in entries if entry[1] in ranges]
+
+        all_records = await clickhouse.execute_queries(
+            [
+                _create_histogram_query(query, bins, *ranges.get(table, ()))
+                for _, table, query in entries
+            ],
+            dtypes={
+                "bin": np.int64,
+                "bin_count": np.float64,
+                "lower": np.float64,
+                "upper": np.float64
+            })
 
-    if result is None: raise httpErrors.NotFound()
+        histograms = []
+        for (jobId, table, _), records in zip(entries, all_records):
+            if not len(records) or not len(records["bin_count"]):
+                continue
 
-    # prevent caching of unfinished jobs
-    if jobs_cacheable([jobId]):
-        valkey.set(valkey_key, result)
+            if adaptive:
+                lower = records["lower"]
+                upper = records["upper"]
+                counts = records["bin_count"]
+            else:
+                start, width = ranges[table]
+                lower = start + np.arange(bins) * width
+                upper = lower + width
+                counts = np.zeros(bins)
+                counts[records["bin"]] = records["bin_count"]
+
+            metricEntry = metricMeta["metrics"][table]
+            histograms.append({
+                "jobId":
+                jobId,
+                "table":
+                table,
+                "name":
+                metricEntry["name"] if isinstance(metricEntry, dict)
+                and "name" in metricEntry else metricEntry,
+                "lower":
+                lower,
+                "upper":
+                upper,
+                "counts":
+                counts,
+                "total":
+                float(counts.sum())
+            })
 
-    return result, 200
+        # identical display unit for all histograms to compare the bins
+        unit = metricMeta["unit"] if "unit" in metricMeta else ""
+        conversion_unit = None
+        if len(histograms):
+            unit, conversion_unit = _get_display_unit(
+                unit,
+                np.concatenate([h["upper"] for h in histograms] +
+                               [h["lower"] for h in histograms]))
+
+        for histogram in histograms:
+            for key in ["lower", "upper"]:
+                if conversion_unit:
+                    histogram[key] = _convert_values(
+                        histogram[key], metricMeta.get("unit", ""),
+                        conversion_unit)
+                histogram[key] = histogram[key].tolist()
+            histogram["counts"] = histogram["counts"].tolist()
+
+        return {
+            "group": group,
+            "metric": metric,
+            "level": level,
+            "node": node,
+            "bins": bins,
+            "adaptive": adaptive,
+            "unit": unit,
+            "histograms": histograms
+        }
+
+    return await valkey.get_or_compute(
+        get_cache_key(jobIds=jobIds,
+                      group=group,
+                      metric=metric,
+                      level=level,
+                      node=node,
+                      bins=bins,
+                      adaptive=adaptive),
+        _calculate,
+        jobIds=jobIds,
+        cacheable=all(_job_cacheable(job) for job in jobs.values())), 200
 
 
 async def export_json(jobId,
@@ -560,7 +2144,7 @@ async def export_json(jobId,
     result = await calculate_metrics(jobId, group, metric, level, node,
                                      deciles)
     if result is None: raise httpErrors.NotFound()
-    json_content = jsonify(result).data
+    json_content = jsonify(_without_timestamps(result)).data
     filename = f"{jobId}_{group}.json"
     return Response(
         json_content,
@@ -579,40 +2163,205 @@ async def export_csv(jobId,
             # Temporarily set the level to job, if level is not given either
             level = "job"
 
-        all_csv_content = []
-        for group_key in METRICS:
-            for metric_key in METRICS[group_key]:
-                result = await calculate_metrics(jobId, group_key, metric_key,
-                                                 level, node, deciles)
+        if mongodb.getOne("jobs", {"jobId": jobId}) is None:
+            raise httpErrors.NotFound()
+
+        # errors can not be returned once streaming started, check for measurements beforehand
+        if not len(await clickhouse.execute_query(
+                _create_catalog_query([jobId]))):
+            raise httpErrors.NotFound()
+
+        metrics = [(group_key, metric_key) for group_key in METRICS
+                   for metric_key in METRICS[group_key]]
+        filename = f"{jobId}_all_metrics_{level}.csv"
+
+        return Response(
+            stream_with_context(
+                _stream_csv(jobId, metrics, level, node, deciles)),
+            mimetype="text/csv",
+            headers={"Content-disposition": f"attachment; filename={filename}"})
+
+    if not level:
+        raise httpErrors.BadRequest(
+            "Level is required for single metric export")
+    result = await calculate_metrics(jobId, group, metric, level, node,
+                                     deciles)
+    if result is None: raise httpErrors.NotFound()
+
+    filename = f"{jobId}_{group}_{metric}_{level}.csv"
+
+    return Response(
+        generate_csv(result),
+        mimetype="text/csv",
+        headers={"Content-disposition": f"attachment; filename={filename}"})
+
+
+def _stream_csv(jobId, metrics, level, node, deciles):
+    """
+    Generates the CSV of multiple metrics, yielding the rows of each metric as soon as it is calculated.
+
+    Flask consumes the generator of a streamed response after the view returned and the event loop of the view was
+    closed, metrics are therefore calculated in a dedicated event loop of the generator (at most EXPORT_CONCURRENCY at
+    once). Only results of finished, not yet yielded metrics are kept in memory.
+
+    :param metrics: list of (group, metric)
+    """
+    loop = asyncio.new_event_loop()
+    pending = set()
+    try:
+        semaphore = asyncio.Semaphore(EXPORT_CONCURRENCY)
+
+        async def _calculate(group, metric):
+            async with semaphore:
+                return await calculate_metrics(jobId, group, metric, level,
+                                               node, deciles)
+
+        pending = {
+            loop.create_task(_calculate(group, metric),
+                             name=f"{group}:{metric}")
+            for group, metric in metrics
+        }
+
+        include_header = True
+        while pending:
+            done, pending = loop.run_until_complete(
+                asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED))
+            for task in done:
+                # the response status is already sent, failed metrics are omitted like metrics without values
+                try:
+                    result = task.result()
+                except Exception as e:
+                    logger.error("Export of metric %s of job %s failed.\n %s",
+                                 task.get_name(), jobId, format_error(e))
+                    continue
                 if result is None or not result["traces"]:
                     continue
 
-                # Include header only for the first metric
-                include_header = len(all_csv_content) == 0
+                # include header only for the first metric, metrics are separated by a newline
                 csv_content = generate_csv(result,
                                            include_header=include_header)
-                all_csv_content.append(csv_content)
+                yield csv_content if include_header else f"\n{csv_content}"
+                include_header = False
+    finally:
+        # client disconnected
+        for task in pending:
+            task.cancel()
+        if pending:
+            loop.run_until_complete(
+                asyncio.gather(*pending, return_exceptions=True))
+        loop.close()
 
-        if not all_csv_content:
-            raise httpErrors.NotFound()
 
-        final_csv_content = "\n".join(all_csv_content)
-        filename = f"{jobId}_all_metrics_{level}.csv"
+def _create_export_query(jobId, tables, columns, level="", node="",
+                        capture_start=None, capture_end=None) -> str:
+    """
+    Creates query returning the raw measurements of multiple tables with identical, typed columns.
+
+    Topology and device columns are NULL for tables without them.
+
+    :param tables: metric tables
+    :param columns: names of the topology and device columns per table
+    """
+    filters = [f"job_id='{jobId}'"]
+    if level:
+        filters.append(f"level='{level}'")
+    if node:
+        filters.append(f"node='{node}'")
+    if capture_start:
+        filters.append(f"ts >= '{capture_start.replace(tzinfo=None).isoformat()}'")
+    if capture_end:
+        filters.append(f"ts <= '{capture_end.replace(tzinfo=None).isoformat()}'")
+
+    types = {
+        "thread": "Nullable(UInt16)",
+        "core": "Nullable(UInt16)",
+        "numa": "Nullable(UInt8)",
+        "socket": "Nullable(UInt8)",
+        "device": "Nullable(String)"
+    }
+
+    queries = []
+    for table in tables:
+        optional_columns = ", ".join(
+            f"CAST({f'{table}.{name}' if name in columns.get(table, []) else 'NULL'}, '{type}') as {name}"
+            for name, type in types.items())
+        # columns are qualified as the aliases are identical to the column names
+        queries.append(
+            f"SELECT '{table}' as table_name, ts, node, level, {optional_columns}, toFloat64({table}.value) as value "
+            f"FROM {table} WHERE {' and '.join(filters)}")
+
+    return " UNION ALL ".join(queries)
+
+
+async def export_binary(jobId,
+                        group="",
+                        metric="",
+                        level="",
+                        node="",
+                        format="parquet"):
+    """
+    Exports the raw measurements of a job as Parquet or Arrow file with typed columns
+    (table_name, ts, node, level, thread, core, numa, socket, device, value), compressed with zstd.
+
+    The file is created by ClickHouse and streamed to the client without processing the measurements in the backend.
+
+    :param jobId: ID of job
+    :param group: group of metric (all metrics if not specified)
+    :param metric: metric name (all metrics of group if not specified)
+    :param level: level of the measurements (all levels if not specified)
+    :param node: node (all nodes if not specified)
+    :param format: parquet or arrow
+    """
+    if format not in EXPORT_FORMATS or (group and not group in METRICS) or (
+            metric and (not group or not metric in METRICS[group])):
+        raise httpErrors.BadRequest()
+
+    job = mongodb.getOne("jobs", {"jobId": jobId})
+    if job is None:
+        raise httpErrors.NotFound()
 
+    if metric:
+        tables = list(METRICS[group][metric]["metrics"].keys())
+    elif group:
+        tables = list(
+            dict.fromkeys(table for metric_key in METRICS[group]
+                          for table in METRICS[group][metric_key]["metrics"]))
     else:
-        if not level:
-            raise httpErrors.BadRequest(
-                "Level is required for single metric export")
-        result = await calculate_metrics(jobId, group, metric, level, node,
-                                         deciles)
-        if result is None: raise httpErrors.NotFound()
+        tables = METRIC_TABLES
+
+    # only query tables with measurements of this job
+    capture_start, capture_end = _get_capture_window(job)
+    catalog = await clickhouse.execute_query(
+        _create_catalog_query([jobId], tables, node))
+    available = set(entry["table_name"] for entry in catalog
+                    if (not level or entry["level"] == level)
+                    and _in_capture_window(entry, capture_start, capture_end))
+    tables = [table for table in tables if table in available]
+    if not len(tables):
+        raise httpErrors.NotFound()
 
-        final_csv_content = generate_csv(result)
-        filename = f"{jobId}_{group}_{metric}_{level}.csv"
+    table_names = ", ".join(f"'{t}'" for t in tables)
+    columns = {}
+    for entry in await clickhouse.execute_query(
+            "SELECT table, name FROM system.columns WHERE database = currentDatabase() "
+            f"and table IN ({table_names}) and name IN ('thread', 'core', 'numa', 'socket', 'device')"
+    ):
+        columns.setdefault(entry["table"], []).append(entry["name"])
 
+    output_format, settings, mimetype = EXPORT_FORMATS[format]
+    try:
+        content = clickhouse.stream(
+            _create_export_query(jobId, tables, columns, level, node,
+                                 capture_start, capture_end), output_format,
+            settings)
+    except cdb.ClickHouseHttpError as e:
+        logger.error("Export failed: %s", e)
+        raise httpErrors.InternalServerError()
+
+    filename = f"{jobId}{f'_{group}' if group else ''}{f'_{metric}' if metric else ''}.{format}"
     return Response(
-        final_csv_content,
-        mimetype="text/csv",
+        content,
+        mimetype=mimetype,
         headers={"Content-disposition": f"attachment; filename={filename}"})
 
 
@@ -655,12 +2404,8 @@ async def _get_statistics_rows(jobId, group="", metric="", level="", node=""):
     if not jobId:
         raise httpErrors.BadRequest("jobId is required")
 
-    result, _ = await get_measurements(jobId=jobId,
-                                       group=group,
-                                       metric=metric,
-                                       level=level,
-                                       node=node,
-                                       deciles=False)
+    result = await calculate_metrics(jobId, group, metric, level, node,
+                                     False)
 
     traces = result.get("traces", [])
     if not traces:
@@ -750,78 +2495,226 @@ async def export_statistics_csv(jobId, group="", metric="", level="", node=""):
     )
 
 
-async def calculate_energy(jobId):
+def _create_energy_query(metric_table, jobs) -> str:
+    """
+    Creates query to integrate the power of multiple jobs on job level.
+
+    The energy is the sum of all values multiplied with the measurement interval, identical to the integral of the job
+    level traces of `_create_query` with one value per node and interval.
+
+    :param jobs: filter level, capture start and capture end per job ID
     """
-    Calculates energy usage metrics for a given job.
+    job_filters = []
+    for jobId, (filter_level, capture_start, capture_end) in jobs.items():
+        filters = [f"job_id='{jobId}'", f"level='{filter_level}'"]
+        if capture_start:
+            filters.append(
+                f"ts >= '{capture_start.replace(tzinfo=None).isoformat()}'")
+        if capture_end:
+            filters.append(
+                f"ts <= '{capture_end.replace(tzinfo=None).isoformat()}'")
+        job_filters.append(f"({' and '.join(filters)})")
+
+    jobIds = ", ".join(str(x) for x in jobs)
+    return (
+        f"SELECT job_id, sum(value) as val_sum FROM {metric_table} "
+        f"WHERE job_id IN ({jobIds}) and ({' or '.join(job_filters)}) GROUP BY job_id"
+    )
+
+
+async def _calculate_energy(jobs):
+    """
+    Calculates the energy consumption (kWh) of multiple jobs with one aggregate query per power metric.
 
     Total energy consumption is an estimate based on the sum of all subsystems excluding core power and the system power itself.
     This is necessary as, depending on the platform, system power does not include certain subsystems like for example GPU.
 
+    :param jobs: job documents
+    :return: energy consumption per subsystem (None if not measured) per job ID
+    """
+    jobIds = [job["jobId"] for job in jobs]
+    windows = {job["jobId"]: _get_capture_window(job) for job in jobs}
+    # measurement interval in seconds
+    intervals = {job["jobId"]: _get_job_interval(job) for job in jobs}
+
+    tables = {}
+    for energy_metric in ENERGY_METRICS:
+        for metric_table in METRICS["energy"][energy_metric]["metrics"]:
+            tables[metric_table] = energy_metric.split()[0].lower()
+
+    result = {jobId: dict.fromkeys(tables.values()) for jobId in jobIds}
+
+    catalog = await clickhouse.execute_query(
+        _create_catalog_query(jobIds, tables.keys()))
+
+    queries = []
+    for metric_table in tables:
+        table_jobs = {}
+        for jobId in jobIds:
+            levels = list(
+                _get_available_levels(catalog, jobId, [metric_table], "job",
+                                      None, *windows[jobId]).get(
+                                          metric_table, {}).keys())
+            if not len(levels):
+                continue
+
+            filter_level = "job" if "job" in levels else next_lower_aggregate(
+                levels, "job")
+            table_jobs[jobId] = (filter_level, *windows[jobId])
+
+        if len(table_jobs):
+            queries.append(
+                (metric_table, _create_energy_query(metric_table,
+                                                    table_jobs)))
+
+    all_records = await clickhouse.execute_queries([q for _, q in queries])
+
+    for (metric_table, _), records in zip(queries, all_records):
+        key = tables[metric_table]
+        for record in records:
+            jobId = int(record["job_id"])
+            if result[jobId][key] is not None:
+                continue
+
+            result[jobId][key] = round(
+                float(record["val_sum"]) * intervals[jobId] / 3600 / 1000, 3)
+
+    return result
+
+
+async def calculate_energy(jobId):
+    """
+    Calculates energy usage metrics for a given job (see `_calculate_energy`).
+
     :param jobId: ID of job
     """
+    job = mongodb.getOne("jobs", {"jobId": jobId})
 
-    result = {}
-    energy_metrics = [
-        "CPU Power", "Core Power", "DRAM Power", "FPGA Power", "GPU Power",
-        "System Power"
-    ]
+    if job is None:
+        raise httpErrors.NotFound()
+
+    async def _calculate():
+        result = await _calculate_energy([job])
+        return result[jobId]
+
+    # prevent caching of unfinished jobs
+    result = await valkey.get_or_compute(f"{ENERGY_CACHE_PREFIX}{jobId}",
+                                         _calculate,
+                                         jobIds=[jobId],
+                                         cacheable=_job_cacheable(job))
 
-    tasks = [
-        calculate_metrics(jobId, "energy", energy_metric, "job", "", False)
-        for energy_metric in energy_metrics
+    return result, 200
+
+
+async def get_energy(runNrs=None, jobIds=None):
+    """
+    Returns the energy consumption and runtime of all jobs of the specified benchmarks or jobs.
+
+    Cached results are reused, the energy of all remaining jobs is calculated at once (see `_calculate_energy`).
+
+    :param runNrs: list of benchmark run numbers
+    :param jobIds: list of job IDs
+    """
+    if not runNrs and not jobIds:
+        raise httpErrors.BadRequest("Either runNrs or jobIds is required")
+
+    user = get_user_from_token()
+    if user is None:
+        raise httpErrors.Forbidden()
+
+    # restrict to benchmarks accessible by the user
+    benchmark_filter = create_user_benchmark_filter(user)
+    accessible_runs = [
+        b["runNr"]
+        for b in mongodb.getMany("benchmarks", benchmark_filter, {"runNr": True})
     ]
-    responses = await asyncio.gather(*tasks, return_exceptions=True)
 
-    for energy_metric, power_json in zip(energy_metrics, responses):
-        key = energy_metric.split()[0].lower()
-        try:
-            if "traces" in power_json and len(power_json["traces"]) > 0:
-                interval = power_json["traces"][0]["interval"] / 3600 / 1000
-                values = power_json["traces"][0]["values"]
-                energy_usage = round(sum(values) * interval, 3)
-            else:
-                energy_usage = None
+    job_filter = {"runNr": {"$in": accessible_runs}}
+    if runNrs:
+        job_filter = {"runNr": {"$in": list(set(runNrs) & set(accessible_runs))}}
+    if jobIds:
+        job_filter["jobId"] = {"$in": jobIds}
 
-        except Exception as e:
-            logger.error(f"Error processing {energy_metric}: {e}")
-            energy_usage = None
+    jobs = sorted(mongodb.getMany("jobs", job_filter, {"_id": False}) or [],
+                  key=lambda job: job["jobId"])
 
-        result[key] = energy_usage
+    energy = {}
+    for job in jobs:
+        cached = await valkey.get(f"{ENERGY_CACHE_PREFIX}{job['jobId']}")
+        if cached is not None:
+            energy[job["jobId"]] = cached
+
+    pending = [job for job in jobs if job["jobId"] not in energy]
+    if len(pending):
+        energy.update(await _calculate_energy(pending))
+
+        # prevent caching of unfinished jobs
+        for job in pending:
+            if _job_cacheable(job):
+                await valkey.set(f"{ENERGY_CACHE_PREFIX}{job['jobId']}",
+                                 energy[job["jobId"]],
+                                 jobIds=[job["jobId"]])
+
+    result = []
+    for job in jobs:
+        capture_start, capture_end = _get_capture_window(job)
+        runtime = (capture_end - capture_start).total_seconds(
+        ) if capture_start and capture_end else None
+        result.append({
+            "jobId": job["jobId"],
+            "runNr": job["runNr"],
+            "runtime": runtime,
+            "energy": energy[job["jobId"]]
+        })
+
+    return {"jobs": result}, 200
 
-    return result, 200
 
+def _get_cache_key(path, params):
+    """
+    Returns a canonical cache key of path and parsed parameters.
+
+    Parameters are sorted by name and unset parameters are omitted, hence requests which differ only in parameter
+    order, defaults or formatting of values share an entry. The order of list values is retained.
+    """
+    def _format(value):
+        if isinstance(value, bool):
+            return str(value).lower()
+        if isinstance(value, (list, tuple)):
+            return ",".join(_format(v) for v in value)
+        return str(value)
+
+    query = urlencode([(key, _format(value))
+                       for key, value in sorted(params.items())
+                       if value not in (None, "", False, [])])
+    return f"{path}?{query}" if query else path
 
-def get_request_uri():
-    uri = request.path
-    if (request.query_string):
-        uri += f"?{request.query_string.decode()}"
-    return uri
+
+def get_cache_key(**params):
+    """Returns the canonical cache key of the current request with the parsed parameters of the view"""
+    return _get_cache_key(request.path, params)
+
+
+def _job_cacheable(job):
+    """Results of a job can be cached once the job reached a final state"""
+    if not ("jobInfo" in job) or (job["jobInfo"] is None) or not (
+            "jobState" in job["jobInfo"]):
+        return False
+    state = job["jobInfo"]["jobState"]
+    cacheable_job_states = ["FAILED", "COMPLETED", "CANCELLED", "TIMEOUT"]
+    return any(cacheable_state in state
+               for cacheable_state in cacheable_job_states)
 
 
 def jobs_cacheable(jobIds):
-    cacheable = True
     job_data = mongodb.getMany("jobs", {"jobId": {"$in": jobIds}})
-
-    for job in job_data:
-        if not ("jobInfo" in job) or (
-                job["jobInfo"] is None) or not ("jobState" in job["jobInfo"]):
-            cacheable = False
-            break
-        state = job["jobInfo"]["jobState"]
-        cacheable_job_states = ["FAILED", "COMPLETED", "CANCELLED", "TIMEOUT"]
-        if not any(cacheable_state in state
-                   for cacheable_state in cacheable_job_states):
-            cacheable = False
-            break
-    return cacheable
+    return all(_job_cacheable(job) for job in job_data)
 
 
 async def get_available_metrics(jobId=None, jobIds=None, intersect=False):
     """
-    Check all available metrics and nodes by querying each table for a single entry containing the specified jobId.
+    Check all available metrics and nodes of the specified jobs with a single lookup in the measurement catalog.
     Assume homogeneous nodes and thus same metrics available for all of them.
-    Use INTERSECT ALL to combine to single query, however this requires checking for the existence of each table first.
-    Otherwise INTERSECT ALL will fail if any table is not present.
 
     :param jobId: ID of job
     :param jobIds: List of job IDs
@@ -831,8 +2724,8 @@ async def get_available_metrics(jobId=None, jobIds=None, intersect=False):
     if not jobId and not jobIds:
         return METRICS, 200
 
-    valkey_key = get_request_uri()
-    cache = valkey.get(valkey_key)
+    valkey_key = get_cache_key(jobId=jobId, jobIds=jobIds, intersect=intersect)
+    cache = await valkey.get(valkey_key)
 
     if cache is not None:
         return cache, 200
@@ -842,56 +2735,19 @@ async def get_available_metrics(jobId=None, jobIds=None, intersect=False):
     # prevent caching of unfinished jobs
     cacheable = jobs_cacheable(jobIds)
 
-    available_tables = []
-
-    # check which tables are currently present (may change during runtime as additional may be added)
-    res = await clickhouse.execute_query("SHOW TABLES")
-
-    for table in res:
-        available_tables.append(table["name"])
-
-    result = []
-    for jobId in jobIds:
-        job = mongodb.getOne("jobs", {"jobId": jobId})
-        raw_cs = job.get("captureStart") if job else None
-        raw_ce = job.get("captureEnd") if job else None
-        capture_start = iso8601_to_datetime(raw_cs) if isinstance(
-            raw_cs, str) else raw_cs
-        capture_end = iso8601_to_datetime(raw_ce) if isinstance(
-            raw_ce, str) else raw_ce
-
-        tableQueries = []
-        # query all present tables that are also part of the metric specification
-        for table in METRIC_TABLES:
-            if table not in available_tables:
-                continue
-
-            time_filters = []
-            if capture_start:
-                time_filters.append(f"ts >= '{capture_start.replace(tzinfo=None).isoformat()}'")
-            if capture_end:
-                time_filters.append(f"ts <= '{capture_end.replace(tzinfo=None).isoformat()}'")
-            time_clause = (" AND " +
-                           " AND ".join(time_filters)) if time_filters else ""
-
-            tableQueries.append(
-                f"SELECT DISTINCT '{table}' as table_name, node, level "
-                f"FROM {table} "
-                f"WHERE job_id='{jobId}'{time_clause}")
-        # instead of using single large query split into multiple smaller queries due to problems with clickhouse sometimes only returning partial results for very large queries
-        queries = []
-        for i in range(0, len(tableQueries), MAX_QUERY_COUNT):
-            chunk = tableQueries[i:i + MAX_QUERY_COUNT]
-            if len(chunk) == 1:
-                queries.append(chunk[0])
-            else:
-                queries.append(" UNION ALL ".join(chunk))
+    jobs = mongodb.getMany("jobs", {"jobId": {"$in": jobIds}}) or []
+    capture_windows = {job["jobId"]: _get_capture_window(job) for job in jobs}
 
-        logger.debug(f"QUERIES: {queries}")
+    # single lookup in measurement catalog for all jobs instead of scanning all metric tables
+    catalog = await clickhouse.execute_query(_create_catalog_query(jobIds))
 
-        jobResult = await clickhouse.execute_queries(queries)
+    entries = {}
+    for entry in catalog:
+        job_id = int(entry["job_id"])
+        if _in_capture_window(entry, *capture_windows.get(job_id, (None, None))):
+            entries.setdefault(job_id, []).append(entry)
 
-        result.append([x for xs in jobResult for x in xs])
+    result = [entries.get(int(jobId), []) for jobId in jobIds]
 
     aggregated = {}
 
@@ -949,12 +2805,12 @@ async def get_available_metrics(jobId=None, jobIds=None, intersect=False):
         response = aggregated[jobIds[0]]
         response["missing"] = [] if response["metrics"] else [jobIds[0]]
         if cacheable:
-            valkey.set(valkey_key, response)
+            await valkey.set(valkey_key, response, jobIds=jobIds)
         return response, 200
 
     if not intersect:
         if cacheable:
-            valkey.set(valkey_key, aggregated)
+            await valkey.set(valkey_key, aggregated, jobIds=jobIds)
         return aggregated, 200
 
     # skip empty jobs (invalid jobId, no measurements or broken database connection)
@@ -970,7 +2826,7 @@ async def get_available_metrics(jobId=None, jobIds=None, intersect=False):
     if not len(aggregated_metrics):
         response = {"metrics": {}, "nodes": [], "missing": skipped_jobs}
         if cacheable:
-            valkey.set(valkey_key, response)
+            await valkey.set(valkey_key, response, jobIds=jobIds)
         return response, 200
 
     # check that metrics are available in all jobs
@@ -1011,11 +2867,101 @@ async def get_available_metrics(jobId=None, jobIds=None, intersect=False):
         "missing": skipped_jobs
     }
     if cacheable:
-        valkey.set(valkey_key, response)
+        await valkey.set(valkey_key, response, jobIds=jobIds)
 
     return response, 200
 
 
+def _get_roofline_stats(flops, volumes, intervals):
+    """
+    Calculates the roofline points (peak, median, average and total) of multiple series at once.
+
+    A point is calculated for each measurement with FLOPS and memory volume > 0: operational intensity (FLOPs/byte) is
+    the number of FLOPs in the interval divided by the memory volume, performance is in GFLOPS/s. All series are
+    concatenated and reduced per series.
+
+    :param flops: FLOPS/s per series
+    :param volumes: memory volume (bytes per interval) per series
+    :param intervals: measurement interval (seconds) per series, None if unknown
+    :return: list of stats per series
+    """
+    zero = {"operational_intensity": 0.0, "performance": 0.0}
+    lengths = [
+        min(len(f), len(v)) if interval and interval > 0.0 else 0
+        for f, v, interval in zip(flops, volumes, intervals)
+    ]
+    series = np.repeat(np.arange(len(lengths)), lengths)
+    f = np.concatenate([np.empty(0)] +
+                       [x[:n] for x, n in zip(flops, lengths)])
+    byt = np.concatenate([np.empty(0)] +
+                         [x[:n] for x, n in zip(volumes, lengths)])
+    interval = np.asarray([x or 0.0 for x in intervals],
+                          dtype=np.float64)[series]
+
+    valid = (f > 0.0) & (byt > 0.0)
+    series, f, byt, interval = series[valid], f[valid], byt[valid], interval[
+        valid]
+
+    flops_i = f * interval  # FLOPs in interval
+    xs = flops_i / byt  # FLOPs/byte
+    ys = f / 1e9  # GFLOPS/s
+
+    count = np.bincount(series, minlength=len(lengths))
+    starts = np.concatenate(([0], np.cumsum(count)[:-1]))
+    total_flops = np.bincount(series, flops_i, minlength=len(lengths))
+    total_bytes = np.bincount(series, byt, minlength=len(lengths))
+    mean_x = np.bincount(series, xs, minlength=len(lengths)) / np.maximum(
+        count, 1)
+    mean_y = np.bincount(series, ys, minlength=len(lengths)) / np.maximum(
+        count, 1)
+
+    # points are ordered by series, stable sorts within series keep the first occurrence on ties (as np.argmax)
+    peak_idx = np.lexsort((-ys, series))[starts[count > 0]]
+
+    sorted_ys = ys[np.lexsort((ys, series))]
+    lower = sorted_ys[(starts + (count - 1) // 2)[count > 0]]
+    upper = sorted_ys[(starts + count // 2)[count > 0]]
+    y_med = np.zeros(len(lengths))
+    y_med[count > 0] = (lower + upper) / 2
+    # median point is the point closest to the median performance
+    med_idx = np.lexsort((np.abs(ys - y_med[series]), series))[starts[count > 0]]
+
+    stats = [None] * len(lengths)
+    for position, idx in enumerate(np.flatnonzero(count > 0)):
+        peak, med = peak_idx[position], med_idx[position]
+        total_time = intervals[idx] * count[idx]  # seconds
+        stats[idx] = {
+            "peak": {
+                "operational_intensity": float(xs[peak]),
+                "performance": float(ys[peak])
+            },
+            "median": {
+                "operational_intensity": float(xs[med]),
+                "performance": float(ys[med])
+            },
+            "average": {
+                "operational_intensity": float(mean_x[idx]),
+                "performance": float(mean_y[idx])
+            },
+            # global operational intensity and performance
+            "total": {
+                "operational_intensity":
+                float(total_flops[idx] / total_bytes[idx]),
+                "performance":
+                float(total_flops[idx] / total_time / 1e9)
+            }
+        }
+
+    return [
+        x if x is not None else {
+            "peak": zero,
+            "median": zero,
+            "average": zero,
+            "total": zero
+        } for x in stats
+    ]
+
+
 async def get_roofline(jobIds=None):
     """
     Returns Roofline metrics for jobIds
@@ -1035,26 +2981,11 @@ async def get_roofline(jobIds=None):
         if s.strip()
     ]
 
-    valkey_key = get_request_uri()
-    cache = valkey.get(valkey_key)
+    valkey_key = get_cache_key(jobIds=job_Ids)
+    cache = await valkey.get(valkey_key)
     if cache is not None:
         return cache, 200
 
-    def _safe_float(v):
-        if v is None:
-            return None
-        if isinstance(v, (int, float)):
-            return float(v)
-        if isinstance(v, str):
-            s = v.strip()
-            if not s:
-                return None
-            try:
-                return float(s)
-            except Exception:
-                return None
-        return None
-
     def _pick_trace(traces, want_name):
         for t in traces or []:
             if t.get("name") == want_name:
@@ -1066,184 +2997,119 @@ async def get_roofline(jobIds=None):
 
     def _pick_raw_values(trace):
         if not trace:
-            return []
+            return np.empty(0)
         vals = trace.get("rawValues")
         if not isinstance(vals, list):
             vals = trace.get("values", [])
-        out = []
-        for v in vals:
-            fv = _safe_float(v)
-            if fv is not None:
-                out.append(fv)
-        return out
+        return np.asarray(vals, dtype=np.float64)
 
     def _pick_volume_raw_values(trace):
         if not trace:
-            return []
+            return np.empty(0)
         if isinstance(trace.get("rawValues"), list):
             return _pick_raw_values(trace)
         vals = _pick_raw_values(trace)
         unit = (trace.get("unit") or "").strip().lower()
         if unit in ("gb", "gbytes", "gbyte", "gib", "gibibyte"):
-            return [v * 1e9 for v in vals]
+            return vals * 1e9
         return vals
 
     def _get_interval(*traces):
         for tr in traces:
             if not tr:
                 continue
-            iv = _safe_float(tr.get("interval"))
-            if iv is not None and iv > 0.0:
-                return iv
+            iv = tr.get("interval")
+            if isinstance(iv, (int, float)) and iv > 0.0:
+                return float(iv)
         return None
 
-    def _get_stats(flop_series, bytes_series, interval_s):
-        if not flop_series or not bytes_series:
-            zero = {"operational_intensity": 0.0, "performance": 0.0}
-            return {
-                "peak": zero,
-                "median": zero,
-                "average": zero,
-                "total": zero
-            }
-
-        n = min(len(flop_series), len(bytes_series))
-        if not interval_s or interval_s <= 0.0:
-            zero = {"operational_intensity": 0.0, "performance": 0.0}
-            return {
-                "peak": zero,
-                "median": zero,
-                "average": zero,
-                "total": zero
-            }
-
-        points = []
-        total_flops = 0.0
-        total_bytes = 0.0
-
-        for i in range(n):
-            f = flop_series[i]  # FLOPS/s
-            byt = bytes_series[i]  # bytes per interval
-            if f and byt and f > 0.0 and byt > 0.0:
-                y = f / 1e9  # GFLOPS/s
-                flops_i = f * interval_s  # FLOPs in interval
-                x = flops_i / byt  # FLOPs/byte
-                points.append((x, y))
-                total_flops += flops_i
-                total_bytes += byt
-
-        if not points:
-            zero = {"operational_intensity": 0.0, "performance": 0.0}
-            return {
-                "peak": zero,
-                "median": zero,
-                "average": zero,
-                "total": zero
-            }
-
-        xs = np.fromiter((p[0] for p in points), dtype=float)
-        ys = np.fromiter((p[1] for p in points), dtype=float)
-
-        # peak by y
-        peak_idx = int(np.argmax(ys))
-        peak = {
-            "operational_intensity": float(xs[peak_idx]),
-            "performance": float(ys[peak_idx])
-        }
-
-        # median by y (closest to median(y))
-        y_med = float(np.median(ys))
-        med_idx = int(np.argmin(np.abs(ys - y_med)))
-        median = {
-            "operational_intensity": float(xs[med_idx]),
-            "performance": float(ys[med_idx])
-        }
-
-        # average (component-wise)
-        average = {
-            "operational_intensity": float(np.mean(xs)),
-            "performance": float(np.mean(ys))
-        }
-
-        # aggregate / total (global OI & global Performance)
-        if total_bytes > 0.0:
-            total_time = interval_s * len(points)  # seconds
-            global_oi = total_flops / total_bytes  # FLOPs/byte
-            global_perf = (total_flops / total_time) / 1e9  # GFLOPS/s
-            aggregate = {
-                "operational_intensity": float(global_oi),
-                "performance": float(global_perf)
-            }
-        else:
-            aggregate = {
-                "operational_intensity": float(np.mean(xs)),
-                "performance": float(np.mean(ys))
-            }
-
-        return {
-            "peak": peak,
-            "median": median,
-            "average": average,
-            "total": aggregate
-        }
-
     data, missing = {}, []
 
+    # jobs are returned under the requested ids
+    numeric_ids = []
     for job_Id in job_Ids:
         try:
-            jobId = int(job_Id)
+            numeric_ids.append((job_Id, int(job_Id)))
         except ValueError:
             missing.append(job_Id)
-            continue
 
-        try:
-            cpu_res = await calculate_metrics(jobId, "cpu", "FLOPS", "job", "",
-                                              False)
-            cpu_traces = cpu_res.get("traces", []) if isinstance(
-                cpu_res, dict) else []
-            sp_trace = _pick_trace(cpu_traces, "SP")
-            dp_trace = _pick_trace(cpu_traces, "DP")
-            sp_flops = _pick_raw_values(sp_trace)
-            dp_flops = _pick_raw_values(dp_trace)
-
-            if not sp_flops and not dp_flops:
-                missing.append(job_Id)
-        except Exception as e:
-            logger.error("roofline_punkt: cpu FLOPS failed for job %s: %s",
-                         job_Id, e)
+    # FLOPS and memory volume of all jobs are calculated at once
+    specs = [{
+        "jobId": jobId,
+        "group": group,
+        "metric": metric,
+        "level": "job"
+    } for _, jobId in numeric_ids
+             for group, metric in (("cpu", "FLOPS"), ("memory", "Data Volume"))]
+    try:
+        results = await _calculate_metrics_batch(specs)
+        failed = False
+    except Exception as e:
+        # calculate each metric of each job separately, a failing job does not affect the others
+        logger.error("roofline: batch calculation failed.\n %s",
+                     format_error(e))
+        results = await asyncio.gather(
+            *[_calculate_metrics_batch([spec]) for spec in specs],
+            return_exceptions=True)
+        results = [
+            result if isinstance(result, Exception) else result[0]
+            for result in results
+        ]
+        failed = True
+
+    job_keys, flops, volumes, intervals = [], [], [], []
+    for idx, (job_Id, jobId) in enumerate(numeric_ids):
+        cpu_res, mem_res = results[2 * idx], results[2 * idx + 1]
+
+        if cpu_res is None or isinstance(cpu_res, Exception):
+            if cpu_res is None:
+                logger.error("roofline: job %s not found", job_Id)
+            else:
+                logger.error("roofline: cpu FLOPS failed for job %s.\n %s",
+                             job_Id, format_error(cpu_res))
             data[job_Id] = {"points": {"sp": {}, "dp": {}}}
             missing.append(job_Id)
             continue
 
-        try:
-            mem_res = await calculate_metrics(jobId, "memory", "Data Volume",
-                                              "job", "", False)
-            mem_traces = mem_res.get("traces", []) if isinstance(
-                mem_res, dict) else []
-            mem_total_trace = _pick_trace(mem_traces, "total")
-            mem_bytes = _pick_volume_raw_values(mem_total_trace)
-        except Exception as e:
+        data[job_Id] = {}
+        cpu_traces = cpu_res.get("traces", [])
+        sp_trace = _pick_trace(cpu_traces, "SP")
+        dp_trace = _pick_trace(cpu_traces, "DP")
+        sp_flops = _pick_raw_values(sp_trace)
+        dp_flops = _pick_raw_values(dp_trace)
+
+        if not len(sp_flops) and not len(dp_flops):
+            missing.append(job_Id)
+
+        if isinstance(mem_res, Exception):
             logger.error(
-                "roofline_punkt: memory Data Volume failed for job %s: %s",
-                job_Id, e)
-            mem_total_trace = None
-            mem_bytes = []
+                "roofline: memory Data Volume failed for job %s.\n %s",
+                job_Id, format_error(mem_res))
+            mem_res = {}
+        mem_total_trace = _pick_trace(mem_res.get("traces", []), "total")
+        mem_bytes = _pick_volume_raw_values(mem_total_trace)
 
         interval_s = _get_interval(sp_trace, dp_trace, mem_total_trace)
 
-        sp_pts4 = _get_stats(sp_flops, mem_bytes, interval_s)
-        dp_pts4 = _get_stats(dp_flops, mem_bytes, interval_s)
+        for key, job_flops in (("sp", sp_flops), ("dp", dp_flops)):
+            job_keys.append((job_Id, key))
+            flops.append(job_flops)
+            volumes.append(mem_bytes)
+            intervals.append(interval_s)
 
-        data[job_Id] = {"sp": sp_pts4, "dp": dp_pts4}
+    for (job_Id, key), stats in zip(
+            job_keys, _get_roofline_stats(flops, volumes, intervals)):
+        data[job_Id][key] = stats
 
     response = {"data": data}
     if missing:
         response["missing"] = sorted(set(missing))
 
+    # results of failed calculations are not cached
     try:
-        numeric_ids = [int(x) for x in job_Ids if x.isdigit()]
-        if numeric_ids and jobs_cacheable(numeric_ids):
-            valkey.set(valkey_key, response)
+        numeric_ids = [jobId for _, jobId in numeric_ids]
+        if numeric_ids and not failed and jobs_cacheable(numeric_ids):
+            await valkey.set(valkey_key, response, jobIds=numeric_ids)
     except Exception:
         pass
 
@@ -0,0 +1,109 @@
+import time
+import queue
+import asyncio
+import logging
+import threading
+from shared.helpers import format_error
+from shared.configuration import get_logger
+
+logger = logging.getLogger(get_logger())
+
+SETTLE_INTERVALS = 2  # measurement intervals until the values of all nodes of a timestamp are available
+MIN_POLL_INTERVAL = 1  # seconds
+
+
+def _now_ms():
+    return int(time.time() * 1000)
+
+
+class LiveTail():
+    """
+    Shared tail of a computation for all subscribers of this process (e.g. live views of a running job).
+
+    A single thread per key computes the values between the previous and the current boundary once per interval and
+    forwards them to all subscribers, the number of queries is therefore independent of the number of viewers. The
+    boundary trails the current time by SETTLE_INTERVALS to include values of nodes that report late.
+
+    The boundary is advanced and the values are published atomically: a new subscriber receives every value after the
+    boundary returned by `subscribe` and has to compute the values up to it itself.
+    """
+
+    _tails = {}
+    _lock = threading.Lock()
+
+    def __init__(self, key, compute, interval, flask_app):
+        """
+        :param compute: coroutine function (since, until) returning the values after since up to until (unix
+            milliseconds, see `calculate_metrics`) and whether the computation is finished (e.g. job reached a final state)
+        :param interval: seconds between computations
+        """
+        self.key = key
+        self.compute = compute
+        self.interval = max(interval, MIN_POLL_INTERVAL)
+        self.flask_app = flask_app
+        self.boundary = self._get_settled()
+        self.subscribers = set()
+        self.thread = threading.Thread(target=self._run,
+                                       name=f"live-{key}",
+                                       daemon=True)
+
+    @classmethod
+    def subscribe(cls, key, compute, interval, flask_app):
+        """
+        Subscribes to the tail of key, the tail is started if this is the first subscriber.
+
+        :return: tail, queue receiving (until, values, finished) and the boundary up to which values are not published
+        """
+        subscriber = queue.Queue()
+        with cls._lock:
+            tail = cls._tails.get(key)
+            if tail is None:
+                tail = cls._tails[key] = LiveTail(key, compute, interval,
+                                                  flask_app)
+                tail.thread.start()
+            tail.subscribers.add(subscriber)
+            return tail, subscriber, tail.boundary
+
+    def unsubscribe(self, subscriber):
+        """Removes subscriber, the tail stops with its next computation once no subscriber is left"""
+        with LiveTail._lock:
+            self.subscribers.discard(subscriber)
+
+    def _get_settled(self):
+        """Returns the timestamp up to which all values are expected to be available (unix milliseconds)"""
+        return _now_ms() - int(SETTLE_INTERVALS * self.interval * 1000)
+
+    def _stop(self):
+        # lock must be held by caller
+        if LiveTail._tails.get(self.key) is self:
+            del LiveTail._tails[self.key]
+
+    def _run(self):
+        logger.debug("Starting live tail %s", self.key)
+        with self.flask_app.app_context():
+            while True:
+                time.sleep(self.interval)
+
+                with LiveTail._lock:
+                    if not self.subscribers:
+                        self._stop()
+                        break
+                    since = self.boundary
+
+                until = self._get_settled()
+                try:
+                    values, finished = asyncio.run(self.compute(since, until))
+                except Exception as e:
+                    # retry with the next interval, the boundary is not advanced
+                    logger.error("Error computing live tail %s.\n %s",
+                                 self.key, format_error(e))
+                    continue
+
+                with LiveTail._lock:
+                    self.boundary = until
+                    for subscriber in self.subscribers:
+                        subscriber.put((until, values, finished))
+                    if finished:
+                        self._stop()
+                        break
+        logger.debug("Stopped live tail %s", self.key)
@@ -1,7 +1,15 @@
-import logging
 import os
+import zlib
+import uuid
+import time
 import redis
 import pickle
+import asyncio
+import logging
+import threading
+from functools import partial
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from flask import current_app as app
 from shared.helpers import format_error
 from shared.configuration import get_logger
@@ -10,12 +18,164 @@ logger = logging.getLogger(get_logger())
 
 EXPIRE_TIME = 60 * 60 * 24 * 7  # one week (seconds)
 
+LOCAL_CACHE_SIZE = 128 * 1024 * 1024  # bytes of encoded values per process
+LOCAL_EXPIRE_TIME = 5 * 60  # seconds, limits staleness as entries are not shared between processes
+
+# values are stored as compressed pickle, prefixed with the encoding version
+ENCODING_HEADER = b"XZ1"
+COMPRESSION_LEVEL = 3
+
+CONCURRENT_OPERATION_LIMIT = 8
+LOCK_PREFIX = "lock:"
+LOCK_LEASE = 240  # seconds, identical to gunicorn timeout
+LOCK_POLL_INTERVAL = 0.1  # seconds between checks for the result of another worker
+
+# sets of the cache keys containing results of a job
+JOB_TAG_PREFIX = "tag:job:"
+# invalidation counters per job, results computed while a job was invalidated are not stored
+JOB_GENERATION_PREFIX = "gen:job:"
+# invalidated keys are published to remove them from the local caches of all processes
+INVALIDATION_CHANNEL = "cache:invalidate"
+LISTEN_RETRY_INTERVAL = 5  # seconds
+
+# delete lock only if it is still held by the releasing worker (lease may have expired in the meantime)
+RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+def _encode(value):
+    return ENCODING_HEADER + zlib.compress(
+        pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+        COMPRESSION_LEVEL)
+
+
+def _decode(data):
+    if data.startswith(ENCODING_HEADER):
+        return pickle.loads(zlib.decompress(data[len(ENCODING_HEADER):]))
+    # uncompressed values of previous versions
+    return pickle.loads(data)
+
+
+def _get_job_tags(jobIds):
+    return [f"{JOB_TAG_PREFIX}{jobId}" for jobId in jobIds]
+
+
+def _get_job_generations(jobIds):
+    return [f"{JOB_GENERATION_PREFIX}{jobId}" for jobId in jobIds]
+
+
+def _set_tagged(client, key, data, jobIds, generations):
+    """
+    Stores data and its membership in the tags of jobIds in a single transaction.
+
+    :param generations: invalidation counters of jobIds read before the computation of data, data is not stored if one
+        of the jobs was invalidated in the meantime
+    :return: whether data was stored
+    """
+    with client.pipeline() as pipe:
+        try:
+            if generations is not None:
+                generation_keys = _get_job_generations(jobIds)
+                pipe.watch(*generation_keys)
+                if pipe.mget(generation_keys) != generations:
+                    return False
+            pipe.multi()
+            pipe.set(key, data, ex=EXPIRE_TIME)
+            for tag in _get_job_tags(jobIds):
+                pipe.sadd(tag, key)
+                pipe.expire(tag, EXPIRE_TIME)
+            pipe.execute()
+            return True
+        except redis.exceptions.WatchError:
+            return False
+
+
+class LocalCache():
+    """
+    Thread-safe LRU cache of encoded values, bounded by the total size of the values (bytes).
+    """
+
+    def __init__(self, max_size, expire_time):
+        self.max_size = max_size
+        self.expire_time = expire_time
+        self.size = 0
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+
+            expires, data = entry
+            if expires < time.monotonic():
+                self._remove(key)
+                return None
+
+            self.entries.move_to_end(key)
+            return data
+
+    def set(self, key, data):
+        if len(data) > self.max_size:
+            return
+
+        with self.lock:
+            self._remove(key)
+            self.entries[key] = (time.monotonic() + self.expire_time, data)
+            self.size += len(data)
+
+            # evict least recently used entries
+            while self.size > self.max_size:
+                _, (_, evicted) = self.entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def delete(self, key):
+        with self.lock:
+            self._remove(key)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+    def _remove(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry[1])
+
 
 class Valkey():
+    """
+    Wrapper for Valkey with coroutine methods.
+
+    Valkey calls are still synchronous calls of the redis client (not an async client), executed in a dedicated thread
+    pool with a thread-safe connection pool shared across requests, see `shared.clickhouse.ClickHouse` for the reason.
+
+    Values are stored compressed. Recently used values are additionally kept in a local cache per process to avoid
+    round trips to Valkey for hot entries, invalidated entries are removed from the local caches of all processes via
+    pub/sub (see `_listen`).
+    """
+
     connection_pool = None
     conninfo = ""
     pool_name = ""
     pool_instance = 0
+    executor = ThreadPoolExecutor(max_workers=CONCURRENT_OPERATION_LIMIT,
+                                  thread_name_prefix="valkey")
+    local_cache = LocalCache(LOCAL_CACHE_SIZE, LOCAL_EXPIRE_TIME)
+
+    # computations in progress of this process (see `get_or_compute`)
+    _flights = {}
+    _flights_lock = threading.Lock()
+
+    # process listening for invalidations (see `_listen`)
+    _listener_pid = None
+    _listener_lock = threading.Lock()
 
     def __init__(self):
         pass
@@ -32,11 +192,10 @@ class Valkey():
             self.pool_name = f"redis-pool-{os.getpid()}-{self.pool_instance}"
             self.pool_instance += 1
             logger.debug("Creating %s", self.pool_name)
-            # decode_responses=True (handled by pickle)
-            # TODO use async connection pool
-            # https://redis-py.readthedocs.io/en/stable/connections.html#connectionpool-async
+            # decode_responses=True (handled by `_decode`)
             self.connection_pool = redis.ConnectionPool.from_url(
                 self.conninfo, socket_timeout=0.5)
+            self._start_listener()
             return True
         except (redis.exceptions.ConnectionError) as e:
             app.logger.error(format_error(e))
@@ -47,12 +206,41 @@ class Valkey():
         if self.connection_pool is not None:
             self.connection_pool.close()
 
-    def _execute(self, operation, key, value=None):
-        if self.connection_pool is None:
-            if not self.connect():
-                return None
+    def _start_listener(self):
+        # once per process, threads of the parent process are not inherited by forked workers
+        with Valkey._listener_lock:
+            if Valkey._listener_pid == os.getpid():
+                return
+            Valkey._listener_pid = os.getpid()
 
-        result = None
+        threading.Thread(target=self._listen,
+                         args=(self.conninfo, ),
+                         name="valkey-invalidation",
+                         daemon=True).start()
+
+    def _listen(self, conninfo):
+        """Removes entries invalidated by any process from the local cache of this process"""
+        while True:
+            try:
+                # dedicated connection without socket timeout, the subscription waits for messages indefinitely
+                with redis.Redis.from_url(
+                        conninfo, health_check_interval=30) as client:
+                    with client.pubsub(
+                            ignore_subscribe_messages=True) as pubsub:
+                        pubsub.subscribe(INVALIDATION_CHANNEL)
+                        # invalidations may have been missed while not subscribed
+                        self.local_cache.clear()
+                        for message in pubsub.listen():
+                            for key in message["data"].decode().split("\n"):
+                                self.local_cache.delete(key)
+            except redis.exceptions.RedisError as e:
+                logger.error("Error listening for cache invalidations.\n %s",
+                             format_error(e))
+                time.sleep(LISTEN_RETRY_INTERVAL)
+
+    def _execute_sync(self, operation, key, value=None, default=None):
+        """Execute operation with pooled connection (blocking), returns default on errors"""
+        result = default
 
         try:
             logger.debug(
@@ -60,20 +248,165 @@ class Valkey():
             with redis.Redis(connection_pool=self.connection_pool) as client:
                 if operation == "get":
                     result = client.get(key)
-                    if result is not None:
-                        result = pickle.loads(result)
                 elif operation == "set":
-                    result = client.set(key,
-                                        pickle.dumps(value),
-                                        ex=EXPIRE_TIME)
+                    result = _set_tagged(client, key, *value)
+                elif operation == "generations":
+                    result = client.mget(_get_job_generations(value))
+                elif operation == "invalidate":
+                    # results being computed are discarded (see `_set_tagged`), stored results are tagged
+                    with client.pipeline() as pipe:
+                        for generation in _get_job_generations(value):
+                            pipe.incr(generation)
+                            pipe.expire(generation, EXPIRE_TIME)
+                        pipe.execute()
+
+                    tags = _get_job_tags(value)
+                    keys = set()
+                    for tag in tags:
+                        keys.update(k.decode() for k in client.smembers(tag))
+                    client.delete(*keys, *tags)
+                    if keys:
+                        client.publish(INVALIDATION_CHANNEL, "\n".join(keys))
+                    result = list(keys)
+                elif operation == "lock":
+                    result = bool(
+                        client.set(key, value, nx=True, ex=LOCK_LEASE))
+                elif operation == "unlock":
+                    result = client.eval(RELEASE_SCRIPT, 1, key, value)
 
         except (redis.exceptions.RedisError) as e:
             logger.error("Error calling valkey.\n %s", format_error(e))
 
         return result
 
-    def get(self, key):
-        return self._execute("get", key)
+    async def _execute(self, operation, key, value=None, default=None):
+        # connect in the calling thread as the app context is not available in the thread pool
+        if self.connection_pool is None:
+            if not self.connect():
+                return default
+
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor,
+            partial(self._execute_sync, operation, key, value, default))
+
+    async def get(self, key):
+        data = self.local_cache.get(key)
+        if data is None:
+            data = await self._execute("get", key)
+            if data is None:
+                return None
+            self.local_cache.set(key, data)
+
+        return _decode(data)
+
+    async def set(self, key, value, jobIds=None, generations=None):
+        """
+        Caches value for key, the value and its tags are stored atomically.
+
+        :param jobIds: jobs contained in value, the entry is removed when invalidating one of these jobs
+        :param generations: invalidation counters of jobIds read before computing value (see `_get_generations`), value
+            is not cached if one of the jobs was invalidated in the meantime
+        :return: whether value was cached (None if Valkey is not available)
+        """
+        data = _encode(value)
+        stored = await self._execute("set", key,
+                                     (data, jobIds or [], generations))
+        if stored is not False:
+            self.local_cache.set(key, data)
+        return stored
+
+    async def _get_generations(self, jobIds):
+        """Returns the invalidation counters of jobIds, None if Valkey is not available"""
+        if not jobIds:
+            return None
+        return await self._execute("generations", None, jobIds)
+
+    def invalidate_jobs(self, jobIds):
+        """
+        Removes all cached entries containing results of the specified jobs (blocking).
 
-    def set(self, key, value):
-        return self._execute("set", key, value)
+        Results of these jobs computed concurrently are not cached. The removed keys are published to remove them from
+        the local caches of all processes (see `_listen`).
+        """
+        if not jobIds:
+            return
+
+        if self.connection_pool is None:
+            if not self.connect():
+                return
+
+        keys = self._execute_sync("invalidate", None, jobIds, [])
+        for key in keys:
+            self.local_cache.delete(key)
+        logger.debug("Invalidated %d cache entries of jobs %s", len(keys),
+                     jobIds)
+
+    async def get_or_compute(self, key, compute, jobIds=None, cacheable=True):
+        """
+        Returns the cached value of key or computes it, concurrent identical requests are coalesced (single-flight).
+
+        Within a process, concurrent requests wait for the computation of the first request. Across processes, a lock
+        (lease) in Valkey ensures that only one worker computes the value while the others wait for the cached result.
+        If the lock expires, waiting workers compute the value themselves.
+
+        Values that are not cacheable (e.g. results of running jobs) are neither looked up nor cached and only coalesced
+        within a process, as workers waiting for the lock would never find a cached result.
+
+        :param compute: coroutine function returning the value
+        :param jobIds: jobs contained in value (see `set`)
+        :param cacheable: whether the value may be cached, must be known before the computation
+        :return: value
+        """
+        if cacheable:
+            cached = await self.get(key)
+            if cached is not None:
+                return cached
+
+        with Valkey._flights_lock:
+            flight = Valkey._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = Valkey._flights[key] = Future()
+
+        if not leader:
+            return await asyncio.wrap_future(flight)
+
+        try:
+            if cacheable:
+                value = await self._compute_locked(key, compute, jobIds)
+            else:
+                value = await compute()
+            flight.set_result(value)
+            return value
+        except BaseException as e:
+            flight.set_exception(e)
+            raise
+        finally:
+            with Valkey._flights_lock:
+                Valkey._flights.pop(key, None)
+
+    async def _compute_locked(self, key, compute, jobIds):
+        """Computes and caches the value while holding the lock of key, waits for the cached value otherwise"""
+        lock_key = f"{LOCK_PREFIX}{key}"
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + LOCK_LEASE
+
+        # proceed without lock if valkey is not available
+        while not await self._execute("lock", lock_key, token, default=True):
+            await asyncio.sleep(LOCK_POLL_INTERVAL)
+
+            cached = await self.get(key)
+            if cached is not None:
+                return cached
+
+            if time.monotonic() > deadline:
+                logger.warning("Timeout waiting for lock %s", lock_key)
+                break
+
+        try:
+            generations = await self._get_generations(jobIds)
+            value = await compute()
+            await self.set(key, value, jobIds, generations)
+            return value
+        finally:
+            await self._execute("unlock", lock_key, token)
@@ -0,0 +1,106 @@
+import time
+import asyncio
+import logging
+import threading
+from urllib.parse import urlparse
+from werkzeug.exceptions import HTTPException
+from shared.mongodb import MongoDB
+from shared.helpers import format_error
+from shared.configuration import get_logger
+
+logger = logging.getLogger(get_logger())
+
+WARMUP_COLLECTION = "cache_warmup"  # filled by xbatctld once a benchmark reached its final state
+POLL_INTERVAL = 10  # seconds
+
+db = MongoDB()
+
+
+def start(flask_app):
+    """
+    Starts the cache warm-up in a background thread of this process.
+
+    Each worker polls the queue, entries are claimed atomically and hence processed by a single worker only.
+    """
+    thread = threading.Thread(target=_run,
+                              args=(flask_app, ),
+                              name="cache-warmup",
+                              daemon=True)
+    thread.start()
+
+
+def _run(flask_app):
+    base_path = urlparse(
+        flask_app.config["openapi"]["servers"][0]["url"]).path.rstrip("/")
+
+    while True:
+        try:
+            entry = db.popOne(WARMUP_COLLECTION)
+        except Exception as e:
+            logger.error("Error reading cache warm-up queue.\n %s",
+                         format_error(e))
+            entry = None
+
+        if entry is None:
+            time.sleep(POLL_INTERVAL)
+            continue
+
+        logger.debug("Warming cache of benchmark #%s", entry["runNr"])
+        start_time = time.time()
+        for jobId in entry["jobIds"]:
+            try:
+                asyncio.run(_warm_job(flask_app, base_path, jobId))
+            except Exception as e:
+                logger.error("Cache warm-up of job %s failed.\n %s", jobId,
+                             format_error(e))
+        try:
+            asyncio.run(_warm_benchmark(flask_app, base_path,
+                                        entry["jobIds"]))
+        except Exception as e:
+            logger.error("Cache warm-up of benchmark #%s failed.\n %s",
+                         entry["runNr"], format_error(e))
+        logger.debug("Warmed cache of benchmark #%s in %.2f s",
+                     entry["runNr"],
+                     time.time() - start_time)
+
+
+async def _warm_job(flask_app, base_path, jobId):
+    """
+    Precomputes the default views of a job by calling the views within a request context of the respective path,
+    which results in the same cache keys as requests of the UI.
+    """
+    # import on first use as the views require the app configuration
+    from backend.restapi.api import measurements
+
+    with flask_app.test_request_context(f"{base_path}/metrics"):
+        available, _ = await measurements.get_available_metrics(
+            jobIds=[jobId])
+
+    with flask_app.test_request_context(f"{base_path}/measurements/{jobId}"):
+        for group, metrics in (available.get("metrics") or {}).items():
+            for metric in metrics:
+                try:
+                    await measurements.get_measurements(jobId,
+                                                        group=group,
+                                                        metric=metric,
+                                                        level="job")
+                except HTTPException:
+                    pass
+
+    with flask_app.test_request_context(
+            f"{base_path}/measurements/{jobId}/energy"):
+        await measurements.calculate_energy(jobId)
+
+    with flask_app.test_request_context(f"{base_path}/metrics/roofline"):
+        await measurements.get_roofline(jobIds=[jobId])
+
+
+async def _warm_benchmark(flask_app, base_path, jobIds):
+    """
+    Precomputes the views of a benchmark spanning all of its jobs, e.g. the available metrics of all jobs
+    (/metrics?jobIds=<all jobs>) requested by the UI.
+    """
+    from backend.restapi.api import measurements
+
+    with flask_app.test_request_context(f"{base_path}/metrics"):
+        await measurements.get_available_metrics(jobIds=jobIds)
@@ -1,49 +1,184 @@
+import os
+import time
 import logging
 import asyncio
+import threading
+import numpy as np
 import psycopg as pg
-from psycopg.rows import dict_row
+from concurrent.futures import ThreadPoolExecutor
+from psycopg.rows import dict_row, tuple_row
+from psycopg_pool import ConnectionPool, PoolTimeout
 from shared.helpers import format_error
+from shared.clickhouse_http import ClickHouseHttp, ClickHouseHttpError
 from shared.configuration import get_logger, get_config
 
 CONCURRENT_QUERY_LIMIT = 16  # Limit concurrent queries to prevent exhausting the database connections
 
+# connection pool (per process) - 8 workers * CONCURRENT_QUERY_LIMIT must not exceed max_client_conn of pgbouncer
+POOL_MIN_SIZE = 2  # warm connections kept open
+POOL_TIMEOUT = 60  # seconds to wait for a free connection
+POOL_MAX_LIFETIME = 30 * 60  # seconds until a connection is recycled
+POOL_MAX_IDLE = 5 * 60  # seconds until an idle connection (above POOL_MIN_SIZE) is closed
+POOL_STATS_INTERVAL = 60  # minimum seconds between reports of pool utilisation and wait time (info log)
+
+INTERFACE_PGBOUNCER = "pgbouncer"
+INTERFACE_HTTP = "http"
+
+CATALOG_TABLE = "measurement_catalog"
+# rollup tables by resolution (ms), see migration 0003_measurement_rollups.sql
+ROLLUP_TABLES = {
+    60 * 1000: "measurement_rollup_1m",
+    10 * 60 * 1000: "measurement_rollup_10m"
+}
+# tables without measurements (templates, goose migration state and materialized views)
+EXCLUDED_TABLE_PREFIXES = ("template", "goose", "mv_")
+# tables filled by materialized views from measurement tables (not exported, but deleted together with the measurements)
+DERIVED_TABLE_PREFIXES = (CATALOG_TABLE, "measurement_rollup")
+
 logger = logging.getLogger(get_logger())
 
 
+def _to_columns(description, rows, dtypes):
+    """Transpose result rows into a dict of numpy arrays using the column names of the cursor description"""
+    if description is None:
+        return {}
+
+    names = [column.name for column in description]
+    columns = list(zip(*rows)) if len(rows) else [()] * len(names)
+
+    return {
+        name: np.asarray(column, dtype=dtypes.get(name, object))
+        for name, column in zip(names, columns)
+    }
+
+
+def _check_connection(conn):
+    """Health check of pooled connections before they are handed out"""
+    conn.execute("SELECT 1")
+
+
 class ClickHouse:
-    """Async wrapper for psycopg/pgbouncer to query ClickHouse"""
+    """
+    Async wrapper to query ClickHouse via psycopg/pgbouncer or the HTTP interface of ClickHouse
+
+    The interface is selected with `interface` of the clickhouse configuration (default: pgbouncer).
+    The HTTP interface transfers results in binary format (RowBinary) which is decoded directly into numpy arrays.
+
+    Connections are kept in a pool shared by all instances of a (worker) process. Flask executes each async view in its own
+    event loop, an asyncio connection pool could therefore not be reused across requests. Instead, a thread-safe pool is used
+    and queries are executed in a dedicated thread pool.
+    """
 
     conninfo = ""
+    interface = None
+    pool = None
+    http = None
+    executor = None
+    _setup_lock = threading.Lock()
+
+    # last report of the pool statistics (see `_report_pool_stats`)
+    _stats_lock = threading.Lock()
+    _stats_reported = 0
+    _stats_wait_ms = 0
 
     def setup(self):
         """Defers connection setup to first query as configuration may not be available yet"""
-        if self.conninfo != "":
+        if ClickHouse.interface is not None:
             return
 
-        config = get_config()
-        if "pgbouncer" not in config:
-            logger.error("Invalid configuration: missing 'pgbouncer' config.")
-            return
+        with ClickHouse._setup_lock:
+            if ClickHouse.interface is not None:
+                return
 
-        pgbouncer_config = config["pgbouncer"]
-        self.conninfo = (
-            f"dbname=clickhouse host={pgbouncer_config['host']} port={pgbouncer_config['port']} user={pgbouncer_config['user']} password={pgbouncer_config['password']}"
-        )
+            config = get_config()
+            interface = config["clickhouse"].get(
+                "interface", INTERFACE_PGBOUNCER
+            ) if "clickhouse" in config else INTERFACE_PGBOUNCER
 
-    async def _execute(self, query):
-        """Execute query with connection from pgbouncer"""
+            # HTTP interface is also used for exports in ClickHouse output formats (see `stream`)
+            if "clickhouse" in config:
+                clickhouse_config = config["clickhouse"]
+                ClickHouse.http = ClickHouseHttp(
+                    clickhouse_config["host"],
+                    clickhouse_config.get("http_port", "8123"),
+                    clickhouse_config["database"], clickhouse_config["user"],
+                    clickhouse_config["password"])
 
-        result = []
+            if interface == INTERFACE_HTTP:
+                ClickHouse.executor = ThreadPoolExecutor(
+                    max_workers=CONCURRENT_QUERY_LIMIT,
+                    thread_name_prefix="clickhouse")
+                ClickHouse.interface = INTERFACE_HTTP
+                return
+
+            if "pgbouncer" not in config:
+                logger.error(
+                    "Invalid configuration: missing 'pgbouncer' config.")
+                return
+
+            pgbouncer_config = config["pgbouncer"]
+            ClickHouse.conninfo = (
+                f"dbname=clickhouse host={pgbouncer_config['host']} port={pgbouncer_config['port']} user={pgbouncer_config['user']} password={pgbouncer_config['password']}"
+            )
+            ClickHouse.executor = ThreadPoolExecutor(
+                max_workers=CONCURRENT_QUERY_LIMIT,
+                thread_name_prefix="clickhouse")
+            ClickHouse.pool = ConnectionPool(
+                ClickHouse.conninfo,
+                name=f"clickhouse-{os.getpid()}",
+                min_size=POOL_MIN_SIZE,
+                max_size=CONCURRENT_QUERY_LIMIT,
+                # For ClickHouse compatibility to prevent "Expected TRANSACTION" errors
+                kwargs={"autocommit": True},
+                check=_check_connection,
+                timeout=POOL_TIMEOUT,
+                max_lifetime=POOL_MAX_LIFETIME,
+                max_idle=POOL_MAX_IDLE,
+                open=True)
+            ClickHouse.interface = INTERFACE_PGBOUNCER
+
+    def _execute_http(self, query, dtypes=None):
+        """Execute query via HTTP interface (blocking)"""
+
+        result = [] if dtypes is None else {}
         try:
-            async with await pg.AsyncConnection.connect(
-                    self.conninfo,
-                    autocommit=
-                    True,  # For ClickHouse compatibility to prevent "Expected TRANSACTION" errors
-            ) as conn:
-                async with conn.cursor(row_factory=dict_row) as cursor:
+            logger.debug(query)
+            names, columns = self.http.query(query)
+            if dtypes is None:
+                result = [
+                    dict(zip(names, row))
+                    for row in zip(*[c.tolist() for c in columns])
+                ]
+            else:
+                result = {
+                    name: column.astype(dtypes[name], copy=False)
+                    if name in dtypes else column
+                    for name, column in zip(names, columns)
+                }
+        except ClickHouseHttpError as e:
+            logger.error("Database error: %s | SQL: %s", format_error(e),
+                         query[:512])
+
+        return result
+
+    def _execute_sync(self, query, dtypes=None):
+        """Execute query with pooled connection (blocking)"""
+
+        if self.interface == INTERFACE_HTTP:
+            return self._execute_http(query, dtypes)
+
+        result = [] if dtypes is None else {}
+        try:
+            with self.pool.connection() as conn:
+                row_factory = dict_row if dtypes is None else tuple_row
+                with conn.cursor(row_factory=row_factory) as cursor:
                     logger.debug(query)
-                    await cursor.execute(query)
-                    result = await cursor.fetchall()
+                    cursor.execute(query)
+                    rows = cursor.fetchall()
+                    result = rows if dtypes is None else _to_columns(
+                        cursor.description, rows, dtypes)
+        except PoolTimeout as e:
+            logger.error("Connection pool exhausted: %s", format_error(e))
         except pg.OperationalError as e:
             logger.error("Connection error: %s", format_error(e))
         except pg.ProgrammingError as e:
@@ -57,24 +192,107 @@ class ClickHouse:
 
         return result
 
+    async def _execute(self, query, dtypes=None):
+        """
+        Execute query with connection from pgbouncer
+
+        :param query: SQL query
+        :param dtypes: if provided, return the result column-wise as dict of numpy arrays (column name -> dtype, unlisted columns are kept as object arrays)
+        :return: list of rows (dicts) or dict of columns
+        """
+        if self.interface is None:
+            return [] if dtypes is None else {}
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self._execute_sync,
+                                          query, dtypes)
+
     async def execute_queries(self,
                               queries,
-                              concurrency=CONCURRENT_QUERY_LIMIT):
-        """Execute multiple queries (with concurrency limit)"""
+                              concurrency=CONCURRENT_QUERY_LIMIT,
+                              dtypes=None):
+        """
+        Execute multiple queries (with concurrency limit)
+
+        All queries are scheduled at once and the semaphore starts the next query as soon as any query finishes.
+
+        :param queries: list of SQL queries
+        :param concurrency: maximum number of concurrent queries
+        :param dtypes: return results column-wise as typed numpy arrays (see `_execute`)
+        """
         self.setup()
 
         semaphore = asyncio.Semaphore(concurrency)
 
         async def _execute_concurrent(query):
             async with semaphore:
-                return await self._execute(query)
+                return await self._execute(query, dtypes)
+
+        results = await asyncio.gather(
+            *[_execute_concurrent(q) for q in queries])
+
+        if self.pool is not None:
+            self._report_pool_stats()
+
+        return list(results)
+
+    def _report_pool_stats(self):
+        """Logs utilisation and wait time of the connection pool, at most once per POOL_STATS_INTERVAL"""
+        now = time.monotonic()
+        with ClickHouse._stats_lock:
+            if now - ClickHouse._stats_reported < POOL_STATS_INTERVAL:
+                return
+            ClickHouse._stats_reported = now
+
+            stats = self.get_pool_stats()
+            # wait time is accumulated by the pool, the report contains the wait time since the previous report
+            wait_ms = stats["requests_wait_ms"] - ClickHouse._stats_wait_ms
+            ClickHouse._stats_wait_ms = stats["requests_wait_ms"]
+
+        logger.info(
+            "ClickHouse pool %s: %d/%d connections in use (%.0f%%), %d requests waiting, %d ms waited for connections since last report",
+            self.pool.name, stats["pool_size"] - stats["pool_available"],
+            stats["pool_max"], stats["utilisation"] * 100,
+            stats["requests_waiting"], wait_ms)
+
+    def get_pool_stats(self):
+        """
+        Returns statistics of the connection pool of this process.
+
+        See https://www.psycopg.org/psycopg3/docs/advanced/pool.html#pool-stats for all values,
+        `requests_wait_ms` is the accumulated time spent waiting for a connection.
+        `utilisation` is the share of the maximum pool size currently in use.
+        Returns an empty dict for the HTTP interface.
+        """
+        self.setup()
+        if self.pool is None:
+            return {}
+
+        # counters are only present once they are non-zero
+        stats = {
+            "requests_waiting": 0,
+            "requests_wait_ms": 0,
+            **self.pool.get_stats()
+        }
+        stats["utilisation"] = (stats["pool_size"] -
+                                stats["pool_available"]) / stats["pool_max"]
+        return stats
+
+    def stream(self, query, format, settings=None):
+        """
+        Executes query via the HTTP interface (independent of the configured interface) and returns a generator over
+        the raw result in the specified ClickHouse output format (e.g. Parquet).
+
+        :param settings: additional ClickHouse settings, e.g. compression of the output format
+        :raises ClickHouseHttpError: if the query failed
+        """
+        self.setup()
+        if self.http is None:
+            raise ClickHouseHttpError(
+                "Invalid configuration: missing 'clickhouse' config.")
 
-        results = []
-        for i in range(0, len(queries), concurrency):
-            batch = queries[i:i + concurrency]
-            results.extend(
-                await asyncio.gather(*[_execute_concurrent(q) for q in batch]))
-        return results
+        logger.debug(query)
+        return self.http.stream(query, format, settings)
 
     async def execute_query(self, query):
         """Execute a single query"""
@@ -103,8 +321,7 @@ class ClickHouse:
 
         tables = [
             table for table in tables
-            if not (table['name'].startswith('template')
-                    or table['name'].startswith('goose'))
+            if not table['name'].startswith(EXCLUDED_TABLE_PREFIXES)
         ]
 
         job_ids_str = ",".join(str(job_id) for job_id in job_ids)
@@ -118,15 +335,15 @@ class ClickHouse:
         await self.execute_queries(queries, 2)
 
     async def get_table_names(self, exclude_templates=True):
-        """Get list of table names in ClickHouse"""
+        """Get list of table names in ClickHouse (optionally only measurement tables)"""
         self.setup()
         tables = await self._execute("SHOW TABLES")
         tables = [table['name'] for table in tables if "name" in table]
 
         if exclude_templates:
             tables = [
-                table for table in tables if not (
-                    table.startswith('template') or table.startswith('goose'))
+                table for table in tables if not table.startswith(
+                    EXCLUDED_TABLE_PREFIXES + DERIVED_TABLE_PREFIXES)
             ]
 
         return tables
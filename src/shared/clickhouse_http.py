@@ -0,0 +1,248 @@
+import re
+import struct
+import logging
+import threading
+import http.client
+import numpy as np
+from urllib.parse import urlencode
+from shared.configuration import get_logger
+
+FORMAT = "RowBinaryWithNamesAndTypes"
+HTTP_TIMEOUT = 240  # seconds, identical to gunicorn timeout
+STREAM_CHUNK_SIZE = 1024 * 1024  # bytes
+
+logger = logging.getLogger(get_logger())
+
+# little-endian numpy type, struct format and size of fixed-width ClickHouse types
+FIXED_TYPES = {
+    "UInt8": ("<u1", "<B", 1),
+    "UInt16": ("<u2", "<H", 2),
+    "UInt32": ("<u4", "<I", 4),
+    "UInt64": ("<u8", "<Q", 8),
+    "Int8": ("<i1", "<b", 1),
+    "Int16": ("<i2", "<h", 2),
+    "Int32": ("<i4", "<i", 4),
+    "Int64": ("<i8", "<q", 8),
+    "Float32": ("<f4", "<f", 4),
+    "Float64": ("<f8", "<d", 8),
+    "Bool": ("<u1", "<?", 1),
+    "Date": ("<u2", "<H", 2),
+    "DateTime": ("<u4", "<I", 4),
+}
+
+DATETIME64_UNITS = {0: "s", 3: "ms", 6: "us", 9: "ns"}
+
+
+class ClickHouseHttpError(Exception):
+    pass
+
+
+def _read_varint(data, offset):
+    """Reads unsigned LEB128 encoded integer"""
+    result = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        result |= (byte & 0x7f) << shift
+        if not byte & 0x80:
+            return result, offset
+        shift += 7
+
+
+def _read_string(data, offset):
+    length, offset = _read_varint(data, offset)
+    return bytes(data[offset:offset + length]).decode(), offset + length
+
+
+def _parse_type(type_name):
+    """
+    Returns (numpy dtype, struct format, size, nullable, datetime unit) of a ClickHouse type.
+
+    Variable-width types (String) have size 0.
+    """
+    nullable = False
+    match = re.fullmatch(r"LowCardinality\((.*)\)", type_name)
+    if match:
+        type_name = match.group(1)
+    match = re.fullmatch(r"Nullable\((.*)\)", type_name)
+    if match:
+        type_name = match.group(1)
+        nullable = True
+
+    if type_name in FIXED_TYPES:
+        dtype, fmt, size = FIXED_TYPES[type_name]
+        return dtype, fmt, size, nullable, None
+
+    match = re.fullmatch(r"DateTime64\((\d+)(?:,.*)?\)", type_name)
+    if match:
+        precision = int(match.group(1))
+        return "<i8", "<q", 8, nullable, DATETIME64_UNITS.get(precision)
+
+    if type_name == "String" or type_name.startswith("FixedString"):
+        return object, None, 0, nullable, None
+
+    raise ClickHouseHttpError(f"Unsupported column type '{type_name}'")
+
+
+def parse_row_binary(data):
+    """
+    Decodes RowBinaryWithNamesAndTypes into numpy arrays.
+
+    Results consisting only of fixed-width columns are decoded at once with a structured dtype,
+    otherwise rows are decoded individually.
+
+    :param data: response body
+    :return: list of column names and list of numpy arrays
+    """
+    if not len(data):
+        return [], []
+
+    data = memoryview(data)
+    count, offset = _read_varint(data, 0)
+    names = []
+    for _ in range(count):
+        name, offset = _read_string(data, offset)
+        names.append(name)
+    types = []
+    for _ in range(count):
+        type_name, offset = _read_string(data, offset)
+        types.append(_parse_type(type_name))
+
+    if all(size and not nullable for _, _, size, nullable, _ in types):
+        dtype = np.dtype([(f"c{idx}", t[0]) for idx, t in enumerate(types)])
+        rows = np.frombuffer(data, dtype=dtype, offset=offset)
+        columns = [rows[f"c{idx}"].copy() for idx in range(count)]
+    else:
+        values = [[] for _ in range(count)]
+        end = len(data)
+        while offset < end:
+            for idx, (_, fmt, size, nullable, _) in enumerate(types):
+                if nullable:
+                    is_null = data[offset]
+                    offset += 1
+                    if is_null:
+                        values[idx].append(None)
+                        continue
+                if size:
+                    values[idx].append(struct.unpack_from(fmt, data, offset)[0])
+                    offset += size
+                else:
+                    value, offset = _read_string(data, offset)
+                    values[idx].append(value)
+        columns = [
+            np.asarray(v, dtype=t[0] if t[2] and not t[3] else object)
+            for v, t in zip(values, types)
+        ]
+
+    for idx, (_, _, _, nullable, unit) in enumerate(types):
+        if unit is not None and not nullable:
+            columns[idx] = columns[idx].view(f"datetime64[{unit}]")
+
+    return names, columns
+
+
+class ClickHouseHttp:
+    """
+    Client for the HTTP interface of ClickHouse.
+
+    Each thread keeps its own keep-alive connection, which is reused for all queries of that thread.
+    """
+
+    def __init__(self, host, port, database, user, password):
+        self.host = host
+        self.port = int(port)
+        self.database = database
+        self.path = self._get_path(FORMAT)
+        self.headers = {
+            "X-ClickHouse-User": user,
+            "X-ClickHouse-Key": password,
+            "Connection": "keep-alive"
+        }
+        self.local = threading.local()
+
+    def _get_path(self, format, settings=None):
+        return "/?" + urlencode({
+            "database": self.database,
+            "default_format": format,
+            **(settings or {})
+        })
+
+    def _get_connection(self):
+        connection = getattr(self.local, "connection", None)
+        if connection is None:
+            connection = http.client.HTTPConnection(self.host,
+                                                    self.port,
+                                                    timeout=HTTP_TIMEOUT)
+            self.local.connection = connection
+        return connection
+
+    def _close_connection(self):
+        connection = getattr(self.local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self.local.connection = None
+
+    def query(self, query):
+        """
+        Executes query and returns the decoded result.
+
+        Connections closed by the server while idle are reopened once.
+
+        :return: list of column names and list of numpy arrays
+        """
+        for attempt in range(2):
+            connection = self._get_connection()
+            try:
+                connection.request("POST",
+                                   self.path,
+                                   body=query.encode(),
+                                   headers=self.headers)
+                response = connection.getresponse()
+                body = response.read()
+                break
+            except (http.client.HTTPException, OSError) as e:
+                self._close_connection()
+                if attempt:
+                    raise ClickHouseHttpError(f"Connection error: {e}")
+
+        if response.status != 200:
+            raise ClickHouseHttpError(body.decode(errors="replace").strip())
+
+        return parse_row_binary(body)
+
+    def stream(self, query, format, settings=None):
+        """
+        Executes query and returns a generator over the raw response body in the specified output format.
+
+        A dedicated connection is used, as the generator may be consumed by another thread (e.g. streamed responses).
+
+        :param settings: additional ClickHouse settings
+        """
+        connection = http.client.HTTPConnection(self.host,
+                                                self.port,
+                                                timeout=HTTP_TIMEOUT)
+        try:
+            connection.request("POST",
+                               self._get_path(format, settings),
+                               body=query.encode(),
+                               headers=self.headers)
+            response = connection.getresponse()
+            if response.status != 200:
+                raise ClickHouseHttpError(
+                    response.read().decode(errors="replace").strip())
+        except (http.client.HTTPException, OSError) as e:
+            connection.close()
+            raise ClickHouseHttpError(f"Connection error: {e}")
+        except ClickHouseHttpError:
+            connection.close()
+            raise
+
+        def _generate():
+            try:
+                while chunk := response.read(STREAM_CHUNK_SIZE):
+                    yield chunk
+            finally:
+                connection.close()
+
+        return _generate()
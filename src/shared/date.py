@@ -35,5 +35,11 @@ def unix_ts_to_datetime(ts):
     return datetime.datetime.fromtimestamp(int(ts), tz=datetime.timezone.utc)
 
 
+def unix_ms_to_datetime(ms):
+    """Converts unix timestamp in milliseconds to naive UTC datetime (as returned by ClickHouse)"""
+    return datetime.datetime(1970, 1, 1) + datetime.timedelta(
+        milliseconds=int(ms))
+
+
 def unix_ts_to_datetime_str(ts):
     return unix_ts_to_datetime(ts).isoformat()
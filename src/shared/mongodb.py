@@ -128,6 +128,12 @@ class MongoDB(object):
     def deleteMany(cls, collection, identifierObj):
         return cls._get_cursor()[collection].delete_many(identifierObj)
 
+    @classmethod
+    def popOne(cls, collection, identifierObj={}):
+        # atomically removes and returns the oldest matching document (e.g. for queues shared by multiple processes)
+        return cls._get_cursor()[collection].find_one_and_delete(
+            identifierObj, sort=[("_id", pymongo.ASCENDING)])
+
     @classmethod
     def replaceOne(cls, collection, identifierObj, data, upsert=False):
         return cls._get_cursor()[collection].replace_one(identifierObj,
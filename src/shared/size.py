@@ -72,3 +72,17 @@ def human_size_mem_fixed(bytes, unit, bit=False, base=1024):
         bytes = bytes / base
 
     return np.round(bytes, 2)
+
+
+def human_size_fixed_array(values, unit, base=1000):
+    """Vectorized variant of `human_size_fixed` for numpy arrays"""
+    unitPos = CONVERSION_SIZES.index(unit.upper())
+    return np.round(values / math.pow(base, unitPos), 2)
+
+
+def human_size_mem_fixed_array(values, unit, bit=False, base=1024):
+    """Vectorized variant of `human_size_mem_fixed` for numpy arrays"""
+    if bit: values = values * 8
+    sizes = CONVERSION_SIZES_MEM_BIT if bit else CONVERSION_SIZES_MEM
+    unitPos = sizes.index(unit.upper())
+    return np.round(values / math.pow(base, unitPos), 2)
@@ -13,6 +13,7 @@ from shared.date import seconds_to_time, iso8601_to_datetime, get_current_dateti
 
 JOB_STATE_INTERVAL = 30  # should not be smaller than slurm REFRESH_TIMER otherwise WATCH_MIN_ITERATIONS mechanism must be adjusted
 WATCH_MIN_ITERATIONS = 3
+WARMUP_COLLECTION = "cache_warmup"  # queue of finished benchmarks (see backend.restapi.warmup)
 
 logger = logging.getLogger("xbatctld")
 db = MongoDB()
@@ -286,6 +287,17 @@ def process(runNr):
 
         logger.debug("Inserted data for benchmark #%d into database", runNr)
 
+        # results of finished jobs are cacheable, let the backend precompute the default views
+        try:
+            db.insertOne(WARMUP_COLLECTION, {
+                "runNr": runNr,
+                "jobIds": benchmark["jobIds"],
+                "created": get_current_datetime()
+            })
+        except Exception as e:
+            logger.warning("Enqueuing cache warm-up of benchmark #%d failed: %s",
+                           runNr, e)
+
     except Exception as e:
         logger.error("Processing of benchmark #%d failed\n%s\n%s", runNr, e,
                      traceback.print_exc())